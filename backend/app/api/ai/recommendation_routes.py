@@ -1,4 +1,5 @@
 from typing import Annotated, Literal
+import asyncio
 import json
 import httpx
 from fastapi import APIRouter, Depends, HTTPException
@@ -11,6 +12,8 @@ from app.models.auth_user import AuthUser
 from app.models.match import Match
 from app.models.tournament import Tournament
 from app.models.tournament_registration import TournamentRegistration
+from app.services.brackets import ELIMINATION_FORMATS
+from app.services.simulation import DEFAULT_ITERATIONS, iterations_within_budget, simulate_bracket
 
 router = APIRouter(prefix="/ai", tags=["ai"])
 CurrentUser = Annotated[AuthUser, Depends(require_user)]
@@ -20,12 +23,39 @@ class RecommendationRequest(BaseModel):
     focus: Literal["seeding", "scheduling", "matchups", "performance", "recap"] = "performance"
     instruction: str | None = Field(default=None, max_length=2000)
 
+class SimulationRequest(BaseModel):
+    tournament_id: int
+    iterations: int = Field(default=DEFAULT_ITERATIONS, ge=100, le=100_000)
+    seed: int = 0
+    ratings: dict[str, float] | None = None
+
+BASE_RATING = 1500.0
+RATING_PER_POINT = 25.0
+
+def _seeded(participants: list[dict]) -> list[dict]:
+    """The participants the bracket publishers seed: checked-in teams in registration order."""
+    return [p for p in participants if p["status"] == "checked_in"]
+
+async def _simulate(tournament: dict, participants: list[dict], iterations: int = DEFAULT_ITERATIONS, seed: int = 0, ratings: dict[str, float] | None = None) -> dict:
+    """Simulate the bracket of the checked-in teams off the event loop; ratings default to standings points.
+
+    Iterations are capped by the bracket's size so one request stays cheap; raises
+    ``ValueError`` for non-elimination formats and invalid team names.
+    """
+    ratings = ratings or {}
+    participants = _seeded(participants)
+    teams = [p["team"] for p in participants]
+    iterations = iterations_within_budget(tournament["format"], len(teams), iterations)
+    team_ratings = [ratings.get(p["team"], BASE_RATING + RATING_PER_POINT * p["points"]) for p in participants]
+    result = await asyncio.to_thread(simulate_bracket, tournament["format"], teams, team_ratings, iterations, seed)
+    return result.as_dict()
+
 async def _context(tournament_id: int) -> dict:
     async with async_session() as session:
         tournament = (await session.execute(select(Tournament).where(Tournament.id == tournament_id))).scalar_one_or_none()
         if not tournament:
             raise HTTPException(status_code=404, detail="Tournament not found")
-        registrations = (await session.execute(select(TournamentRegistration).where(TournamentRegistration.tournament_id == tournament_id))).scalars().all()
+        registrations = (await session.execute(select(TournamentRegistration).where(TournamentRegistration.tournament_id == tournament_id).order_by(TournamentRegistration.created_at.asc()))).scalars().all()
         matches = (await session.execute(select(Match).where(Match.tournament_id == tournament_id))).scalars().all()
     return {
         "tournament": {"id": tournament.id, "name": tournament.name, "game": tournament.game, "format": tournament.format, "status": tournament.status, "max_teams": tournament.max_teams},
@@ -33,11 +63,29 @@ async def _context(tournament_id: int) -> dict:
         "matches": [{"round": m.round_name, "team_a": m.team_a, "team_b": m.team_b, "score": [m.team_a_score, m.team_b_score], "winner": m.winner, "status": m.status} for m in matches],
     }
 
+@router.post("/simulations")
+async def simulations(payload: SimulationRequest, _: CurrentUser):
+    context = await _context(payload.tournament_id)
+    if len(_seeded(context["participants"])) < 2:
+        raise HTTPException(status_code=400, detail="At least two checked-in participants are required to simulate")
+    try:
+        simulation = await _simulate(context["tournament"], context["participants"], payload.iterations, payload.seed, payload.ratings)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return {"success": True, "tournament_id": payload.tournament_id, "generated": False, **simulation}
+
 @router.post("/recommendations")
 async def recommendations(payload: RecommendationRequest, _: CurrentUser):
     context = await _context(payload.tournament_id)
+    # Probabilities only exist for elimination brackets; other formats are recommended from standings alone.
+    if payload.focus == "seeding" and len(_seeded(context["participants"])) >= 2 and context["tournament"]["format"].strip().lower() in ELIMINATION_FORMATS:
+        try:
+            simulation = await _simulate(context["tournament"], context["participants"])
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        context["simulation"] = {"iterations": simulation["iterations"], "championship_probability": {row["team"]: round(row["champion"], 4) for row in simulation["teams"]}}
     instructions = {
-        "seeding": "Recommend a fair seed order using only supplied points/status and explain the deterministic tie-break. Never invent player statistics.",
+        "seeding": "Recommend a fair seed order using only supplied points/status and the supplied simulation probabilities (computed locally for the checked-in teams in the current seed order), and explain the deterministic tie-break. Never invent player statistics.",
         "scheduling": "Recommend a practical match schedule/order using only supplied matches, round/status data, and tournament state. Do not invent unavailable time slots.",
         "matchups": "Identify useful matchup observations from completed and scheduled matches without claiming unsupported competitive strength.",
         "performance": "Summarize verified performance trends from supplied points and match results. Clearly label conclusions as AI-generated insights.",
@@ -0,0 +1,81 @@
+from datetime import datetime
+from functools import partial
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import BaseModel
+
+from app.api.payments.payment_routes import PaymentOut
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.encoding import encoded_response
+from app.core.security import require_user
+from app.models.auth_user import AuthUser
+from app.services.dashboard import active_tournament_ids, load_dashboard
+
+router = APIRouter(prefix="/me", tags=["me"])
+CurrentUser = Annotated[AuthUser, Depends(require_user)]
+
+
+class DashboardRegistrationOut(BaseModel):
+    registration_id: int
+    tournament_id: int
+    tournament_name: str
+    game: str
+    tournament_status: str
+    start_date: Optional[datetime] = None
+    status: str
+    team_name: str
+    points: int
+
+
+class UpcomingMatchOut(BaseModel):
+    id: int
+    tournament_id: int
+    tournament_name: str
+    round_name: str
+    team_a: str
+    team_b: str
+    my_team: str
+    scheduled_at: Optional[datetime] = None
+
+
+class DashboardOut(BaseModel):
+    registrations: list[DashboardRegistrationOut]
+    upcoming_matches: list[UpcomingMatchOut]
+    unread_notifications: int
+    pending_payments: list[PaymentOut]
+
+
+async def _load_dashboard(session, user_id: int, match_limit: int) -> DashboardOut:
+    dashboard = await load_dashboard(session, user_id, match_limit)
+    return DashboardOut(
+        registrations=[DashboardRegistrationOut.model_validate(row, from_attributes=True) for row in dashboard.registrations],
+        upcoming_matches=[UpcomingMatchOut.model_validate(row, from_attributes=True) for row in dashboard.upcoming_matches],
+        unread_notifications=dashboard.unread_notifications,
+        pending_payments=[PaymentOut.model_validate(payment) for payment in dashboard.pending_payments],
+    )
+
+
+@router.get("/dashboard", response_model=DashboardOut)
+async def get_dashboard(
+    response: Response,
+    current_user: CurrentUser,
+    match_limit: Annotated[int, Query(ge=1, le=50)] = 5,
+):
+    """The profile page in one request: active registrations, next matches, unread count and pending payments.
+
+    Served from a short per-user cache that the user's own registrations,
+    payments and notification changes invalidate, as does any write to one of
+    their active tournaments.
+    """
+    async with async_session() as session:
+        body = await response_cache.get_or_load_for_user(
+            f"dashboard:{match_limit}",
+            current_user.id,
+            settings.DASHBOARD_CACHE_TTL_SECONDS,
+            partial(active_tournament_ids, session, current_user.id),
+            partial(_load_dashboard, session, current_user.id, match_limit),
+        )
+    return encoded_response(body, response)
@@ -2,10 +2,12 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import CompoundSelect, select, union_all
 
+from app.core.cache import invalidate_user
 from app.core.database import async_session
 from app.core.security import require_admin, require_user
+from app.models.archive import notifications_archive
 from app.models.auth_user import AuthUser
 from app.models.notification import Notification
 from app.models.tournament_registration import TournamentRegistration
@@ -29,16 +31,23 @@ class BroadcastIn(BaseModel):
     content: str = Field(min_length=2)
 
 
+def notifications_of(user_id: int) -> CompoundSelect:
+    """The user's notifications, newest first, including archived read ones."""
+    query = union_all(
+        *(
+            select(table.c.id, table.c.title, table.c.content, table.c.read, table.c.created_at).where(
+                table.c.user_id == user_id
+            )
+            for table in (Notification.__table__, notifications_archive)
+        )
+    )
+    return query.order_by(query.selected_columns.created_at.desc())
+
+
 @router.get("", response_model=list[NotificationOut])
 async def list_notifications(current_user: CurrentUser):
     async with async_session() as session:
-        rows = (
-            await session.execute(
-                select(Notification)
-                .where(Notification.user_id == current_user.id)
-                .order_by(Notification.created_at.desc())
-            )
-        ).scalars().all()
+        rows = (await session.execute(notifications_of(current_user.id))).all()
     return [
         NotificationOut(
             id=row.id,
@@ -63,9 +72,21 @@ async def mark_read(notification_id: int, current_user: CurrentUser):
             )
         ).scalar_one_or_none()
         if not row:
-            raise HTTPException(status_code=404, detail="Notification not found")
+            archived = (
+                await session.execute(
+                    select(notifications_archive.c.id).where(
+                        notifications_archive.c.id == notification_id,
+                        notifications_archive.c.user_id == current_user.id,
+                    )
+                )
+            ).first()
+            if archived is None:
+                raise HTTPException(status_code=404, detail="Notification not found")
+            # Only read notifications are archived, so there is nothing to update.
+            return {"success": True}
         row.read = 1
         await session.commit()
+    await invalidate_user(current_user.id)
     return {"success": True}
 
 
@@ -86,4 +107,6 @@ async def broadcast_notification(payload: BroadcastIn, _: AdminUser):
             for user_id in user_ids
         ])
         await session.commit()
+    for user_id in user_ids:
+        await invalidate_user(user_id)
     return {"success": True, "recipient_count": len(user_ids)}
@@ -10,6 +10,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
+from app.core.cache import invalidate_user
 from app.core.config import settings
 from app.core.database import async_session
 from app.core.security import require_admin, require_user
@@ -91,6 +92,7 @@ async def create_payment_order(tournament_id: int, current_user: CurrentUser):
         session.add(payment)
         await session.commit()
         await session.refresh(payment)
+    await invalidate_user(current_user.id)
     return {"id": payment.id, "order_id": payment.order_id, "amount": payment.amount, "currency": payment.currency, "status": payment.status}
 
 
@@ -115,6 +117,7 @@ async def verify_payment(payload: VerifyPaymentIn, current_user: CurrentUser):
         payment.status = "paid"
         await session.commit()
         await session.refresh(payment)
+    await invalidate_user(current_user.id)
     return payment
 
 
@@ -158,10 +161,14 @@ async def payment_webhook(request: Request):
             await session.commit()
             return {"success": True, "ignored": True}
         status_value = "paid" if event in {"order.paid", "payment.captured"} else "failed" if event == "payment.failed" else None
+        updated_user_id = None
         if status_value:
             payment = (await session.execute(select(Payment).where(Payment.order_id == order_id))).scalar_one_or_none()
             if payment and payment.status != "paid":
                 payment.status = status_value
                 payment.payment_id = payment_entity.get("id") or payment.payment_id
+                updated_user_id = payment.user_id
         await session.commit()
+    if updated_user_id is not None:
+        await invalidate_user(updated_user_id)
     return {"success": True}
@@ -15,6 +15,7 @@ from .ai.ocr_routes import router as ai_router
 from .ai.recommendation_routes import router as recommendation_router
 from .auth.auth_routes import router as auth_router
 from .integrations.integration_routes import router as integrations_router
+from .me.dashboard_routes import router as me_router
 from .notifications.notification_routes import router as notifications_router
 from .payments.payment_routes import router as payments_router
 from .payments.payment_public_routes import router as payment_public_router
@@ -22,6 +23,7 @@ from .profile.profile_routes import router as profile_router
 from .teams.team_routes import router as teams_router
 from .tournaments.bracket_progression_routes import router as bracket_progression_router
 from .tournaments.format_progression_routes import router as format_progression_router
+from .tournaments.lobby_routes import router as lobby_router
 from .tournaments.registration_ops_routes import router as registration_ops_router
 from .tournaments.tournament_ops_routes import router as tournament_ops_router
 from .tournaments.tournament_routes import router as tournaments_router
@@ -32,6 +34,7 @@ router.include_router(ai_router)
 router.include_router(recommendation_router)
 router.include_router(copilot_router)
 router.include_router(integrations_router)
+router.include_router(me_router)
 router.include_router(notifications_router)
 router.include_router(payments_router)
 router.include_router(payment_public_router)
@@ -39,6 +42,7 @@ router.include_router(profile_router)
 router.include_router(teams_router)
 router.include_router(bracket_progression_router)
 router.include_router(format_progression_router)
+router.include_router(lobby_router)
 router.include_router(registration_ops_router)
 router.include_router(tournament_ops_router)
 router.include_router(tournaments_router)
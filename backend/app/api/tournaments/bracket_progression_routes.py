@@ -3,13 +3,15 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 
+from app.core.cache import invalidate_tournament
 from app.core.database import async_session
 from app.core.security import require_admin
 from app.models.auth_user import AuthUser
 from app.models.match import Match
 from app.models.tournament import Tournament
 from app.models.tournament_registration import TournamentRegistration
-from app.services.brackets import generate_single_elimination
+from app.services.bracket_publisher import BracketConflict, advance_match, publish_bracket, registration_index
+from app.services.counters import record_tournament_change
 
 router = APIRouter(prefix="/tournaments", tags=["bracket progression"])
 AdminUser = Annotated[AuthUser, Depends(require_admin)]
@@ -31,44 +33,9 @@ async def publish_single_elimination_bracket(tournament_id: int, _: AdminUser):
         if len(registrations) < 2:
             raise HTTPException(status_code=400, detail="At least two checked-in participants are required")
 
-        slots = generate_single_elimination([registration.team_name for registration in registrations])
-        matches: list[Match] = []
-        for slot in slots:
-            team_a = slot.team_a or "TBD"
-            team_b = slot.team_b or "TBD"
-            status = "scheduled"
-            winner = None
-            if (slot.team_a is None) ^ (slot.team_b is None):
-                status = "finished"
-                winner = slot.team_a or slot.team_b
-                if slot.team_a is None:
-                    team_a = "BYE"
-                else:
-                    team_b = "BYE"
-            match = Match(tournament_id=tournament_id, round_name=slot.round_name, team_a=team_a, team_b=team_b, winner=winner, status=status, bracket_match_number=slot.match_number)
-            session.add(match)
-            matches.append(match)
-        await session.flush()
-
-        round_groups: dict[str, list[Match]] = {}
-        for match in matches:
-            round_groups.setdefault(match.round_name, []).append(match)
-        ordered_rounds = list(round_groups.values())
-        for round_index in range(len(ordered_rounds) - 1):
-            current_round = ordered_rounds[round_index]
-            next_round = ordered_rounds[round_index + 1]
-            for index, match in enumerate(current_round):
-                match.next_match_id = next_round[index // 2].id
-
-        for match in matches:
-            if match.status == "finished" and match.next_match_id:
-                next_match = next(item for item in matches if item.id == match.next_match_id)
-                if next_match.team_a == "TBD":
-                    next_match.team_a = match.winner or "TBD"
-                elif next_match.team_b == "TBD":
-                    next_match.team_b = match.winner or "TBD"
-
+        matches = await publish_bracket(session, tournament_id, tournament.format, [registration.team_name for registration in registrations], registration_index(registrations))
         await session.commit()
+    await invalidate_tournament(tournament_id)
     return [{"match_id": match.id, "match_number": match.bracket_match_number, "next_match_id": match.next_match_id} for match in matches]
 
 
@@ -80,16 +47,14 @@ async def advance_match_winner(tournament_id: int, match_id: int, _: AdminUser):
             raise HTTPException(status_code=404, detail="Match not found")
         if match.status != "finished" or not match.winner:
             raise HTTPException(status_code=400, detail="Finish the match before advancing its winner")
-        if not match.next_match_id:
+        if not match.next_match_id and not match.loser_next_match_id:
             return {"success": True, "completed": True, "message": "Winner is the tournament champion"}
-        next_match = (await session.execute(select(Match).where(Match.id == match.next_match_id, Match.tournament_id == tournament_id))).scalar_one()
-        if next_match.team_a == match.winner or next_match.team_b == match.winner:
-            return {"success": True, "next_match_id": next_match.id, "already_advanced": True}
-        if next_match.team_a == "TBD":
-            next_match.team_a = match.winner
-        elif next_match.team_b == "TBD":
-            next_match.team_b = match.winner
-        else:
-            raise HTTPException(status_code=409, detail="Next match already has two participants")
+        if not await record_tournament_change(session, tournament_id):
+            raise HTTPException(status_code=404, detail="Tournament not found")
+        try:
+            routed = await advance_match(session, match)
+        except BracketConflict as exc:
+            raise HTTPException(status_code=409, detail=str(exc)) from exc
         await session.commit()
-    return {"success": True, "next_match_id": next_match.id, "team": match.winner}
+    await invalidate_tournament(tournament_id)
+    return {"success": True, "team": match.winner, **routed}
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+from itertools import groupby
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import func, select
 
+from app.core.cache import invalidate_tournament
 from app.core.database import async_session
 from app.core.security import require_admin
 from app.models.auth_user import AuthUser
 from app.models.match import Match
 from app.models.tournament import Tournament
 from app.models.tournament_registration import TournamentRegistration
-from app.services.brackets import generate_bracket
+from app.services.bracket_publisher import BYE, publish_bracket, publish_byes, publish_schedule, registration_index
+from app.services.brackets import build_round_robin_schedule
+from app.services.counters import record_tournament_change
+from app.services.stages import GROUP_STAGE, PLAYOFF_STAGE, build_group_stage, default_groups, playoff_seeding, resting_teams, stage_plan
+from app.services.standings import head_to_head_order
+from app.services.swiss import pair_swiss_round
 
 router = APIRouter(prefix="/tournaments", tags=["format progression"])
 AdminUser = Annotated[AuthUser, Depends(require_admin)]
@@ -21,21 +28,13 @@ class SwissRoundIn(BaseModel):
     round_number: int = Field(ge=2, le=100)
 
 
-def _pair_swiss(standings: list[tuple[str, int]], previous_pairs: set[frozenset[str]]):
-    ordered = sorted(standings, key=lambda item: (-item[1], item[0].casefold()))
-    pairs: list[tuple[str, str]] = []
-    used: set[str] = set()
-    for index, (team, _) in enumerate(ordered):
-        if team in used:
-            continue
-        opponent = None
-        for candidate, _ in ordered[index + 1 :]:
-            if candidate not in used and frozenset((team, candidate)) not in previous_pairs:
-                opponent = candidate
-                break
-        if opponent:
-            pairs.append((team, opponent)); used.update({team, opponent})
-    return pairs
+class StagePublishIn(BaseModel):
+    groups: int | None = Field(default=None, ge=1, le=26)
+
+
+class StageCloseIn(BaseModel):
+    qualifiers: int | None = Field(default=None, ge=2, le=256)
+
 
 @router.post("/{tournament_id}/formats/publish", response_model=list[dict])
 async def publish_supported_format(tournament_id: int, _: AdminUser):
@@ -46,26 +45,26 @@ async def publish_supported_format(tournament_id: int, _: AdminUser):
         registrations = (await session.execute(select(TournamentRegistration).where(TournamentRegistration.tournament_id == tournament_id, TournamentRegistration.status == "checked_in").order_by(TournamentRegistration.created_at.asc()))).scalars().all()
         if len(registrations) < 2:
             raise HTTPException(status_code=400, detail="At least two checked-in participants are required")
-        if tournament.format.strip().lower() not in {"double elimination", "swiss"}:
+        format_key = tournament.format.strip().lower()
+        if format_key not in {"double elimination", "swiss", "round robin", "double round robin"}:
             raise HTTPException(status_code=400, detail="Use the existing single-elimination publisher for Single Elimination")
         existing = (await session.execute(select(Match).where(Match.tournament_id == tournament_id))).scalars().all()
         if existing:
             return [{"match_id": m.id, "round_name": m.round_name, "bracket": "main" if not m.round_name.startswith("Losers") else "losers"} for m in existing]
-        slots = generate_bracket(tournament.format, [r.team_name for r in registrations])
-        created = []
-        for slot in slots:
-            team_a = slot.team_a or "TBD"
-            team_b = slot.team_b or "TBD"
-            status = "scheduled"
-            winner = None
-            if (slot.team_a is None) ^ (slot.team_b is None):
-                status = "finished"; winner = slot.team_a or slot.team_b
-                if slot.team_a is None: team_a = "BYE"
-                else: team_b = "BYE"
-            match = Match(tournament_id=tournament_id, round_name=slot.round_name, team_a=team_a, team_b=team_b, status=status, winner=winner, bracket_match_number=slot.match_number)
-            session.add(match); created.append(match)
-        await session.flush()
+        teams = [r.team_name for r in registrations]
+        registration_ids = registration_index(registrations)
+        if format_key.endswith("round robin"):
+            schedule = build_round_robin_schedule(teams, double_round=format_key == "double round robin")
+            await publish_schedule(session, tournament_id, schedule, registration_ids=registration_ids)
+            await publish_byes(session, tournament_id, resting_teams(schedule), registration_ids, first_number=len(schedule) + 1)
+            created = (await session.execute(select(Match).where(Match.tournament_id == tournament_id).order_by(Match.bracket_match_number.asc()))).scalars().all()
+        else:
+            created = await publish_bracket(session, tournament_id, tournament.format, teams, registration_ids)
+            if format_key == "swiss" and len(teams) % 2:
+                # The first round pairs seeds in order, so the last seed sits it out.
+                created += await publish_byes(session, tournament_id, [("Swiss Round 1", teams[-1].strip())], registration_ids, first_number=len(created) + 1)
         await session.commit()
+    await invalidate_tournament(tournament_id)
     return [{"match_id": m.id, "round_name": m.round_name, "bracket": "losers" if m.round_name.startswith("Losers") else ("grand_final" if m.round_name == "Grand Final" else "main")} for m in created]
 
 @router.post("/{tournament_id}/swiss/round")
@@ -78,12 +77,118 @@ async def create_swiss_round(tournament_id: int, payload: SwissRoundIn, _: Admin
         matches = (await session.execute(select(Match).where(Match.tournament_id == tournament_id))).scalars().all()
         if any(m.round_name == f"Swiss Round {payload.round_number}" for m in matches):
             raise HTTPException(status_code=409, detail="Swiss round already exists")
-        previous_pairs = {frozenset((m.team_a, m.team_b)) for m in matches if m.team_a != "BYE" and m.team_b != "BYE"}
-        pairs = _pair_swiss([(r.team_name, r.points) for r in registrations], previous_pairs)
-        if not pairs:
+        # History is read through registration ids, so renamed teams keep their past pairings.
+        name_of = {r.id: r.team_name for r in registrations}
+        previous_pairs = {frozenset((name_of.get(m.team_a_registration_id), name_of.get(m.team_b_registration_id))) for m in matches if BYE not in (m.team_a, m.team_b)}
+        previous_byes = {name_of.get(m.team_a_registration_id if m.team_b == BYE else m.team_b_registration_id) for m in matches if BYE in (m.team_a, m.team_b)}
+        try:
+            pairing = pair_swiss_round([(r.team_name, r.points) for r in registrations], previous_pairs, previous_byes)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        if not pairing.pairs:
             raise HTTPException(status_code=400, detail="No valid new Swiss pairings are available")
+        round_name = f"Swiss Round {payload.round_number}"
         start_number = len(matches) + 1
-        for offset, (team_a, team_b) in enumerate(pairs):
-            session.add(Match(tournament_id=tournament_id, round_name=f"Swiss Round {payload.round_number}", team_a=team_a, team_b=team_b, status="scheduled", bracket_match_number=start_number + offset))
+        id_of = {r.team_name: r.id for r in registrations}
+        if not await record_tournament_change(session, tournament_id, matches=len(pairing.pairs)):
+            raise HTTPException(status_code=404, detail="Tournament not found")
+        for offset, (team_a, team_b) in enumerate(pairing.pairs):
+            session.add(Match(tournament_id=tournament_id, round_name=round_name, team_a=team_a, team_b=team_b, team_a_registration_id=id_of[team_a], team_b_registration_id=id_of[team_b], status="scheduled", bracket_match_number=start_number + offset))
+        if pairing.bye:
+            await publish_byes(session, tournament_id, [(round_name, pairing.bye)], id_of, first_number=start_number + len(pairing.pairs))
+        await session.commit()
+    await invalidate_tournament(tournament_id)
+    return {"success": True, "round": payload.round_number, "matches_created": len(pairing.pairs), "pairings": [{"team_a": a, "team_b": b} for a, b in pairing.pairs], "bye": pairing.bye, "float_downs": pairing.float_downs, "rematches": pairing.rematches}
+
+
+async def _multi_stage_tournament(session, tournament_id: int):
+    tournament = (await session.execute(select(Tournament).where(Tournament.id == tournament_id))).scalar_one_or_none()
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    plan = stage_plan(tournament.format)
+    if plan is None:
+        raise HTTPException(status_code=400, detail="Tournament is not configured as a multi-stage format")
+    return tournament, plan
+
+
+@router.post("/{tournament_id}/stages/publish")
+async def publish_group_stage(tournament_id: int, payload: StagePublishIn, _: AdminUser):
+    async with async_session() as session:
+        tournament, plan = await _multi_stage_tournament(session, tournament_id)
+        if (await session.execute(select(Match.id).where(Match.tournament_id == tournament_id).limit(1))).first():
+            raise HTTPException(status_code=409, detail="Stage matches are already published")
+        registrations = (await session.execute(select(TournamentRegistration).where(TournamentRegistration.tournament_id == tournament_id, TournamentRegistration.status == "checked_in").order_by(TournamentRegistration.created_at.asc()))).scalars().all()
+        if len(registrations) < 2:
+            raise HTTPException(status_code=400, detail="At least two checked-in participants are required")
+        groups = payload.groups or default_groups(plan, len(registrations))
+        try:
+            stage = build_group_stage([r.team_name for r in registrations], groups)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        by_team = {r.team_name.strip(): r for r in registrations}
+        registration_ids = registration_index(registrations)
+        byes = []
+        for label, members, schedule in stage:
+            await publish_schedule(session, tournament_id, schedule, stage=GROUP_STAGE, registration_ids=registration_ids)
+            for team in members:
+                by_team[team].group_name = label
+            byes += resting_teams(schedule)
+        await publish_byes(session, tournament_id, byes, registration_ids, stage=GROUP_STAGE, first_number=sum(len(schedule) for _, _, schedule in stage) + 1)
+        tournament.current_stage = GROUP_STAGE
+        await session.commit()
+    await invalidate_tournament(tournament_id)
+    return {"success": True, "stage": GROUP_STAGE, "groups": [{"group": label, "teams": members, "matches": len(schedule)} for label, members, schedule in stage]}
+
+
+@router.post("/{tournament_id}/stages/close")
+async def close_group_stage(tournament_id: int, payload: StageCloseIn, _: AdminUser):
+    """Finish the group stage and publish the playoff seeded from the stored standings."""
+    async with async_session() as session:
+        tournament, plan = await _multi_stage_tournament(session, tournament_id)
+        if tournament.current_stage != GROUP_STAGE:
+            raise HTTPException(status_code=409, detail="The group stage is already closed")
+        open_matches, stage_matches = (
+            await session.execute(
+                select(func.count(Match.id).filter(Match.status != "finished"), func.count(Match.id)).where(Match.tournament_id == tournament_id, Match.stage == GROUP_STAGE)
+            )
+        ).one()
+        if not stage_matches:
+            raise HTTPException(status_code=400, detail="Publish the group stage first")
+        if open_matches:
+            raise HTTPException(status_code=409, detail=f"{open_matches} group stage match(es) are not finished")
+        last_number = (await session.execute(select(func.max(Match.bracket_match_number)).where(Match.tournament_id == tournament_id))).scalar_one() or 0
+
+        standings = (
+            await session.execute(
+                select(TournamentRegistration)
+                .where(TournamentRegistration.tournament_id == tournament_id, TournamentRegistration.group_name.is_not(None))
+                .order_by(
+                    TournamentRegistration.group_name.asc(),
+                    TournamentRegistration.points.desc(),
+                    TournamentRegistration.buchholz.desc(),
+                    TournamentRegistration.sonneborn_berger.desc(),
+                    TournamentRegistration.created_at.asc(),
+                )
+            )
+        ).scalars().all()
+        ranked_groups = [
+            [row.team_name for row in await head_to_head_order(session, tournament_id, list(rows))]
+            for _, rows in groupby(standings, key=lambda row: row.group_name)
+        ]
+        try:
+            seeds = playoff_seeding(ranked_groups, payload.qualifiers or plan.qualifiers)
+            created = await publish_bracket(session, tournament_id, plan.playoff_format, seeds, registration_index(standings))
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        for match in created:
+            match.stage = PLAYOFF_STAGE
+            match.bracket_match_number += last_number
+        tournament.current_stage = PLAYOFF_STAGE
         await session.commit()
-    return {"success": True, "round": payload.round_number, "matches_created": len(pairs), "pairings": [{"team_a": a, "team_b": b} for a, b in pairs]}
+    await invalidate_tournament(tournament_id)
+    return {
+        "success": True,
+        "stage": PLAYOFF_STAGE,
+        "qualifiers": seeds,
+        "matches": [{"match_id": m.id, "round_name": m.round_name, "team_a": m.team_a, "team_b": m.team_b} for m in created],
+    }
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field
+from sqlalchemy import select, update
+
+from app.core.cache import invalidate_tournament
+from app.core.database import async_session
+from app.core.security import require_admin
+from app.models.auth_user import AuthUser
+from app.models.tournament import Tournament
+from app.models.tournament_registration import TournamentRegistration
+from app.services.archive import find_tournament
+from app.services.counters import record_tournament_change
+from app.services.lobbies import DEFAULT_LOBBY_SIZE, LOBBY_FORMAT, GameResult, assign_lobbies, ingest_results, is_lobby_tournament, lobby_standings
+
+router = APIRouter(prefix="/tournaments", tags=["lobbies"])
+AdminUser = Annotated[AuthUser, Depends(require_admin)]
+
+
+class LobbyAssignIn(BaseModel):
+    lobby_size: int = Field(default=DEFAULT_LOBBY_SIZE, ge=2, le=100)
+
+
+class LobbyResultIn(BaseModel):
+    lobby_number: int = Field(ge=1)
+    game_number: int = Field(ge=1)
+    team_name: str = Field(min_length=1, max_length=255)
+    placement: int = Field(ge=1)
+    kills: int = Field(default=0, ge=0)
+
+
+class LobbyResultsIn(BaseModel):
+    results: list[LobbyResultIn] = Field(min_length=1, max_length=10000)
+
+
+async def _lobby_tournament(session, tournament_id: int) -> Tournament:
+    tournament = (await session.execute(select(Tournament).where(Tournament.id == tournament_id))).scalar_one_or_none()
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    if not is_lobby_tournament(tournament.format):
+        raise HTTPException(status_code=400, detail=f"Tournament format is not {LOBBY_FORMAT}")
+    return tournament
+
+
+@router.post("/{tournament_id}/lobbies/assign")
+async def assign_tournament_lobbies(tournament_id: int, payload: LobbyAssignIn, _: AdminUser):
+    """Seed checked-in teams into lobbies by current points, so later rounds reseed from standings."""
+    async with async_session() as session:
+        await _lobby_tournament(session, tournament_id)
+        registrations = (
+            await session.execute(
+                select(TournamentRegistration.id, TournamentRegistration.team_name)
+                .where(TournamentRegistration.tournament_id == tournament_id, TournamentRegistration.status == "checked_in")
+                .order_by(TournamentRegistration.points.desc(), TournamentRegistration.created_at.asc())
+            )
+        ).all()
+        try:
+            lobbies = assign_lobbies([team for _, team in registrations], payload.lobby_size)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        registration_ids = {team: registration_id for registration_id, team in registrations}
+        if not await record_tournament_change(session, tournament_id):
+            raise HTTPException(status_code=404, detail="Tournament not found")
+        await session.execute(
+            update(TournamentRegistration),
+            [{"id": registration_ids[team], "lobby_number": number} for number, teams in enumerate(lobbies, start=1) for team in teams],
+        )
+        await session.commit()
+    await invalidate_tournament(tournament_id)
+    return {"success": True, "lobbies": [{"lobby_number": number, "teams": teams} for number, teams in enumerate(lobbies, start=1)]}
+
+
+@router.post("/{tournament_id}/lobbies/results")
+async def submit_lobby_results(tournament_id: int, payload: LobbyResultsIn, _: AdminUser):
+    async with async_session() as session:
+        await _lobby_tournament(session, tournament_id)
+        if not await record_tournament_change(session, tournament_id):
+            raise HTTPException(status_code=404, detail="Tournament not found")
+        try:
+            totals = await ingest_results(session, tournament_id, [GameResult(**result.model_dump()) for result in payload.results])
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        await session.commit()
+    await invalidate_tournament(tournament_id)
+    return {"success": True, "results": len(payload.results), "totals": totals}
+
+
+@router.get("/{tournament_id}/lobbies/standings")
+async def get_lobby_standings(tournament_id: int):
+    async with async_session() as session:
+        found = await find_tournament(session, tournament_id)
+        if found is None:
+            raise HTTPException(status_code=404, detail="Tournament not found")
+        tables, tournament = found
+        if not is_lobby_tournament(tournament.format):
+            raise HTTPException(status_code=400, detail=f"Tournament format is not {LOBBY_FORMAT}")
+        return await lobby_standings(session, tournament_id, tables)
@@ -1,14 +1,16 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import select
 
+from app.core.cache import invalidate_tournament, invalidate_user
 from app.core.database import async_session
 from app.core.security import require_user
 from app.models.auth_user import AuthUser
 from app.models.team import Team, TeamMember
 from app.models.tournament import Tournament
 from app.models.tournament_registration import TournamentRegistration
+from app.services.counters import record_tournament_change, reserve_slot
 
 router = APIRouter(prefix="/tournaments", tags=["team registration"])
 CurrentUser = Annotated[AuthUser, Depends(require_user)]
@@ -31,13 +33,14 @@ async def join_with_team(tournament_id: int, team_id: int, current_user: Current
         existing = (await session.execute(select(TournamentRegistration).where(TournamentRegistration.tournament_id == tournament_id, TournamentRegistration.team_name == team.name))).scalar_one_or_none()
         if existing:
             raise HTTPException(status_code=409, detail="This team is already registered")
-        count = await session.scalar(select(func.count(TournamentRegistration.id)).where(TournamentRegistration.tournament_id == tournament_id)) or 0
-        if count >= tournament.max_teams:
+        if not await reserve_slot(session, tournament_id):
             raise HTTPException(status_code=400, detail="Tournament slots are full")
         registration = TournamentRegistration(tournament_id=tournament_id, user_id=team.owner_user_id, team_name=team.name, status="registered", points=0)
         session.add(registration)
         await session.commit()
         await session.refresh(registration)
+    await invalidate_tournament(tournament_id)
+    await invalidate_user(registration.user_id)
     return {"success": True, "message": "Team registered successfully", "registration_id": registration.id}
 
 
@@ -56,6 +59,9 @@ async def check_in(tournament_id: int, current_user: CurrentUser):
             raise HTTPException(status_code=400, detail="This registration cannot be checked in")
         if tournament.status == "completed":
             raise HTTPException(status_code=400, detail="This tournament has already completed")
+        if not await record_tournament_change(session, tournament_id):
+            raise HTTPException(status_code=404, detail="Tournament not found")
         registration.status = "checked_in"
         await session.commit()
+    await invalidate_tournament(tournament_id)
     return {"success": True, "message": "Check-in successful. You are ready for the tournament.", "status": "checked_in"}
@@ -1,16 +1,22 @@
 from datetime import datetime, timedelta
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 from sqlalchemy import select
 
+from app.core.cache import invalidate_tournament
+from app.core.config import settings
 from app.core.database import async_session
+from app.core.etag import etag_matches, make_etag, not_modified
 from app.core.security import require_admin, require_user
 from app.models.auth_user import AuthUser
 from app.models.tournament import Tournament
 from app.models.tournament_registration import TournamentRegistration
-from app.services.brackets import MatchSlot, generate_bracket
+from app.services.archive import archive_completed_tournaments
+from app.services.brackets import MatchSlot, generate_bracket, topology_cache_stats
+from app.services.counters import record_tournament_change, repair_tournament_counters, stale_counter_tournaments
+from app.services.stages import iter_group_stage, stage_plan
 
 router = APIRouter(prefix="/tournaments", tags=["tournament operations"])
 PlayerUser = Annotated[AuthUser, Depends(require_user)]
@@ -46,14 +52,17 @@ async def _get_tournament(tournament_id: int) -> Tournament:
 
 @router.post("/{tournament_id}/check-in", response_model=CheckInOut)
 async def check_in(tournament_id: int, current_user: PlayerUser):
-    tournament = await _get_tournament(tournament_id)
     now = datetime.utcnow()
-    if tournament.end_date and now > tournament.end_date:
-        raise HTTPException(status_code=400, detail="Tournament has ended")
-    if tournament.start_date and now < tournament.start_date - timedelta(hours=24):
-        raise HTTPException(status_code=400, detail="Check-in opens 24 hours before the tournament")
-
     async with async_session() as session:
+        if not await record_tournament_change(session, tournament_id):
+            raise HTTPException(status_code=404, detail="Tournament not found")
+        start_date, end_date = (
+            await session.execute(select(Tournament.start_date, Tournament.end_date).where(Tournament.id == tournament_id))
+        ).one()
+        if end_date and now > end_date:
+            raise HTTPException(status_code=400, detail="Tournament has ended")
+        if start_date and now < start_date - timedelta(hours=24):
+            raise HTTPException(status_code=400, detail="Check-in opens 24 hours before the tournament")
         registration = (
             await session.execute(
                 select(TournamentRegistration).where(
@@ -67,6 +76,7 @@ async def check_in(tournament_id: int, current_user: PlayerUser):
         registration.status = "checked_in"
         await session.commit()
         await session.refresh(registration)
+    await invalidate_tournament(tournament_id)
 
     return CheckInOut(
         registration_id=registration.id,
@@ -77,9 +87,48 @@ async def check_in(tournament_id: int, current_user: PlayerUser):
     )
 
 
+@router.get("/bracket/cache-stats", response_model=dict)
+async def get_bracket_cache_stats(_: AdminUser):
+    return topology_cache_stats()
+
+
+@router.post("/counters/repair", response_model=dict)
+async def repair_counters(_: AdminUser):
+    """Recompute participant and match counters that disagree with the source tables.
+
+    The repair bumps each fixed tournament's version, so their cached reads are dropped too.
+    """
+    async with async_session() as session:
+        stale = await stale_counter_tournaments(session)
+        updated = await repair_tournament_counters(session, stale) if stale else 0
+        await session.commit()
+    for tournament_id in stale:
+        await invalidate_tournament(tournament_id)
+    return {"success": True, "tournaments_updated": updated}
+
+
+@router.post("/archive", response_model=dict)
+async def archive_tournaments(
+    _: AdminUser,
+    older_than_days: Annotated[int | None, Query(ge=0)] = None,
+    batch_size: Annotated[int | None, Query(ge=1, le=1000)] = None,
+):
+    """Move completed tournaments and old read notifications into the archive tables."""
+    report = await archive_completed_tournaments(
+        async_session,
+        timedelta(days=settings.ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days),
+        batch_size or settings.ARCHIVE_BATCH_SIZE,
+    )
+    return {"success": True, **report}
+
+
 @router.get("/{tournament_id}/bracket", response_model=list[BracketSlotOut])
-async def get_bracket(tournament_id: int, _: AdminUser):
+async def get_bracket(tournament_id: int, request: Request, response: Response, _: AdminUser):
     tournament = await _get_tournament(tournament_id)
+    etag = make_etag(tournament_id, tournament.version, "bracket")
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     async with async_session() as session:
         registrations = (
             await session.execute(
@@ -96,10 +145,11 @@ async def get_bracket(tournament_id: int, _: AdminUser):
         raise HTTPException(status_code=400, detail="At least two checked-in participants are required")
 
     try:
-        slots: list[MatchSlot] = generate_bracket(
-            tournament.format,
-            [registration.team_name for registration in registrations],
-        )
+        teams = [registration.team_name for registration in registrations]
+        if stage_plan(tournament.format):
+            slots: list[MatchSlot] = list(iter_group_stage(tournament.format, teams))
+        else:
+            slots = generate_bracket(tournament.format, teams)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
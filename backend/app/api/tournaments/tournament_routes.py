@@ -1,11 +1,17 @@
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Annotated, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import func, inspect, select, text
+from sqlalchemy import and_, func, inspect, or_, select, text, union_all
 
+from app.core.cache import invalidate_tournament, invalidate_user, response_cache
 from app.core.database import async_session, engine
+from app.core.encoding import encoded_response
+from app.core.etag import etag_matches, make_etag, not_modified
+from app.core.fieldsets import FieldsParam, fieldset_tag, includes, parse_fields, project, sparse
+from app.core.pagination import CURSOR_HEADER, decode_cursor, encode_cursor
 from app.core.security import (
     get_current_user,
     get_optional_current_user,
@@ -13,10 +19,17 @@ from app.core.security import (
     require_user,
 )
 from app.models.announcement import Announcement
+from app.models.archive import ARCHIVED_TABLES, HOT_TABLES, TournamentTables
 from app.models.auth_user import AuthUser
 from app.models.match import Match
 from app.models.tournament import Tournament
 from app.models.tournament_registration import TournamentRegistration
+from app.services.archive import find_tournament
+from app.services.bracket_publisher import registration_index
+from app.services.counters import record_tournament_change, reserve_slot, tournament_version
+from app.services.results import ResultEntry, UnknownMatches, apply_results
+from app.services.search import search_tournaments
+from app.services.standings import ranked_standings
 
 router = APIRouter(prefix="/tournaments", tags=["tournaments"])
 
@@ -25,6 +38,9 @@ OptionalUser = Annotated[AuthUser | None, Depends(get_optional_current_user)]
 AdminUser = Annotated[AuthUser, Depends(require_admin)]
 PlayerUser = Annotated[AuthUser, Depends(require_user)]
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
 
 class TournamentOut(BaseModel):
     id: int
@@ -94,16 +110,27 @@ class MatchResultIn(BaseModel):
     winner: Optional[str] = Field(default=None, min_length=2, max_length=255)
 
 
+class MatchResultEntryIn(MatchResultIn):
+    match_id: int
+
+
+class MatchResultsIn(BaseModel):
+    results: list[MatchResultEntryIn] = Field(min_length=1, max_length=1000)
+
+
 class MatchOut(BaseModel):
     id: int
     tournament_id: int
     round_name: str
     team_a: str
     team_b: str
+    team_a_registration_id: Optional[int] = None
+    team_b_registration_id: Optional[int] = None
     scheduled_at: Optional[datetime] = None
     team_a_score: Optional[int] = None
     team_b_score: Optional[int] = None
     winner: Optional[str] = None
+    winner_registration_id: Optional[int] = None
     status: str
     created_at: datetime
 
@@ -115,6 +142,8 @@ class StandingRow(BaseModel):
     user_id: int
     team_name: str
     points: int
+    buchholz: int = 0
+    sonneborn_berger: int = 0
     status: str
 
 
@@ -133,6 +162,13 @@ class AnnouncementOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TournamentOverviewOut(BaseModel):
+    tournament: TournamentOut
+    standings: list[StandingRow]
+    matches: list[MatchOut]
+    announcements: list[AnnouncementOut]
+
+
 class MyRegistrationOut(BaseModel):
     registration_id: int
     tournament_id: int
@@ -169,20 +205,52 @@ def _to_tournament_out(
     )
 
 
-async def _get_tournament_or_404(tournament_id: int) -> Tournament:
-    async with async_session() as session:
-        tournament = (
-            await session.execute(
-                select(Tournament).where(Tournament.id == tournament_id)
-            )
-        ).scalar_one_or_none()
+def _tournament_items(rows, fields: tuple[str, ...] | None, registered_ids: set[int]) -> list:
+    """Output models for full rows; objects holding only ``fields`` for projected ones."""
+    if fields is None:
+        return [
+            _to_tournament_out(row, row.participants_count, row.matches_count, row.id in registered_ids)
+            for row in rows
+        ]
+    return [
+        {name: row.id in registered_ids if name == "is_registered" else getattr(row, name) for name in fields}
+        for row in rows
+    ]
+
+
+def _fields_or_400(raw: Optional[str], model: type[BaseModel]) -> tuple[str, ...] | None:
+    try:
+        return parse_fields(raw, model)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+async def _find_tournament_or_404(session, tournament_id: int, columns: Optional[list[str]] = None):
+    """The tournament's tables and row, hot or archived, for read endpoints."""
+    found = await find_tournament(session, tournament_id, columns)
+    if found is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tournament not found",
+        )
+    return found
+
+
+async def _tournament_version_or_404(tournament_id: int) -> int:
+    """The tournament's version from one primary-key lookup.
 
-    if not tournament:
+    Cached reads pass it to ``response_cache.get_or_load`` as well as into
+    their ETag, so the body served under an ETag is never older than the
+    version the tag names.
+    """
+    async with async_session() as session:
+        version = await tournament_version(session, tournament_id)
+    if version is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tournament not found",
         )
-    return tournament
+    return version
 
 
 async def ensure_tournament_schema() -> None:
@@ -324,68 +392,132 @@ async def seed_sample_tournaments() -> None:
                 ),
             ]
         )
+        await record_tournament_change(session, items[2].id, matches=2)
         await session.commit()
 
 
+def _after_cursor(cursor: dict):
+    """Rows strictly after ``cursor`` in (start_date nulls last, start_date asc, created_at desc, id desc) order."""
+    later_created = or_(
+        Tournament.created_at < cursor["created_at"],
+        and_(Tournament.created_at == cursor["created_at"], Tournament.id < cursor["id"]),
+    )
+    if cursor["start_date"] is None:
+        return and_(Tournament.start_date.is_(None), later_created)
+    return or_(
+        Tournament.start_date.is_(None),
+        Tournament.start_date > cursor["start_date"],
+        and_(Tournament.start_date == cursor["start_date"], later_created),
+    )
+
+
 @router.get("/", response_model=list[TournamentOut])
-async def list_tournaments(current_user: OptionalUser):
+async def list_tournaments(
+    response: Response,
+    current_user: OptionalUser,
+    status_filter: Annotated[Optional[str], Query(alias="status", max_length=50)] = None,
+    game: Annotated[Optional[str], Query(max_length=100)] = None,
+    starts_after: Optional[datetime] = None,
+    starts_before: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    fields: FieldsParam = None,
+):
+    selected = _fields_or_400(fields, TournamentOut)
     user_id = current_user.id if current_user else None
+    # Only the requested columns, plus the keyset the cursor needs.
+    query = select(*project(Tournament.__table__.c, selected, "id", "start_date", "created_at"))
+    if status_filter:
+        query = query.where(Tournament.status == status_filter)
+    if game:
+        query = query.where(Tournament.game == game)
+    if starts_after:
+        query = query.where(Tournament.start_date >= starts_after)
+    if starts_before:
+        query = query.where(Tournament.start_date <= starts_before)
+    if cursor:
+        try:
+            query = query.where(_after_cursor(decode_cursor(cursor, ("start_date", "created_at"))))
+        except (KeyError, ValueError) as exc:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from exc
 
     async with async_session() as session:
         tournaments = (
             await session.execute(
-                select(Tournament).order_by(
+                query.order_by(
                     Tournament.start_date.is_(None),
                     Tournament.start_date.asc(),
                     Tournament.created_at.desc(),
-                )
+                    Tournament.id.desc(),
+                ).limit(limit + 1)
             )
-        ).scalars().all()
+        ).all()
+        if len(tournaments) > limit:
+            tournaments = tournaments[:limit]
+            last = tournaments[-1]
+            response.headers[CURSOR_HEADER] = encode_cursor({"start_date": last.start_date, "created_at": last.created_at, "id": last.id})
 
-        registration_rows = (
-            await session.execute(
-                select(
-                    TournamentRegistration.tournament_id,
-                    func.count(TournamentRegistration.id),
-                ).group_by(TournamentRegistration.tournament_id)
+        registered_tournament_ids: set[int] = set()
+        if tournaments and user_id is not None and includes(selected, "is_registered"):
+            registered_tournament_ids = set(
+                (
+                    await session.execute(
+                        select(TournamentRegistration.tournament_id).where(
+                            TournamentRegistration.user_id == user_id,
+                            TournamentRegistration.tournament_id.in_([item.id for item in tournaments]),
+                        )
+                    )
+                ).scalars().all()
             )
-        ).all()
-        match_rows = (
-            await session.execute(
-                select(Match.tournament_id, func.count(Match.id)).group_by(
-                    Match.tournament_id
-                )
+
+    return encoded_response(_tournament_items(tournaments, selected, registered_tournament_ids), response)
+
+
+@router.get("/search", response_model=list[TournamentOut])
+async def search(
+    response: Response,
+    current_user: OptionalUser,
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    fields: FieldsParam = None,
+):
+    """Ranked full-text search; pages follow ``X-Next-Cursor`` like the listing."""
+    selected = _fields_or_400(fields, TournamentOut)
+    offset = 0
+    if cursor:
+        try:
+            offset = int(decode_cursor(cursor)["offset"])
+        except (KeyError, TypeError, ValueError) as exc:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+        if offset < 0:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    async with async_session() as session:
+        try:
+            tournaments = await search_tournaments(
+                session, q, limit + 1, offset, project(Tournament.__table__.c, selected, "id")
             )
-        ).all()
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        if len(tournaments) > limit:
+            tournaments = tournaments[:limit]
+            response.headers[CURSOR_HEADER] = encode_cursor({"offset": offset + limit})
 
         registered_tournament_ids: set[int] = set()
-        if user_id is not None:
+        if tournaments and current_user is not None and includes(selected, "is_registered"):
             registered_tournament_ids = set(
                 (
                     await session.execute(
                         select(TournamentRegistration.tournament_id).where(
-                            TournamentRegistration.user_id == user_id
+                            TournamentRegistration.user_id == current_user.id,
+                            TournamentRegistration.tournament_id.in_([item.id for item in tournaments]),
                         )
                     )
                 ).scalars().all()
             )
 
-    participants_by_tournament = {
-        tournament_id: count for tournament_id, count in registration_rows
-    }
-    matches_by_tournament = {
-        tournament_id: count for tournament_id, count in match_rows
-    }
-
-    return [
-        _to_tournament_out(
-            item,
-            participants_by_tournament.get(item.id, 0),
-            matches_by_tournament.get(item.id, 0),
-            item.id in registered_tournament_ids,
-        )
-        for item in tournaments
-    ]
+    return encoded_response(_tournament_items(tournaments, selected, registered_tournament_ids), response)
 
 
 @router.post("/", response_model=TournamentOut)
@@ -417,78 +549,88 @@ async def create_tournament(payload: TournamentCreateIn, current_user: AdminUser
     return _to_tournament_out(tournament, 0, 0)
 
 
-@router.get("/me/registrations", response_model=list[MyRegistrationOut])
-async def get_my_registrations(current_user: CurrentUser):
-    async with async_session() as session:
-        rows = (
-            await session.execute(
-                select(TournamentRegistration, Tournament)
-                .join(Tournament, Tournament.id == TournamentRegistration.tournament_id)
-                .where(TournamentRegistration.user_id == current_user.id)
-                .order_by(TournamentRegistration.created_at.desc())
-            )
-        ).all()
+def _registrations_of(tables: TournamentTables, user_id: int, fields: tuple[str, ...] | None = None):
+    registrations, tournaments = tables.registrations.c, tables.tournaments.c
+    columns = {
+        "registration_id": registrations.id.label("registration_id"),
+        "tournament_id": tournaments.id.label("tournament_id"),
+        "tournament_name": tournaments.name.label("tournament_name"),
+        "game": tournaments.game,
+        "status": registrations.status,
+        "team_name": registrations.team_name,
+        "points": registrations.points,
+        "start_date": tournaments.start_date,
+    }
+    return (
+        select(*project(columns, fields), registrations.created_at.label("registered_at"))
+        .join_from(tables.registrations, tables.tournaments, tournaments.id == registrations.tournament_id)
+        .where(registrations.user_id == user_id)
+    )
 
-    return [
-        MyRegistrationOut(
-            registration_id=registration.id,
-            tournament_id=tournament.id,
-            tournament_name=tournament.name,
-            game=tournament.game,
-            status=registration.status,
-            team_name=registration.team_name,
-            points=registration.points,
-            start_date=tournament.start_date,
-        )
-        for registration, tournament in rows
-    ]
 
+@router.get("/me/registrations", response_model=list[MyRegistrationOut])
+async def get_my_registrations(response: Response, current_user: CurrentUser, fields: FieldsParam = None):
+    """The caller's registrations, including those in archived tournaments."""
+    selected = _fields_or_400(fields, MyRegistrationOut)
+    query = union_all(
+        _registrations_of(HOT_TABLES, current_user.id, selected),
+        _registrations_of(ARCHIVED_TABLES, current_user.id, selected),
+    )
+    async with async_session() as session:
+        rows = (await session.execute(query.order_by(query.selected_columns.registered_at.desc()))).all()
 
-@router.get("/{tournament_id}", response_model=TournamentOut)
-async def get_tournament(tournament_id: int, current_user: OptionalUser):
-    user_id = current_user.id if current_user else None
+    if selected is None:
+        return encoded_response([MyRegistrationOut.model_validate(row, from_attributes=True) for row in rows], response)
+    return encoded_response([{name: getattr(row, name) for name in selected} for row in rows], response)
 
-    async with async_session() as session:
-        tournament = (
-            await session.execute(
-                select(Tournament).where(Tournament.id == tournament_id)
-            )
-        ).scalar_one_or_none()
-        if not tournament:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Tournament not found",
-            )
 
-        participants_count = (
-            await session.scalar(
-                select(func.count(TournamentRegistration.id)).where(
-                    TournamentRegistration.tournament_id == tournament_id
-                )
+async def _is_registered(tournament_id: int, user_id: int) -> bool:
+    query = union_all(
+        *(
+            select(tables.registrations.c.id).where(
+                tables.registrations.c.tournament_id == tournament_id,
+                tables.registrations.c.user_id == user_id,
             )
-            or 0
-        )
-        matches_count = (
-            await session.scalar(
-                select(func.count(Match.id)).where(Match.tournament_id == tournament_id)
-            )
-            or 0
+            for tables in (HOT_TABLES, ARCHIVED_TABLES)
         )
+    )
+    async with async_session() as session:
+        return (await session.execute(query.limit(1))).first() is not None
+
+
+async def _load_tournament(tournament_id: int, fields: tuple[str, ...] | None = None) -> TournamentOut | dict:
+    columns = None if fields is None else [column.name for column in project(Tournament.__table__.c, fields, "id")]
+    async with async_session() as session:
+        _, tournament = await _find_tournament_or_404(session, tournament_id, columns)
+    return _tournament_items([tournament], fields, set())[0]
 
-        is_registered = False
-        if user_id is not None:
-            is_registered = (
-                await session.execute(
-                    select(TournamentRegistration.id).where(
-                        TournamentRegistration.tournament_id == tournament_id,
-                        TournamentRegistration.user_id == user_id,
-                    )
-                )
-            ).scalar_one_or_none() is not None
 
-    return _to_tournament_out(
-        tournament, participants_count, matches_count, is_registered
+@router.get("/{tournament_id}", response_model=TournamentOut)
+async def get_tournament(
+    tournament_id: int,
+    request: Request,
+    response: Response,
+    current_user: OptionalUser,
+    fields: FieldsParam = None,
+):
+    selected = _fields_or_400(fields, TournamentOut)
+    version = await _tournament_version_or_404(tournament_id)
+    etag = make_etag(
+        tournament_id, version, "tournament", current_user.id if current_user else "anonymous", *fieldset_tag(selected)
     )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    body = await response_cache.get_or_load(
+        ":".join(("tournament", *fieldset_tag(selected))),
+        tournament_id,
+        partial(_load_tournament, tournament_id, selected),
+        version=version,
+    )
+    if current_user is not None and includes(selected, "is_registered"):
+        body = {**body, "is_registered": await _is_registered(tournament_id, current_user.id)}
+    return encoded_response(body, response)
 
 
 @router.post("/{tournament_id}/join", response_model=JoinResponse)
@@ -530,15 +672,7 @@ async def join_tournament(
                 detail="You are already registered",
             )
 
-        current_count = (
-            await session.scalar(
-                select(func.count(TournamentRegistration.id)).where(
-                    TournamentRegistration.tournament_id == tournament_id
-                )
-            )
-            or 0
-        )
-        if current_count >= tournament.max_teams:
+        if not await reserve_slot(session, tournament_id):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Tournament slots are full",
@@ -556,6 +690,8 @@ async def join_tournament(
         session.add(registration)
         await session.commit()
         await session.refresh(registration)
+    await invalidate_tournament(tournament_id)
+    await invalidate_user(current_user.id)
 
     return JoinResponse(
         success=True,
@@ -564,50 +700,114 @@ async def join_tournament(
     )
 
 
-@router.get("/{tournament_id}/standings", response_model=list[StandingRow])
-async def get_standings(tournament_id: int):
-    await _get_tournament_or_404(tournament_id)
-    async with async_session() as session:
-        registrations = (
-            await session.execute(
-                select(TournamentRegistration)
-                .where(TournamentRegistration.tournament_id == tournament_id)
-                .order_by(
-                    TournamentRegistration.points.desc(),
-                    TournamentRegistration.created_at.asc(),
-                )
-            )
-        ).scalars().all()
-
+def _to_standing_rows(rows) -> list[StandingRow]:
     return [
         StandingRow(
-            rank=index + 1,
+            rank=item.rank,
             user_id=item.user_id,
             team_name=item.team_name,
             points=item.points,
+            buchholz=item.buchholz,
+            sonneborn_berger=item.sonneborn_berger,
             status=item.status,
         )
-        for index, item in enumerate(registrations)
+        for item in rows
     ]
 
 
-@router.get("/{tournament_id}/matches", response_model=list[MatchOut])
-async def list_matches(tournament_id: int):
-    await _get_tournament_or_404(tournament_id)
+async def _load_standings(
+    tournament_id: int,
+    limit: Optional[int],
+    around_user: Optional[int],
+    window: int,
+) -> list[StandingRow]:
     async with async_session() as session:
-        matches = (
-            await session.execute(
-                select(Match)
-                .where(Match.tournament_id == tournament_id)
-                .order_by(Match.round_name.asc(), Match.created_at.asc())
-            )
-        ).scalars().all()
-    return matches
+        tables, _ = await _find_tournament_or_404(session, tournament_id, ["id"])
+        try:
+            rows = await ranked_standings(session, tournament_id, limit, around_user, window, tables)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=str(exc),
+            ) from exc
+
+    return _to_standing_rows(rows)
+
+
+@router.get("/{tournament_id}/standings", response_model=list[StandingRow])
+async def get_standings(
+    tournament_id: int,
+    request: Request,
+    response: Response,
+    limit: Annotated[Optional[int], Query(ge=1, le=MAX_PAGE_SIZE)] = None,
+    around_user: Optional[int] = None,
+    window: Annotated[int, Query(ge=1, le=50)] = 5,
+    fields: FieldsParam = None,
+):
+    """Ranked standings; ``limit`` returns the top N, ``around_user`` the rows around one entrant.
+
+    Ranking reads the same few integer columns whatever ``fields`` asks for,
+    so sparse requests share the cached full rows and are trimmed on the way out.
+    """
+    selected = _fields_or_400(fields, StandingRow)
+    if limit is not None and around_user is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either limit or around_user, not both",
+        )
+    version = await _tournament_version_or_404(tournament_id)
+    etag = make_etag(tournament_id, version, "standings", *fieldset_tag(selected))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    body = await response_cache.get_or_load(
+        f"standings:{limit}:{around_user}:{window if around_user is not None else ''}",
+        tournament_id,
+        partial(_load_standings, tournament_id, limit, around_user, window),
+        version=version,
+    )
+    return encoded_response(sparse(body, selected), response)
+
+
+def _matches_query(
+    tournament_id: int, tables: TournamentTables = HOT_TABLES, fields: tuple[str, ...] | None = None
+):
+    matches = tables.matches.c
+    return (
+        select(*project(matches, fields))
+        .where(matches.tournament_id == tournament_id)
+        .order_by(matches.round_name.asc(), matches.created_at.asc())
+    )
+
+
+async def _load_matches(tournament_id: int, fields: tuple[str, ...] | None = None) -> list[MatchOut] | list[dict]:
+    async with async_session() as session:
+        tables, _ = await _find_tournament_or_404(session, tournament_id, ["id"])
+        matches = (await session.execute(_matches_query(tournament_id, tables, fields))).all()
+    if fields is None:
+        return [MatchOut.model_validate(match) for match in matches]
+    return [dict(match._mapping) for match in matches]
+
+
+@router.get("/{tournament_id}/matches", response_model=list[MatchOut])
+async def list_matches(tournament_id: int, request: Request, response: Response, fields: FieldsParam = None):
+    selected = _fields_or_400(fields, MatchOut)
+    version = await _tournament_version_or_404(tournament_id)
+    etag = make_etag(tournament_id, version, "matches", *fieldset_tag(selected))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    body = await response_cache.get_or_load(
+        ":".join(("matches", *fieldset_tag(selected))),
+        tournament_id,
+        partial(_load_matches, tournament_id, selected),
+        version=version,
+    )
+    return encoded_response(body, response)
 
 
 @router.post("/{tournament_id}/matches", response_model=MatchOut)
 async def create_match(tournament_id: int, payload: MatchCreateIn, _: AdminUser):
-    await _get_tournament_or_404(tournament_id)
     team_a, team_b = payload.team_a.strip(), payload.team_b.strip()
     if team_a.casefold() == team_b.casefold():
         raise HTTPException(
@@ -616,20 +816,78 @@ async def create_match(tournament_id: int, payload: MatchCreateIn, _: AdminUser)
         )
 
     async with async_session() as session:
+        # Lock the tournament before writing any of its rows, as the archive job does.
+        if not await record_tournament_change(session, tournament_id, matches=1):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Tournament not found",
+            )
+        registration_ids = registration_index(
+            (
+                await session.execute(
+                    select(TournamentRegistration).where(
+                        TournamentRegistration.tournament_id == tournament_id,
+                        TournamentRegistration.team_name.in_([team_a, team_b]),
+                    )
+                )
+            ).scalars()
+        )
         match = Match(
             tournament_id=tournament_id,
             round_name=payload.round_name,
             team_a=team_a,
             team_b=team_b,
+            team_a_registration_id=registration_ids.get(team_a),
+            team_b_registration_id=registration_ids.get(team_b),
             scheduled_at=payload.scheduled_at,
             status="scheduled",
         )
         session.add(match)
         await session.commit()
         await session.refresh(match)
+    await invalidate_tournament(tournament_id)
     return match
 
 
+async def _apply_results(tournament_id: int, entries: list[ResultEntry]) -> list[Match]:
+    async with async_session() as session:
+        # Bump the version before reading anything: result writers for one
+        # tournament queue on its row lock and then see every earlier result.
+        if not await record_tournament_change(session, tournament_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Tournament not found",
+            )
+        try:
+            matches = await apply_results(session, tournament_id, entries)
+        except UnknownMatches as exc:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Match not found" if len(entries) == 1 else str(exc),
+            ) from exc
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(exc),
+            ) from exc
+        await session.commit()
+    await invalidate_tournament(tournament_id)
+    return matches
+
+
+@router.patch("/{tournament_id}/matches/results", response_model=list[MatchOut])
+async def update_match_results(
+    tournament_id: int,
+    payload: MatchResultsIn,
+    _: AdminUser,
+):
+    """Record a batch of results atomically: all are applied or none are."""
+    return await _apply_results(
+        tournament_id,
+        [ResultEntry(**item.model_dump()) for item in payload.results],
+    )
+
+
 @router.patch("/{tournament_id}/matches/{match_id}/result", response_model=MatchOut)
 async def update_match_result(
     tournament_id: int,
@@ -637,85 +895,40 @@ async def update_match_result(
     payload: MatchResultIn,
     _: AdminUser,
 ):
-    await _get_tournament_or_404(tournament_id)
-    if payload.team_a_score == payload.team_b_score:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="A completed match cannot end in a tie",
-        )
+    [match] = await _apply_results(
+        tournament_id,
+        [ResultEntry(match_id=match_id, **payload.model_dump())],
+    )
+    return match
 
-    async with async_session() as session:
-        match = (
-            await session.execute(
-                select(Match).where(
-                    Match.tournament_id == tournament_id,
-                    Match.id == match_id,
-                )
-            )
-        ).scalar_one_or_none()
-        if not match:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Match not found",
-            )
 
-        expected_winner = (
-            match.team_a if payload.team_a_score > payload.team_b_score else match.team_b
-        )
-        winner = payload.winner.strip() if payload.winner else expected_winner
-        if winner not in {match.team_a, match.team_b} or winner != expected_winner:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Winner does not match the participating teams and scores",
-            )
+def _announcements_query(tournament_id: int, tables: TournamentTables = HOT_TABLES):
+    announcements = tables.announcements.c
+    return (
+        select(tables.announcements)
+        .where(announcements.tournament_id == tournament_id)
+        .order_by(announcements.created_at.desc())
+    )
 
-        previous_winner = match.winner if match.status == "finished" else None
-        if previous_winner and previous_winner != winner:
-            previous_registration = (
-                await session.execute(
-                    select(TournamentRegistration).where(
-                        TournamentRegistration.tournament_id == tournament_id,
-                        TournamentRegistration.team_name == previous_winner,
-                    )
-                )
-            ).scalar_one_or_none()
-            if previous_registration:
-                previous_registration.points = max(0, previous_registration.points - 3)
 
-        if previous_winner != winner:
-            winner_registration = (
-                await session.execute(
-                    select(TournamentRegistration).where(
-                        TournamentRegistration.tournament_id == tournament_id,
-                        TournamentRegistration.team_name == winner,
-                    )
-                )
-            ).scalar_one_or_none()
-            if winner_registration:
-                winner_registration.points += 3
-
-        match.team_a_score = payload.team_a_score
-        match.team_b_score = payload.team_b_score
-        match.winner = winner
-        match.status = "finished"
-        await session.commit()
-        await session.refresh(match)
-
-    return match
+async def _load_announcements(tournament_id: int) -> list[AnnouncementOut]:
+    async with async_session() as session:
+        tables, _ = await _find_tournament_or_404(session, tournament_id, ["id"])
+        announcements = (await session.execute(_announcements_query(tournament_id, tables))).all()
+    return [AnnouncementOut.model_validate(item) for item in announcements]
 
 
 @router.get("/{tournament_id}/announcements", response_model=list[AnnouncementOut])
-async def list_announcements(tournament_id: int):
-    await _get_tournament_or_404(tournament_id)
-    async with async_session() as session:
-        announcements = (
-            await session.execute(
-                select(Announcement)
-                .where(Announcement.tournament_id == tournament_id)
-                .order_by(Announcement.created_at.desc())
-            )
-        ).scalars().all()
-    return announcements
+async def list_announcements(tournament_id: int, request: Request, response: Response):
+    version = await _tournament_version_or_404(tournament_id)
+    etag = make_etag(tournament_id, version, "announcements")
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    body = await response_cache.get_or_load(
+        "announcements", tournament_id, partial(_load_announcements, tournament_id), version=version
+    )
+    return encoded_response(body, response)
 
 
 @router.post("/{tournament_id}/announcements", response_model=AnnouncementOut)
@@ -724,8 +937,12 @@ async def create_announcement(
     payload: AnnouncementCreateIn,
     _: AdminUser,
 ):
-    await _get_tournament_or_404(tournament_id)
     async with async_session() as session:
+        if not await record_tournament_change(session, tournament_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Tournament not found",
+            )
         announcement = Announcement(
             tournament_id=tournament_id,
             title=payload.title,
@@ -734,4 +951,65 @@ async def create_announcement(
         session.add(announcement)
         await session.commit()
         await session.refresh(announcement)
+    await invalidate_tournament(tournament_id)
     return announcement
+
+
+async def _load_overview(
+    tournament_id: int, standings_limit: int, announcements_limit: int
+) -> TournamentOverviewOut:
+    async with async_session() as session:
+        tables, tournament = await _find_tournament_or_404(session, tournament_id)
+        standings = await ranked_standings(session, tournament_id, limit=standings_limit, tables=tables)
+        matches = (await session.execute(_matches_query(tournament_id, tables))).all()
+        announcements = (
+            await session.execute(_announcements_query(tournament_id, tables).limit(announcements_limit))
+        ).all()
+
+    return TournamentOverviewOut(
+        tournament=_to_tournament_out(
+            tournament, tournament.participants_count, tournament.matches_count, False
+        ),
+        standings=_to_standing_rows(standings),
+        matches=[MatchOut.model_validate(match) for match in matches],
+        announcements=[AnnouncementOut.model_validate(item) for item in announcements],
+    )
+
+
+@router.get("/{tournament_id}/overview", response_model=TournamentOverviewOut)
+async def get_tournament_overview(
+    tournament_id: int,
+    request: Request,
+    response: Response,
+    current_user: OptionalUser,
+    standings_limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = 50,
+    announcements_limit: Annotated[int, Query(ge=1, le=50)] = 5,
+):
+    """Everything a tournament page shows, composed from one session.
+
+    The tournament row already carries its counters, so the body costs one
+    query each for the tournament, standings (plus one for head-to-head ties),
+    matches and announcements; the caller's registration flag is added on top
+    of the shared cached body.
+    """
+    version = await _tournament_version_or_404(tournament_id)
+    etag = make_etag(tournament_id, version, "overview", current_user.id if current_user else "anonymous")
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    body = await response_cache.get_or_load(
+        f"overview:{standings_limit}:{announcements_limit}",
+        tournament_id,
+        partial(_load_overview, tournament_id, standings_limit, announcements_limit),
+        version=version,
+    )
+    if current_user is not None:
+        body = {
+            **body,
+            "tournament": {
+                **body["tournament"],
+                "is_registered": await _is_registered(tournament_id, current_user.id),
+            },
+        }
+    return encoded_response(body, response)
@@ -0,0 +1,206 @@
+"""Response cache for public tournament reads with write-driven invalidation.
+
+Entries are keyed by route, tournament id, the tournament's cache
+generation and, for reads that send an ETag, the version that ETag names.
+Write paths call ``invalidate_tournament`` after committing, which bumps the
+generation: every older entry becomes unreachable at once and simply ages
+out, so a read that raced the write can never repopulate stale data under
+the current key. Per-user entries work the same way under a ``user:<id>``
+tag and also remember the generations of the tournaments they were built
+from, so a write to any of those tournaments makes them stale too. Backends
+are pluggable; ``memory`` is an in-process LRU with TTL, ``redis`` shares
+entries across workers through any Redis-compatible server (requires the
+``redis`` package), and ``none`` disables caching.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Awaitable, Callable, Protocol
+
+import orjson
+from pydantic_core import to_jsonable_python
+
+from .config import settings
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Any | None: ...
+
+    async def set(self, key: str, value: Any, ttl: int) -> None: ...
+
+    async def generation(self, tag: str) -> int: ...
+
+    async def bump(self, tag: str) -> None: ...
+
+
+class MemoryBackend:
+    """Per-process LRU with a TTL on every entry.
+
+    Generations live in a second LRU of the same size. They come from one
+    process-wide counter, and a tag that is not tracked reads a floor that
+    moves past every value handed out whenever a generation is evicted, so a
+    forgotten tag can never fall back to a generation its old entries were
+    stored under.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._generations: OrderedDict[str, int] = OrderedDict()
+        self._clock = count(1)
+        self._floor = 0
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def generation(self, tag: str) -> int:
+        value = self._generations.get(tag)
+        if value is None:
+            return self._floor
+        self._generations.move_to_end(tag)
+        return value
+
+    async def bump(self, tag: str) -> None:
+        self._generations[tag] = next(self._clock)
+        self._generations.move_to_end(tag)
+        while len(self._generations) > self.max_entries:
+            self._generations.popitem(last=False)
+            self._floor = next(self._clock)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisBackend:
+    """Entries shared by all workers, stored as JSON with a server-side TTL."""
+
+    def __init__(self, url: str, prefix: str = "tournaments:cache:") -> None:
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as exc:  # pragma: no cover - depends on the deployment
+            raise RuntimeError("RESPONSE_CACHE_BACKEND=redis requires the 'redis' package") from exc
+        self._client = redis_asyncio.from_url(url)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Any | None:
+        raw = await self._client.get(self._prefix + key)
+        return None if raw is None else orjson.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        await self._client.set(self._prefix + key, orjson.dumps(value), ex=ttl)
+
+    async def generation(self, tag: str) -> int:
+        return int(await self._client.get(f"{self._prefix}generation:{tag}") or 0)
+
+    async def bump(self, tag: str) -> None:
+        await self._client.incr(f"{self._prefix}generation:{tag}")
+
+
+class ResponseCache:
+    def __init__(self, backend: CacheBackend | None, ttl: int) -> None:
+        self.backend = backend
+        self.ttl = ttl
+
+    async def get_or_load(
+        self, route: str, tournament_id: int, loader: Callable[[], Awaitable[Any]], version: int | None = None
+    ) -> Any:
+        """Return the cached JSON-ready body for ``route`` or load, encode and store it.
+
+        ``version`` is the tournament version the caller built its ETag from.
+        Keying on it means a body cached before a write commits is never
+        served under the new version's ETag, even before the writer's
+        ``invalidate_tournament`` lands.
+        """
+        if self.backend is None:
+            return to_jsonable_python(await loader())
+        tag = f"tournament:{tournament_id}"
+        key = f"{route}:{tournament_id}:{await self.backend.generation(tag)}"
+        if version is not None:
+            key += f":v{version}"
+        cached = await self.backend.get(key)
+        if cached is not None:
+            return cached
+        value = to_jsonable_python(await loader())
+        await self.backend.set(key, value, self.ttl)
+        return value
+
+    async def _tournament_generations(self, tournament_ids: list[int]) -> list[list[int]]:
+        return [[tournament_id, await self.backend.generation(f"tournament:{tournament_id}")] for tournament_id in tournament_ids]
+
+    async def get_or_load_for_user(
+        self,
+        route: str,
+        user_id: int,
+        ttl: int,
+        tournament_ids: Callable[[], Awaitable[list[int]]],
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached body of ``route`` for one user or load, encode and store it.
+
+        ``tournament_ids`` names the tournaments the body depends on; it runs,
+        and their generations are read, before ``loader`` so a write racing the
+        load leaves the stored entry stale rather than the stale data current.
+        """
+        if self.backend is None:
+            return to_jsonable_python(await loader())
+        key = f"{route}:user:{user_id}:{await self.backend.generation(f'user:{user_id}')}"
+        cached = await self.backend.get(key)
+        if cached is not None:
+            dependencies = [tournament_id for tournament_id, _ in cached["tournaments"]]
+            if await self._tournament_generations(dependencies) == cached["tournaments"]:
+                return cached["body"]
+        generations = await self._tournament_generations(await tournament_ids())
+        value = to_jsonable_python(await loader())
+        await self.backend.set(key, {"body": value, "tournaments": generations}, ttl)
+        return value
+
+    async def invalidate_tournament(self, tournament_id: int) -> None:
+        if self.backend is not None:
+            await self.backend.bump(f"tournament:{tournament_id}")
+
+    async def invalidate_user(self, user_id: int) -> None:
+        if self.backend is not None:
+            await self.backend.bump(f"user:{user_id}")
+
+
+def build_response_cache() -> ResponseCache:
+    backend_name = settings.RESPONSE_CACHE_BACKEND.strip().lower()
+    if backend_name == "none":
+        backend = None
+    elif backend_name == "redis":
+        if not settings.RESPONSE_CACHE_REDIS_URL:
+            raise RuntimeError("RESPONSE_CACHE_REDIS_URL must be configured for the redis cache backend")
+        backend = RedisBackend(settings.RESPONSE_CACHE_REDIS_URL)
+    elif backend_name == "memory":
+        backend = MemoryBackend(settings.RESPONSE_CACHE_MAX_ENTRIES)
+    else:
+        raise RuntimeError(f"Unknown RESPONSE_CACHE_BACKEND: {settings.RESPONSE_CACHE_BACKEND}")
+    return ResponseCache(backend, settings.RESPONSE_CACHE_TTL_SECONDS)
+
+
+response_cache = build_response_cache()
+
+
+async def invalidate_tournament(tournament_id: int) -> None:
+    await response_cache.invalidate_tournament(tournament_id)
+
+
+async def invalidate_user(user_id: int) -> None:
+    await response_cache.invalidate_user(user_id)
@@ -47,6 +47,18 @@ class Settings(BaseSettings):
     STREAM_CHANNEL: Optional[str] = None
     STREAM_PARENT_DOMAIN: str = "localhost"
 
+    # Public tournament read cache: "memory" (per process), "redis" (shared) or "none".
+    RESPONSE_CACHE_BACKEND: str = "memory"
+    RESPONSE_CACHE_TTL_SECONDS: int = 30
+    RESPONSE_CACHE_MAX_ENTRIES: int = 4096
+    RESPONSE_CACHE_REDIS_URL: Optional[str] = None
+    # Per-user /me/dashboard entries; writes to the user or their tournaments also invalidate them.
+    DASHBOARD_CACHE_TTL_SECONDS: int = 15
+
+    # Archival of completed tournaments (and read notifications) into the *_archive tables.
+    ARCHIVE_AFTER_DAYS: int = 90
+    ARCHIVE_BATCH_SIZE: int = 50
+
     PROJECT_ROOT: Path = BASE_DIR
 
     model_config = SettingsConfigDict(
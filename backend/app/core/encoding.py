@@ -0,0 +1,99 @@
+"""Response encoding: orjson by default, MessagePack when the client asks for it.
+
+``ContentNegotiationMiddleware`` reads ``Accept`` once per request and
+``NegotiatedResponse``, the app's default response class, renders with the
+chosen encoder. Routes whose body is already validated, such as cached
+tournament reads or lists of freshly built output models, return
+``encoded_response`` so FastAPI does not validate every item a second time
+against ``response_model``; the model still documents the schema.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from typing import Any
+
+import msgpack
+import orjson
+from fastapi import Response
+from pydantic_core import to_jsonable_python
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+MSGPACK_ALIASES = frozenset({MSGPACK, "application/x-msgpack", "application/vnd.msgpack"})
+
+_wants_msgpack: ContextVar[bool] = ContextVar("wants_msgpack", default=False)
+
+
+def prefers_msgpack(accept: str) -> bool:
+    """Whether ``accept`` ranks MessagePack above JSON; on a tie an explicit MessagePack entry beats a wildcard."""
+    msgpack_q = 0.0
+    json_q = wildcard_q = 0.0
+    json_listed = False
+    for item in accept.split(","):
+        media_type, *params = (part.strip() for part in item.split(";"))
+        media_type = media_type.lower()
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media_type in MSGPACK_ALIASES:
+            msgpack_q = max(msgpack_q, q)
+        elif media_type == JSON:
+            json_q, json_listed = max(json_q, q), True
+        elif media_type in ("*/*", "application/*"):
+            wildcard_q = max(wildcard_q, q)
+    if not json_listed:
+        json_q = wildcard_q
+    return msgpack_q > 0 and (msgpack_q > json_q or (msgpack_q == json_q and not json_listed))
+
+
+def negotiated_media_type() -> str:
+    """The media type the current request's response body is encoded as."""
+    return MSGPACK if _wants_msgpack.get() else JSON
+
+
+class NegotiatedResponse(Response):
+    """orjson or MessagePack, whichever the current request negotiated."""
+
+    media_type = JSON
+
+    def render(self, content: Any) -> bytes:
+        if negotiated_media_type() == MSGPACK:
+            self.media_type = MSGPACK
+            return msgpack.packb(content, default=to_jsonable_python)
+        return orjson.dumps(content, default=to_jsonable_python, option=orjson.OPT_NON_STR_KEYS)
+
+
+def encoded_response(content: Any, response: Response, status_code: int = 200) -> NegotiatedResponse:
+    """Encode an already validated body directly, keeping the headers the route set on ``response``."""
+    return NegotiatedResponse(content, status_code=status_code, headers=dict(response.headers))
+
+
+class ContentNegotiationMiddleware:
+    """Record the request's preferred encoding for ``NegotiatedResponse`` and mark responses as varying by ``Accept``."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_varying(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).add_vary_header("Accept")
+            await send(message)
+
+        token = _wants_msgpack.set(prefers_msgpack(Headers(scope=scope).get("accept", "")))
+        try:
+            await self.app(scope, receive, send_varying)
+        finally:
+            _wants_msgpack.reset(token)
@@ -0,0 +1,31 @@
+"""Strong ETags and conditional GET handling."""
+
+from fastapi import Request, Response, status
+
+from .encoding import MSGPACK, negotiated_media_type
+
+
+def make_etag(*parts: object) -> str:
+    """Strong ETag over ``parts`` and the negotiated encoding.
+
+    JSON and MessagePack bodies differ byte for byte, so MessagePack responses
+    carry their own tag; JSON tags keep the plain form.
+    """
+    if negotiated_media_type() == MSGPACK:
+        parts = (*parts, "msgpack")
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether ``If-None-Match`` already names ``etag`` (weak comparison, as RFC 9110 requires for GET)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
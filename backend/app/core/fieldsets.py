@@ -0,0 +1,60 @@
+"""Sparse fieldsets: ``?fields=id,name,status`` on read endpoints.
+
+``parse_fields`` checks the requested names against the response model,
+``project`` picks the columns a query has to select for them, and ``sparse``
+trims bodies that were built in full.
+"""
+
+from typing import Annotated, Any, Mapping, Optional, Sequence
+
+from fastapi import Query
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement
+
+FieldsParam = Annotated[
+    Optional[str],
+    Query(max_length=500, description="Comma-separated response fields to return; every field when omitted"),
+]
+
+
+def parse_fields(raw: str | None, model: type[BaseModel]) -> tuple[str, ...] | None:
+    """The requested fields of ``model`` in declaration order, or ``None`` for all of them.
+
+    Raises ``ValueError`` for an empty list or names the model does not have.
+    """
+    if raw is None:
+        return None
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    if not requested:
+        raise ValueError("fields must name at least one field")
+    unknown = requested - model.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return tuple(name for name in model.model_fields if name in requested)
+
+
+def fieldset_tag(fields: Sequence[str] | None) -> tuple[str, ...]:
+    """Cache key and ETag part for a fieldset; full bodies keep their existing keys."""
+    return () if fields is None else ("+".join(fields),)
+
+
+def includes(fields: Sequence[str] | None, name: str) -> bool:
+    return fields is None or name in fields
+
+
+def project(columns: Mapping[str, ColumnElement], fields: Sequence[str] | None, *required: str) -> list[ColumnElement]:
+    """The columns behind ``fields`` plus ``required`` ones the query itself needs, or every column.
+
+    Requested fields without a column, such as computed flags, are skipped.
+    """
+    names = columns.keys() if fields is None else dict.fromkeys((*fields, *required))
+    return [columns[name] for name in names if name in columns]
+
+
+def sparse(body: Any, fields: Sequence[str] | None) -> Any:
+    """Keep only ``fields`` of a JSON-ready object, or of each object in a list."""
+    if fields is None:
+        return body
+    if isinstance(body, list):
+        return [{name: item[name] for name in fields} for item in body]
+    return {name: body[name] for name in fields}
@@ -0,0 +1,29 @@
+"""Opaque cursors for keyset pagination."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    """Serialise the sort key of the last row on a page; datetimes become ISO strings."""
+    payload = {key: value.isoformat() if isinstance(value, datetime) else value for key, value in values.items()}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, datetime_fields: tuple[str, ...] = ()) -> dict[str, Any]:
+    """Reverse ``encode_cursor``, raising ``ValueError`` for anything that was not produced by it."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(payload, dict):
+            raise ValueError
+        for key in datetime_fields:
+            if payload.get(key) is not None:
+                payload[key] = datetime.fromisoformat(payload[key])
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    return payload
@@ -1,15 +1,100 @@
-from sqlalchemy import inspect, text
+from sqlalchemy import Table, func, inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import engine
+from app.core.database import async_session, engine
+from app.models.archive import ARCHIVE_PAIRS
+from app.services.bracket_publisher import link_match_registrations, unlinked_match_tournaments
+from app.services.counters import repair_tournament_counters, stale_counter_tournaments
+from app.services.search import ensure_search_index
+from app.services.standings import rebuild_tiebreaks, tournaments_missing_tiebreaks
+
+
+async def run_backfills(session: AsyncSession) -> None:
+    """Fill derived columns wherever they are still missing.
+
+    Each backfill checks whether it is needed on every start, so one that was
+    interrupted after its columns were added still completes on the next.
+    """
+    unlinked = await unlinked_match_tournaments(session)
+    if unlinked:
+        await link_match_registrations(session)
+    # Tiebreaks are computed through the registration ids, so link them first.
+    for tournament_id in sorted({*unlinked, *await tournaments_missing_tiebreaks(session)}):
+        await rebuild_tiebreaks(session, tournament_id)
+    stale = await stale_counter_tournaments(session)
+    if stale:
+        await repair_tournament_counters(session, stale)
+
+
+def _rebuild_sqlite_table(sync_conn, table: Table) -> None:
+    """Recreate ``table`` from its model, keeping its rows; SQLite cannot alter a table's primary key in place."""
+    quote = sync_conn.dialect.identifier_preparer.quote
+    existing = {column["name"] for column in inspect(sync_conn).get_columns(table.name)}
+    old_name = f"{table.name}_rebuild"
+    sync_conn.execute(text(f"ALTER TABLE {quote(table.name)} RENAME TO {quote(old_name)}"))
+    # Indexes keep their names across the rename and would clash with the new table's.
+    for index in inspect(sync_conn).get_indexes(old_name):
+        sync_conn.execute(text(f"DROP INDEX {quote(index['name'])}"))
+    table.create(sync_conn)
+    columns = ", ".join(quote(column.name) for column in table.columns if column.name in existing)
+    sync_conn.execute(text(f"INSERT INTO {quote(table.name)} ({columns}) SELECT {columns} FROM {quote(old_name)}"))
+    sync_conn.execute(text(f"DROP TABLE {quote(old_name)}"))
+
+
+def reserve_archived_ids(sync_conn) -> None:
+    """Make sure no hot table hands out an id already taken by its archive.
+
+    Without AUTOINCREMENT SQLite reuses the ids of the newest rows once they
+    are archived, and MySQL before 8.0 does the same after a restart. A reused
+    id shadows the archived row wherever both sides are read and breaks the
+    next archive run, so older SQLite tables are rebuilt with AUTOINCREMENT and
+    every counter is moved past the highest archived id.
+    """
+    inspector = inspect(sync_conn)
+    dialect = sync_conn.dialect.name
+    for hot, archived in ARCHIVE_PAIRS:
+        if not inspector.has_table(hot.name):
+            continue
+        if dialect == "sqlite":
+            ddl = sync_conn.execute(
+                text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": hot.name}
+            ).scalar_one()
+            if "AUTOINCREMENT" not in ddl.upper():
+                _rebuild_sqlite_table(sync_conn, hot)
+        if not inspector.has_table(archived.name):
+            continue
+        last_archived = sync_conn.execute(select(func.max(archived.c.id))).scalar()
+        last_hot = sync_conn.execute(select(func.max(hot.c.id))).scalar()
+        if last_archived is None or (last_hot is not None and last_hot >= last_archived):
+            continue
+        if dialect == "sqlite":
+            updated = sync_conn.execute(
+                text("UPDATE sqlite_sequence SET seq = :seq WHERE name = :name AND seq < :seq"),
+                {"name": hot.name, "seq": last_archived},
+            ).rowcount
+            if not updated:
+                sync_conn.execute(
+                    text("INSERT INTO sqlite_sequence (name, seq) SELECT :name, :seq WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = :name)"),
+                    {"name": hot.name, "seq": last_archived},
+                )
+        elif dialect == "mysql":
+            sync_conn.execute(text(f"ALTER TABLE {hot.name} AUTO_INCREMENT = {last_archived + 1}"))
 
 
 async def ensure_extended_schema() -> None:
-    def upgrade(sync_conn):
+    def upgrade(sync_conn) -> None:
         inspector = inspect(sync_conn)
         if inspector.has_table("tournaments"):
             tournament_columns = {column["name"] for column in inspector.get_columns("tournaments")}
             if "entry_fee" not in tournament_columns:
                 sync_conn.execute(text("ALTER TABLE tournaments ADD COLUMN entry_fee INTEGER NOT NULL DEFAULT 0"))
+            if "current_stage" not in tournament_columns:
+                sync_conn.execute(text("ALTER TABLE tournaments ADD COLUMN current_stage INTEGER NOT NULL DEFAULT 1"))
+            for column_name in ("participants_count", "matches_count", "version"):
+                if column_name not in tournament_columns:
+                    sync_conn.execute(text(f"ALTER TABLE tournaments ADD COLUMN {column_name} INTEGER NOT NULL DEFAULT 0"))
+            if "ix_tournament_start_created" not in {index["name"] for index in inspector.get_indexes("tournaments")}:
+                sync_conn.execute(text("CREATE INDEX ix_tournament_start_created ON tournaments (start_date, created_at)"))
 
         if inspector.has_table("matches"):
             match_columns = {column["name"] for column in inspector.get_columns("matches")}
@@ -17,6 +102,37 @@ async def ensure_extended_schema() -> None:
                 sync_conn.execute(text("ALTER TABLE matches ADD COLUMN bracket_match_number INTEGER NULL"))
             if "next_match_id" not in match_columns:
                 sync_conn.execute(text("ALTER TABLE matches ADD COLUMN next_match_id INTEGER NULL"))
+            for column_name in ("next_match_slot", "loser_next_match_id", "loser_next_match_slot", "stage"):
+                if column_name not in match_columns:
+                    sync_conn.execute(text(f"ALTER TABLE matches ADD COLUMN {column_name} INTEGER NULL"))
+            for column_name in ("team_a_registration_id", "team_b_registration_id", "winner_registration_id"):
+                if column_name not in match_columns:
+                    sync_conn.execute(text(f"ALTER TABLE matches ADD COLUMN {column_name} INTEGER NULL"))
+            match_indexes = {index["name"] for index in inspector.get_indexes("matches")}
+            for side in ("team_a", "team_b"):
+                if f"ix_match_tournament_{side}_registration" not in match_indexes:
+                    sync_conn.execute(text(f"CREATE INDEX ix_match_tournament_{side}_registration ON matches (tournament_id, {side}_registration_id)"))
+
+        if inspector.has_table("tournament_registrations"):
+            registration_columns = {column["name"] for column in inspector.get_columns("tournament_registrations")}
+            for column_name in ("buchholz", "sonneborn_berger"):
+                if column_name not in registration_columns:
+                    sync_conn.execute(text(f"ALTER TABLE tournament_registrations ADD COLUMN {column_name} INTEGER NOT NULL DEFAULT 0"))
+            if "group_name" not in registration_columns:
+                sync_conn.execute(text("ALTER TABLE tournament_registrations ADD COLUMN group_name VARCHAR(20) NULL"))
+            if "lobby_number" not in registration_columns:
+                sync_conn.execute(text("ALTER TABLE tournament_registrations ADD COLUMN lobby_number INTEGER NULL"))
+            if "ix_registration_tournament_points_created" not in {index["name"] for index in inspector.get_indexes("tournament_registrations")}:
+                sync_conn.execute(text("CREATE INDEX ix_registration_tournament_points_created ON tournament_registrations (tournament_id, points, created_at)"))
+
+        # After the column changes, so a rebuilt table copies every column.
+        reserve_archived_ids(sync_conn)
+        if inspector.has_table("tournaments"):
+            ensure_search_index(sync_conn)
 
     async with engine.begin() as conn:
         await conn.run_sync(upgrade)
+
+    async with async_session() as session:
+        await run_backfills(session)
+        await session.commit()
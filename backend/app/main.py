@@ -7,9 +7,13 @@ from .api.router import router as api_router
 from .api.tournaments.tournament_routes import seed_sample_tournaments
 from .core.config import settings
 from .core.database import init_db
+from .core.encoding import ContentNegotiationMiddleware, NegotiatedResponse
+from .core.pagination import CURSOR_HEADER
 from .core.schema import ensure_extended_schema
 from .models import announcement as _announcement_model  # noqa: F401
+from .models import archive as _archive_model  # noqa: F401
 from .models import auth_user as _auth_user_model  # noqa: F401
+from .models import lobby_result as _lobby_result_model  # noqa: F401
 from .models import match as _match_model  # noqa: F401
 from .models import notification as _notification_model  # noqa: F401
 from .models import password_reset_token as _password_reset_token_model  # noqa: F401
@@ -21,8 +25,9 @@ from .models import tournament_registration as _registration_model  # noqa: F401
 from .models import user as _user_model  # noqa: F401
 
 _START_TIME = time.time()
-app = FastAPI(title=settings.APP_NAME, version="0.1.0", description="API for tournament management. Use Swagger UI to test endpoints.", docs_url="/docs", redoc_url="/redoc", openapi_url="/openapi.json")
-app.add_middleware(CORSMiddleware, allow_origins=settings.CORS_ORIGINS, allow_credentials=True, allow_methods=["GET", "POST", "PATCH", "OPTIONS"], allow_headers=["Authorization", "Content-Type"])
+app = FastAPI(title=settings.APP_NAME, version="0.1.0", description="API for tournament management. Use Swagger UI to test endpoints.", docs_url="/docs", redoc_url="/redoc", openapi_url="/openapi.json", default_response_class=NegotiatedResponse)
+app.add_middleware(ContentNegotiationMiddleware)
+app.add_middleware(CORSMiddleware, allow_origins=settings.CORS_ORIGINS, allow_credentials=True, allow_methods=["GET", "POST", "PATCH", "OPTIONS"], allow_headers=["Authorization", "Content-Type"], expose_headers=[CURSOR_HEADER, "ETag"])
 
 @app.on_event("startup")
 async def startup_event() -> None:
@@ -9,6 +9,7 @@ class Announcement(Base):
     __tablename__ = "announcements"
     __table_args__ = (
         Index("ix_announcement_tournament_id", "tournament_id"),
+        {"sqlite_autoincrement": True},
     )
 
     id = Column(Integer, primary_key=True, index=True)
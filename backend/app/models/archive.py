@@ -0,0 +1,80 @@
+"""Cold-storage copies of completed tournaments and old read notifications.
+
+Each archive table mirrors its hot table's columns plus ``archived_at`` but
+keeps only the indexes archived reads need. ``TournamentTables`` bundles the
+tables one tournament's rows live in, so read paths can run the same queries
+against either side.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Table
+
+from app.core.database import Base
+
+from .announcement import Announcement
+from .lobby_result import LobbyResult
+from .match import Match
+from .notification import Notification
+from .tournament import Tournament
+from .tournament_registration import TournamentRegistration
+
+
+def _archive_of(source: Table, *indexed: str) -> Table:
+    name = f"{source.name}_archive"
+    return Table(
+        name,
+        Base.metadata,
+        *(
+            Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable, autoincrement=False)
+            for column in source.columns
+        ),
+        Column("archived_at", DateTime, nullable=False, default=datetime.utcnow),
+        *(Index(f"ix_{name}_{column}", column) for column in indexed),
+    )
+
+
+tournaments_archive = _archive_of(Tournament.__table__)
+matches_archive = _archive_of(Match.__table__, "tournament_id")
+registrations_archive = _archive_of(TournamentRegistration.__table__, "tournament_id", "user_id")
+announcements_archive = _archive_of(Announcement.__table__, "tournament_id")
+lobby_results_archive = _archive_of(LobbyResult.__table__, "tournament_id")
+notifications_archive = _archive_of(Notification.__table__, "user_id")
+
+
+@dataclass(frozen=True)
+class TournamentTables:
+    """The tables holding one tournament's rows: all hot or all archived."""
+
+    tournaments: Table
+    matches: Table
+    registrations: Table
+    announcements: Table
+    lobby_results: Table
+
+    @property
+    def children(self) -> tuple[Table, ...]:
+        return self.matches, self.registrations, self.announcements, self.lobby_results
+
+
+HOT_TABLES = TournamentTables(
+    Tournament.__table__,
+    Match.__table__,
+    TournamentRegistration.__table__,
+    Announcement.__table__,
+    LobbyResult.__table__,
+)
+ARCHIVED_TABLES = TournamentTables(
+    tournaments_archive,
+    matches_archive,
+    registrations_archive,
+    announcements_archive,
+    lobby_results_archive,
+)
+# Every hot table with its archive. Hot ids must never repeat an archived one,
+# so these tables are created with AUTOINCREMENT on SQLite.
+ARCHIVE_PAIRS: tuple[tuple[Table, Table], ...] = (
+    *zip((HOT_TABLES.tournaments, *HOT_TABLES.children), (ARCHIVED_TABLES.tournaments, *ARCHIVED_TABLES.children)),
+    (Notification.__table__, notifications_archive),
+)
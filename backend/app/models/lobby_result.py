@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, UniqueConstraint
+
+from app.core.database import Base
+
+
+class LobbyResult(Base):
+    __tablename__ = "lobby_results"
+    __table_args__ = (
+        UniqueConstraint("tournament_id", "lobby_number", "game_number", "team_name", name="uq_lobby_result_team_game"),
+        Index("ix_lobby_result_tournament_team", "tournament_id", "team_name"),
+        {"sqlite_autoincrement": True},
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    tournament_id = Column(Integer, nullable=False)
+    lobby_number = Column(Integer, nullable=False)
+    game_number = Column(Integer, nullable=False)
+    team_name = Column(String(255), nullable=False)
+    placement = Column(Integer, nullable=False)
+    kills = Column(Integer, nullable=False, default=0)
+    points = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<LobbyResult tournament_id={self.tournament_id} lobby={self.lobby_number} game={self.game_number} team={self.team_name}>"
@@ -7,20 +7,33 @@ from app.core.database import Base
 
 class Match(Base):
     __tablename__ = "matches"
-    __table_args__ = (Index("ix_match_tournament_id", "tournament_id"),)
+    __table_args__ = (
+        Index("ix_match_tournament_id", "tournament_id"),
+        Index("ix_match_tournament_team_a_registration", "tournament_id", "team_a_registration_id"),
+        Index("ix_match_tournament_team_b_registration", "tournament_id", "team_b_registration_id"),
+        {"sqlite_autoincrement": True},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     tournament_id = Column(Integer, nullable=False)
     round_name = Column(String(100), nullable=False, default="Round 1")
     team_a = Column(String(255), nullable=False)
     team_b = Column(String(255), nullable=False)
+    # Registrations behind the display names; NULL for BYE/TBD and unregistered teams.
+    team_a_registration_id = Column(Integer, nullable=True)
+    team_b_registration_id = Column(Integer, nullable=True)
     scheduled_at = Column(DateTime, nullable=True)
     team_a_score = Column(Integer, nullable=True)
     team_b_score = Column(Integer, nullable=True)
     winner = Column(String(255), nullable=True)
+    winner_registration_id = Column(Integer, nullable=True)
     status = Column(String(50), nullable=False, default="scheduled")
     bracket_match_number = Column(Integer, nullable=True, index=True)
     next_match_id = Column(Integer, nullable=True)
+    next_match_slot = Column(Integer, nullable=True)
+    loser_next_match_id = Column(Integer, nullable=True)
+    loser_next_match_slot = Column(Integer, nullable=True)
+    stage = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     def __repr__(self) -> str:
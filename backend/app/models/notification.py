@@ -7,7 +7,7 @@ from app.core.database import Base
 
 class Notification(Base):
     __tablename__ = "notifications"
-    __table_args__ = (Index("ix_notifications_user_read", "user_id", "read"),)
+    __table_args__ = (Index("ix_notifications_user_read", "user_id", "read"), {"sqlite_autoincrement": True})
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, nullable=False, index=True)
@@ -1,12 +1,13 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
 
 from app.core.database import Base
 
 
 class Tournament(Base):
     __tablename__ = "tournaments"
+    __table_args__ = (Index("ix_tournament_start_created", "start_date", "created_at"), {"sqlite_autoincrement": True})
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False, index=True)
@@ -20,6 +21,10 @@ class Tournament(Base):
     prize_pool = Column(Integer, nullable=False, default=0)
     entry_fee = Column(Integer, nullable=False, default=0)
     max_teams = Column(Integer, nullable=False, default=16)
+    current_stage = Column(Integer, nullable=False, default=1)
+    participants_count = Column(Integer, nullable=False, default=0)
+    matches_count = Column(Integer, nullable=False, default=0)
+    version = Column(Integer, nullable=False, default=0)
     created_by_user_id = Column(Integer, nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
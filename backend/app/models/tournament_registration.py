@@ -11,6 +11,8 @@ class TournamentRegistration(Base):
         UniqueConstraint("tournament_id", "user_id", name="uq_registration_tournament_user"),
         Index("ix_registration_tournament_id", "tournament_id"),
         Index("ix_registration_user_id", "user_id"),
+        Index("ix_registration_tournament_points_created", "tournament_id", "points", "created_at"),
+        {"sqlite_autoincrement": True},
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -19,6 +21,10 @@ class TournamentRegistration(Base):
     team_name = Column(String(255), nullable=False)
     status = Column(String(50), nullable=False, default="registered")
     points = Column(Integer, nullable=False, default=0)
+    buchholz = Column(Integer, nullable=False, default=0)
+    sonneborn_berger = Column(Integer, nullable=False, default=0)
+    group_name = Column(String(20), nullable=True)
+    lobby_number = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     def __repr__(self) -> str:  # pragma: no cover - developer convenience
@@ -0,0 +1,116 @@
+"""Move completed tournaments and old read notifications into the archive tables.
+
+Each tournament moves together with all of its child rows in one
+transaction, ``batch_size`` tournaments at a time, so the job can run against
+a live database and simply resumes where it stopped. Candidate tournaments
+are locked before copying, and every write path takes the same row lock
+before writing any child row, so no child row can arrive between the copy and
+the delete and the two sides never wait on each other in opposite order. Archived
+tournaments stay readable through ``find_tournament``.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Callable, Sequence
+
+from sqlalchemy import ColumnElement, DateTime, Row, Table, delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.archive import ARCHIVED_TABLES, HOT_TABLES, TournamentTables, notifications_archive
+from app.models.notification import Notification
+
+NOTIFICATION_BATCH_SIZE = 5000
+
+
+async def find_tournament(
+    session: AsyncSession, tournament_id: int, columns: Sequence[str] | None = None
+) -> tuple[TournamentTables, Row] | None:
+    """The tournament's row and the tables holding its rows, looking in the hot tables first.
+
+    ``columns`` limits the row to the named columns.
+    """
+    for tables in (HOT_TABLES, ARCHIVED_TABLES):
+        selected = [tables.tournaments] if columns is None else [tables.tournaments.c[name] for name in columns]
+        row = (await session.execute(select(*selected).where(tables.tournaments.c.id == tournament_id))).first()
+        if row is not None:
+            return tables, row
+    return None
+
+
+async def _move(session: AsyncSession, source: Table, target: Table, condition: ColumnElement[bool], archived_at: datetime) -> int:
+    columns = [column.name for column in source.columns]
+    await session.execute(
+        insert(target).from_select(
+            [*columns, "archived_at"],
+            select(*source.columns, literal(archived_at, DateTime)).where(condition),
+        )
+    )
+    return (await session.execute(delete(source).where(condition))).rowcount
+
+
+async def archive_completed_tournaments(
+    session_factory: Callable[[], AsyncSession],
+    older_than: timedelta,
+    batch_size: int,
+) -> dict:
+    """Archive completed tournaments that ended before ``older_than`` ago, plus read notifications as old.
+
+    Returns how many rows moved out of each hot table and how many remain.
+    """
+    cutoff = datetime.utcnow() - older_than
+    moved: Counter[str] = Counter()
+    tournaments = HOT_TABLES.tournaments
+    candidates = (
+        select(tournaments.c.id)
+        .where(
+            tournaments.c.status == "completed",
+            func.coalesce(tournaments.c.end_date, tournaments.c.start_date, tournaments.c.created_at) < cutoff,
+        )
+        .order_by(tournaments.c.id)
+        .limit(batch_size)
+        .with_for_update()
+    )
+    while True:
+        async with session_factory() as session:
+            ids = (await session.execute(candidates)).scalars().all()
+            if not ids:
+                break
+            archived_at = datetime.utcnow()
+            for source, target in zip(HOT_TABLES.children, ARCHIVED_TABLES.children):
+                moved[source.name] += await _move(session, source, target, source.c.tournament_id.in_(ids), archived_at)
+            moved[tournaments.name] += await _move(session, tournaments, ARCHIVED_TABLES.tournaments, tournaments.c.id.in_(ids), archived_at)
+            await session.commit()
+
+    notifications = Notification.__table__
+    read_notifications = (
+        select(notifications.c.id)
+        .where(notifications.c.read == 1, notifications.c.created_at < cutoff)
+        .order_by(notifications.c.id)
+        .limit(NOTIFICATION_BATCH_SIZE)
+    )
+    while True:
+        async with session_factory() as session:
+            ids = (await session.execute(read_notifications)).scalars().all()
+            if not ids:
+                break
+            moved[notifications.name] += await _move(session, notifications, notifications_archive, notifications.c.id.in_(ids), datetime.utcnow())
+            await session.commit()
+
+    hot = (tournaments, *HOT_TABLES.children, notifications)
+    async with session_factory() as session:
+        remaining = {table.name: (await session.execute(select(func.count()).select_from(table))).scalar_one() for table in hot}
+    return {
+        "cutoff": cutoff,
+        "tables": {
+            table.name: {
+                "moved": moved[table.name],
+                "remaining": remaining[table.name],
+                "shrunk_percent": round(100 * moved[table.name] / (moved[table.name] + remaining[table.name]), 1)
+                if moved[table.name]
+                else 0.0,
+            }
+            for table in hot
+        },
+    }
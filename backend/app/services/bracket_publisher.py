@@ -0,0 +1,316 @@
+"""Persist generated brackets as ``Match`` rows and move results along their routes.
+
+Team names are display fields; every seated side also carries its
+registration id, which follows the team as it is routed through the bracket.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Sequence
+
+from sqlalchemy import and_, exists, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.match import Match
+from app.services.brackets import (
+    ELIMINATION_FORMATS,
+    NO_MATCH,
+    CompactBracket,
+    bracket_topology,
+    build_compact_bracket,
+    iter_bracket,
+)
+from app.models.tournament_registration import TournamentRegistration
+from app.services.counters import record_tournament_change
+from app.services.standings import load_ledger, save_ledger
+
+BYE = "BYE"
+TBD = "TBD"
+_SLOT_COLUMNS = (("team_a", "team_a_registration_id"), ("team_b", "team_b_registration_id"))
+BULK_CHUNK_SIZE = 5000
+
+# A seated side: display name and registration id (None for BYE/TBD).
+Side = tuple[str, int | None]
+
+
+class BracketConflict(ValueError):
+    """Raised when a routed slot is already held by a different team."""
+
+
+def registration_index(registrations: Iterable[TournamentRegistration]) -> dict[str, int]:
+    """Registration ids by the normalized team names the bracket builders use."""
+    return {registration.team_name.strip(): registration.id for registration in registrations}
+
+
+def _side(match: Match, slot: int) -> Side:
+    name_column, id_column = _SLOT_COLUMNS[slot]
+    return getattr(match, name_column), getattr(match, id_column)
+
+
+def _outcome(match: Match) -> tuple[Side, Side]:
+    winner = match.winner or BYE
+    if winner == match.team_a:
+        return _side(match, 0), _side(match, 1)
+    if winner == match.team_b:
+        return _side(match, 1), _side(match, 0)
+    return (winner, match.winner_registration_id), _side(match, 0)
+
+
+def _settle_bye(match: Match) -> bool:
+    """Finish a match that a bye decides, returning whether anything changed."""
+    if match.status == "finished" or TBD in (match.team_a, match.team_b):
+        return False
+    if BYE not in (match.team_a, match.team_b):
+        return False
+    match.status = "finished"
+    winner = _side(match, 1 if match.team_a == BYE else 0)
+    match.winner, match.winner_registration_id = (None, None) if winner[0] == BYE else winner
+    return True
+
+
+def _seat(match: Match, slot: int | None, side: Side) -> bool:
+    """Place ``side`` into ``slot``; returns False when it was already there."""
+    team = side[0]
+    if slot is None:
+        # Rows published before routing slots existed fill the first open side.
+        if team in (match.team_a, match.team_b):
+            return False
+        slot = 0 if match.team_a == TBD else 1
+    name_column, id_column = _SLOT_COLUMNS[slot]
+    current = getattr(match, name_column)
+    if current == team:
+        return False
+    if current != TBD:
+        raise BracketConflict("Next match already has two participants")
+    setattr(match, name_column, team)
+    setattr(match, id_column, side[1])
+    return True
+
+
+async def publish_bracket(
+    session: AsyncSession,
+    tournament_id: int,
+    format_name: str,
+    teams: Sequence[str],
+    registration_ids: Mapping[str, int] | None = None,
+) -> list[Match]:
+    """Add every match of the bracket to ``session`` with its routing resolved.
+
+    Elimination formats get winner/loser destinations from the cached topology
+    and have byes settled in a single pass; other formats are persisted as-is.
+    ``registration_ids`` (see ``registration_index``) links each seated team to
+    its registration. The caller owns the transaction.
+    """
+    ids = registration_ids or {}
+    if format_name.strip().lower() not in ELIMINATION_FORMATS:
+        matches = [
+            Match(
+                tournament_id=tournament_id,
+                round_name=slot.round_name,
+                team_a=slot.team_a or TBD,
+                team_b=slot.team_b or BYE,
+                team_a_registration_id=ids.get(slot.team_a),
+                team_b_registration_id=ids.get(slot.team_b),
+                status="finished" if slot.team_b is None else "scheduled",
+                winner=slot.team_a if slot.team_b is None else None,
+                winner_registration_id=ids.get(slot.team_a) if slot.team_b is None else None,
+                bracket_match_number=slot.match_number,
+            )
+            for slot in iter_bracket(format_name, teams)
+        ]
+        await record_tournament_change(session, tournament_id, matches=len(matches))
+        session.add_all(matches)
+        await session.flush()
+        return matches
+
+    bracket = build_compact_bracket(format_name, teams)
+    topology = bracket_topology(format_name, 1 << (len(bracket.teams) - 1).bit_length())
+    fed = topology.fed_slots()
+    matches = []
+    for index in range(len(bracket)):
+        sides = []
+        for slot, column in enumerate((bracket.slot_a, bracket.slot_b)):
+            team = bracket.team_name(column[index])
+            if team is None:
+                team = TBD if (index, slot) in fed else BYE
+            sides.append(team)
+        matches.append(
+            Match(
+                tournament_id=tournament_id,
+                round_name=bracket.round_labels[bracket.round_ids[index]],
+                team_a=sides[0],
+                team_b=sides[1],
+                team_a_registration_id=ids.get(sides[0]),
+                team_b_registration_id=ids.get(sides[1]),
+                status="scheduled",
+                bracket_match_number=bracket.match_numbers[index],
+            )
+        )
+    await record_tournament_change(session, tournament_id, matches=len(matches))
+    session.add_all(matches)
+    await session.flush()
+
+    for index, match in enumerate(matches):
+        if topology.winner_to[index] != NO_MATCH:
+            match.next_match_id = matches[topology.winner_to[index]].id
+            match.next_match_slot = topology.winner_slot[index]
+        if topology.loser_to[index] != NO_MATCH:
+            match.loser_next_match_id = matches[topology.loser_to[index]].id
+            match.loser_next_match_slot = topology.loser_slot[index]
+
+    # Match numbers are a topological order, so one pass settles cascading byes.
+    for index, match in enumerate(matches):
+        if not _settle_bye(match):
+            continue
+        winner, loser = _outcome(match)
+        if topology.winner_to[index] != NO_MATCH:
+            _seat(matches[topology.winner_to[index]], topology.winner_slot[index], winner)
+        if topology.loser_to[index] != NO_MATCH:
+            _seat(matches[topology.loser_to[index]], topology.loser_slot[index], loser)
+    return matches
+
+
+async def publish_schedule(
+    session: AsyncSession,
+    tournament_id: int,
+    bracket: CompactBracket,
+    chunk_size: int = BULK_CHUNK_SIZE,
+    stage: int | None = None,
+    registration_ids: Mapping[str, int] | None = None,
+) -> int:
+    """Bulk-insert a fully seated schedule (e.g. a round robin) without ORM objects.
+
+    Rows are built per chunk straight from the bracket columns and sent as
+    executemany batches. Returns the number of matches inserted.
+    """
+    teams, labels = bracket.teams, bracket.round_labels
+    ids = [(registration_ids or {}).get(team) for team in teams]
+    await record_tournament_change(session, tournament_id, matches=len(bracket))
+    for start in range(0, len(bracket), chunk_size):
+        stop = min(start + chunk_size, len(bracket))
+        await session.execute(
+            insert(Match),
+            [
+                {
+                    "tournament_id": tournament_id,
+                    "round_name": labels[bracket.round_ids[index]],
+                    "team_a": teams[bracket.slot_a[index]],
+                    "team_b": teams[bracket.slot_b[index]],
+                    "team_a_registration_id": ids[bracket.slot_a[index]],
+                    "team_b_registration_id": ids[bracket.slot_b[index]],
+                    "status": "scheduled",
+                    "bracket_match_number": bracket.match_numbers[index],
+                    "stage": stage,
+                }
+                for index in range(start, stop)
+            ],
+        )
+    return len(bracket)
+
+
+async def publish_byes(
+    session: AsyncSession,
+    tournament_id: int,
+    byes: Sequence[tuple[str, str]],
+    registration_ids: Mapping[str, int] | None = None,
+    stage: int | None = None,
+    first_number: int | None = None,
+) -> list[Match]:
+    """Persist ``(round name, team)`` byes as finished wins and score them like any other win.
+
+    Standard Swiss scoring gives a bye a full win; with no opponent it adds
+    nothing to anyone's Buchholz or Sonneborn-Berger. ``first_number``
+    numbers the bye matches consecutively. The caller owns the transaction.
+    """
+    if not byes:
+        return []
+    ids = registration_ids or {}
+    matches = [
+        Match(
+            tournament_id=tournament_id,
+            round_name=round_name,
+            team_a=team,
+            team_b=BYE,
+            team_a_registration_id=ids.get(team),
+            status="finished",
+            winner=team,
+            winner_registration_id=ids.get(team),
+            bracket_match_number=None if first_number is None else first_number + offset,
+            stage=stage,
+        )
+        for offset, (round_name, team) in enumerate(byes)
+    ]
+    await record_tournament_change(session, tournament_id, matches=len(matches))
+    session.add_all(matches)
+    await session.flush()
+    ledger = await load_ledger(session, tournament_id, {match.winner_registration_id for match in matches} - {None})
+    for match in matches:
+        ledger.add_result(match.id, match.winner_registration_id, None)
+    await save_ledger(session, ledger)
+    return matches
+
+
+async def advance_match(session: AsyncSession, match: Match) -> dict:
+    """Route a finished match's winner and loser, settling any byes they reach.
+
+    Each hop is a primary-key lookup on the stored destination, so the cost is
+    bounded by the number of consecutive byes rather than the bracket size.
+    """
+    result = {"next_match_id": match.next_match_id, "loser_next_match_id": match.loser_next_match_id, "already_advanced": True}
+    pending = [match]
+    while pending:
+        source = pending.pop()
+        winner, loser = _outcome(source)
+        routes = (
+            (source.next_match_id, source.next_match_slot, winner),
+            (source.loser_next_match_id, source.loser_next_match_slot, loser),
+        )
+        for target_id, slot, side in routes:
+            if target_id is None:
+                continue
+            target = await session.get(Match, target_id)
+            if target is None:
+                continue
+            if _seat(target, slot, side):
+                result["already_advanced"] = False
+                if _settle_bye(target):
+                    pending.append(target)
+    return result
+
+
+async def unlinked_match_tournaments(session: AsyncSession) -> list[int]:
+    """Tournaments with a match side or winner named after a registration but not linked to it yet."""
+    unlinked = (
+        and_(
+            getattr(Match, id_column).is_(None),
+            exists().where(
+                TournamentRegistration.tournament_id == Match.tournament_id,
+                TournamentRegistration.team_name == getattr(Match, name_column),
+            ),
+        )
+        for name_column, id_column in (*_SLOT_COLUMNS, ("winner", "winner_registration_id"))
+    )
+    return list((await session.execute(select(Match.tournament_id).where(or_(*unlinked)).distinct())).scalars().all())
+
+
+async def link_match_registrations(session: AsyncSession, tournament_id: int | None = None) -> None:
+    """Fill missing registration ids on matches from their team names (backfill only)."""
+
+    def registration_of(team_column):
+        return (
+            select(TournamentRegistration.id)
+            .where(TournamentRegistration.tournament_id == Match.tournament_id, TournamentRegistration.team_name == team_column)
+            .correlate(Match)
+            .limit(1)
+            .scalar_subquery()
+        )
+
+    for name_column, id_column in (*_SLOT_COLUMNS, ("winner", "winner_registration_id")):
+        statement = (
+            update(Match)
+            .where(and_(getattr(Match, id_column).is_(None), getattr(Match, name_column).is_not(None)))
+            .values({id_column: registration_of(getattr(Match, name_column))})
+        )
+        if tournament_id is not None:
+            statement = statement.where(Match.tournament_id == tournament_id)
+        await session.execute(statement.execution_options(synchronize_session=False))
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
+from functools import lru_cache
 from math import log2
-from typing import Sequence
+from typing import Callable, Iterable, Iterator, Sequence, overload
 
-SUPPORTED_FORMATS = {"single elimination", "double elimination", "round robin", "swiss"}
+SUPPORTED_FORMATS = {"single elimination", "double elimination", "round robin", "double round robin", "swiss"}
+ELIMINATION_FORMATS = {"single elimination", "double elimination"}
+BRACKET_KINDS = ("main", "losers", "grand_final")
+NO_TEAM = -1
+NO_MATCH = -1
 
 
 @dataclass(frozen=True)
@@ -18,6 +24,96 @@ class MatchSlot:
     bracket: str = "main"
 
 
+class CompactBracket:
+    """Struct-of-arrays bracket: one row per fixture, strings stored once.
+
+    Team slots hold indices into ``teams`` (``NO_TEAM`` for an empty or bye
+    slot), round ids index ``round_labels`` and kinds index ``BRACKET_KINDS``.
+    Slicing shares the lookup tables and copies only the integer columns.
+    """
+
+    __slots__ = ("teams", "round_labels", "round_ids", "match_numbers", "slot_a", "slot_b", "kinds")
+
+    def __init__(
+        self,
+        teams: Sequence[str],
+        round_labels: Sequence[str],
+        round_ids: array | None = None,
+        match_numbers: array | None = None,
+        slot_a: array | None = None,
+        slot_b: array | None = None,
+        kinds: array | None = None,
+    ) -> None:
+        self.teams = tuple(teams)
+        self.round_labels = list(round_labels)
+        self.round_ids = round_ids if round_ids is not None else array("i")
+        self.match_numbers = match_numbers if match_numbers is not None else array("i")
+        self.slot_a = slot_a if slot_a is not None else array("i")
+        self.slot_b = slot_b if slot_b is not None else array("i")
+        self.kinds = kinds if kinds is not None else array("b")
+
+    @classmethod
+    def from_slots(cls, slots: Iterable[MatchSlot], teams: Sequence[str]) -> CompactBracket:
+        team_index = {team: index for index, team in enumerate(teams)}
+        kind_index = {kind: index for index, kind in enumerate(BRACKET_KINDS)}
+        label_index: dict[str, int] = {}
+        bracket = cls(teams, [])
+        for slot in slots:
+            round_id = label_index.get(slot.round_name)
+            if round_id is None:
+                round_id = label_index[slot.round_name] = len(bracket.round_labels)
+                bracket.round_labels.append(slot.round_name)
+            bracket.round_ids.append(round_id)
+            bracket.match_numbers.append(slot.match_number)
+            bracket.slot_a.append(NO_TEAM if slot.team_a is None else team_index[slot.team_a])
+            bracket.slot_b.append(NO_TEAM if slot.team_b is None else team_index[slot.team_b])
+            bracket.kinds.append(kind_index[slot.bracket])
+        return bracket
+
+    def __len__(self) -> int:
+        return len(self.match_numbers)
+
+    @overload
+    def __getitem__(self, index: int) -> MatchSlot: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> CompactBracket: ...
+
+    def __getitem__(self, index: int | slice) -> MatchSlot | CompactBracket:
+        if isinstance(index, slice):
+            return CompactBracket(
+                self.teams,
+                self.round_labels,
+                self.round_ids[index],
+                self.match_numbers[index],
+                self.slot_a[index],
+                self.slot_b[index],
+                self.kinds[index],
+            )
+        return MatchSlot(
+            self.round_labels[self.round_ids[index]],
+            self.match_numbers[index],
+            self.team_name(self.slot_a[index]),
+            self.team_name(self.slot_b[index]),
+            BRACKET_KINDS[self.kinds[index]],
+        )
+
+    def __iter__(self) -> Iterator[MatchSlot]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def team_name(self, team_index: int) -> str | None:
+        return None if team_index == NO_TEAM else self.teams[team_index]
+
+    def to_slots(self) -> list[MatchSlot]:
+        return list(self)
+
+    @property
+    def nbytes(self) -> int:
+        columns = (self.round_ids, self.match_numbers, self.slot_a, self.slot_b, self.kinds)
+        return sum(column.itemsize * len(column) for column in columns)
+
+
 def _validate_teams(teams: Sequence[str]) -> list[str]:
     normalized = [team.strip() for team in teams]
     if len(normalized) < 2:
@@ -44,81 +140,357 @@ def _round_label(index: int, total_rounds: int) -> str:
     return f"Round {index + 1}"
 
 
-def generate_single_elimination(teams: Sequence[str]) -> list[MatchSlot]:
-    normalized = _validate_teams(teams)
-    size = _next_power_of_two(len(normalized))
-    total_rounds = int(log2(size))
-    seeded = normalized + [None] * (size - len(normalized))
-    slots: list[MatchSlot] = []
-    match_number = 1
+@dataclass(frozen=True)
+class BracketTopology:
+    """Team-independent layout of an elimination bracket for one padded field size.
 
-    for index in range(0, size, 2):
-        slots.append(MatchSlot(_round_label(0, total_rounds), match_number, seeded[index], seeded[index + 1]))
-        match_number += 1
+    Every column is indexed by ``match_number - 1``. ``winner_to`` and
+    ``loser_to`` hold the index of the match the winner/loser feeds
+    (``NO_MATCH`` when they leave the bracket) and ``winner_slot`` /
+    ``loser_slot`` whether they land in ``team_a`` (0) or ``team_b`` (1), so
+    advancing a result is a constant-time lookup. The arrays are shared by
+    every caller of ``bracket_topology`` and must not be mutated.
+    """
 
-    for round_index in range(1, total_rounds):
-        for _ in range(size // (2 ** (round_index + 1))):
-            slots.append(MatchSlot(_round_label(round_index, total_rounds), match_number, None, None))
-            match_number += 1
-    return slots
+    format_name: str
+    size: int
+    round_labels: tuple[str, ...]
+    round_starts: tuple[int, ...]
+    round_ids: array
+    kinds: array
+    winner_to: array
+    winner_slot: array
+    loser_to: array
+    loser_slot: array
 
+    def __len__(self) -> int:
+        return len(self.round_ids)
 
-def generate_double_elimination(teams: Sequence[str]) -> list[MatchSlot]:
-    normalized = _validate_teams(teams)
-    winners = generate_single_elimination(normalized)
-    size = _next_power_of_two(len(normalized))
-    winners_rounds = int(log2(size))
-    losers_slots: list[MatchSlot] = []
-    match_number = len(winners) + 1
+    @property
+    def first_round_matches(self) -> int:
+        return self.size // 2
 
+    def bye_matches(self, team_count: int) -> range:
+        """First-round match indices whose ``team_b`` seed is padding."""
+        return range(team_count // 2, self.first_round_matches)
+
+    def fed_slots(self) -> set[tuple[int, int]]:
+        """``(match index, slot)`` pairs that receive a winner or loser from another match."""
+        fed: set[tuple[int, int]] = set()
+        for index in range(len(self)):
+            if self.winner_to[index] != NO_MATCH:
+                fed.add((self.winner_to[index], self.winner_slot[index]))
+            if self.loser_to[index] != NO_MATCH:
+                fed.add((self.loser_to[index], self.loser_slot[index]))
+        return fed
+
+
+class _TopologyBuilder:
+    def __init__(self, format_name: str, size: int) -> None:
+        self.format_name = format_name
+        self.size = size
+        self.round_labels: list[str] = []
+        self.round_starts: list[int] = []
+        self.round_ids = array("i")
+        self.kinds = array("b")
+        self.winner_to = array("i")
+        self.winner_slot = array("b")
+        self.loser_to = array("i")
+        self.loser_slot = array("b")
+
+    def add_round(self, label: str, matches: int, kind: str = "main") -> int:
+        first = len(self.round_ids)
+        round_id = len(self.round_labels)
+        self.round_labels.append(label)
+        self.round_starts.append(first)
+        kind_id = BRACKET_KINDS.index(kind)
+        for _ in range(matches):
+            self.round_ids.append(round_id)
+            self.kinds.append(kind_id)
+            self.winner_to.append(NO_MATCH)
+            self.winner_slot.append(0)
+            self.loser_to.append(NO_MATCH)
+            self.loser_slot.append(0)
+        return first
+
+    def route_winner(self, source: int, target: int, slot: int) -> None:
+        self.winner_to[source] = target
+        self.winner_slot[source] = slot
+
+    def route_loser(self, source: int, target: int, slot: int) -> None:
+        self.loser_to[source] = target
+        self.loser_slot[source] = slot
+
+    def build(self) -> BracketTopology:
+        return BracketTopology(
+            self.format_name,
+            self.size,
+            tuple(self.round_labels),
+            tuple(self.round_starts),
+            self.round_ids,
+            self.kinds,
+            self.winner_to,
+            self.winner_slot,
+            self.loser_to,
+            self.loser_slot,
+        )
+
+
+def _add_winners_bracket(builder: _TopologyBuilder) -> list[int]:
+    size = builder.size
+    total_rounds = int(log2(size))
+    starts: list[int] = []
+    for round_index in range(total_rounds):
+        first = builder.add_round(_round_label(round_index, total_rounds), size // (2 ** (round_index + 1)))
+        if starts:
+            previous = starts[-1]
+            for offset in range(first - previous):
+                builder.route_winner(previous + offset, first + offset // 2, offset % 2)
+        starts.append(first)
+    return starts
+
+
+def _add_losers_bracket(builder: _TopologyBuilder, winners_starts: list[int]) -> int:
+    """Lay out the losers bracket and route every winners-bracket loser into it.
+
+    Losers round 1 pairs the first-round losers. Each later winners round drops
+    its losers into an odd losers round (in reverse order, to delay rematches)
+    against the survivors of the previous losers round, and even losers rounds
+    halve the field. Returns the index of the losers-bracket final.
+    """
+    size = builder.size
+    winners_rounds = len(winners_starts)
+    previous = first = 0
     for round_index in range(max(1, 2 * (winners_rounds - 1))):
         matches_in_round = max(1, size // (2 ** ((round_index // 2) + 2)))
-        for _ in range(matches_in_round):
-            losers_slots.append(MatchSlot(f"Losers Round {round_index + 1}", match_number, None, None, "losers"))
-            match_number += 1
+        first = builder.add_round(f"Losers Round {round_index + 1}", matches_in_round, "losers")
+        if round_index == 0:
+            feeder = winners_starts[0]
+            for offset in range(size // 2):
+                builder.route_loser(feeder + offset, first + offset // 2, offset % 2)
+        elif round_index % 2:
+            feeder = winners_starts[(round_index + 1) // 2]
+            for offset in range(matches_in_round):
+                builder.route_winner(previous + offset, first + offset, 0)
+                builder.route_loser(feeder + matches_in_round - 1 - offset, first + offset, 1)
+        else:
+            for offset in range(2 * matches_in_round):
+                builder.route_winner(previous + offset, first + offset // 2, offset % 2)
+        previous = first
+    return first
 
-    losers_slots.append(MatchSlot("Grand Final", match_number, None, None, "grand_final"))
-    return winners + losers_slots
 
+def _build_topology(format_key: str, size: int) -> BracketTopology:
+    builder = _TopologyBuilder(format_key, size)
+    winners_starts = _add_winners_bracket(builder)
+    if format_key == "double elimination":
+        losers_final = _add_losers_bracket(builder, winners_starts)
+        grand_final = builder.add_round("Grand Final", 1, "grand_final")
+        builder.route_winner(winners_starts[-1], grand_final, 0)
+        builder.route_winner(losers_final, grand_final, 1)
+    return builder.build()
 
-def generate_round_robin(teams: Sequence[str]) -> list[MatchSlot]:
+
+@lru_cache(maxsize=128)
+def _cached_topology(format_key: str, size: int) -> BracketTopology:
+    return _build_topology(format_key, size)
+
+
+def bracket_topology(format_name: str, size: int) -> BracketTopology:
+    """Return the cached topology for an elimination format and power-of-two size."""
+    format_key = format_name.strip().lower()
+    if format_key not in ELIMINATION_FORMATS:
+        raise ValueError(f"Unsupported elimination format: {format_name}")
+    if size < 2 or size & (size - 1):
+        raise ValueError("Bracket size must be a power of two")
+    return _cached_topology(format_key, size)
+
+
+def topology_cache_stats() -> dict[str, int]:
+    info = _cached_topology.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "maxsize": info.maxsize or 0, "currsize": info.currsize}
+
+
+def _seeded_slots(topology: BracketTopology, teams: list[str]) -> tuple[array, array]:
+    """Map the team list onto the topology: seeds fill the first round in order."""
+    slot_a = array("i", [NO_TEAM]) * len(topology)
+    slot_b = array("i", [NO_TEAM]) * len(topology)
+    for index in range(len(teams)):
+        target = slot_b if index % 2 else slot_a
+        target[index // 2] = index
+    return slot_a, slot_b
+
+
+def _map_topology(format_name: str, teams: Sequence[str]) -> CompactBracket:
+    normalized = _validate_teams(teams)
+    topology = bracket_topology(format_name, _next_power_of_two(len(normalized)))
+    slot_a, slot_b = _seeded_slots(topology, normalized)
+    return CompactBracket(
+        normalized,
+        topology.round_labels,
+        array("i", topology.round_ids),
+        array("i", range(1, len(topology) + 1)),
+        slot_a,
+        slot_b,
+        array("b", topology.kinds),
+    )
+
+
+def _iter_topology(format_name: str, teams: Sequence[str]) -> Iterator[MatchSlot]:
+    normalized = _validate_teams(teams)
+    topology = bracket_topology(format_name, _next_power_of_two(len(normalized)))
+    labels, round_ids, kinds = topology.round_labels, topology.round_ids, topology.kinds
+    team_count = len(normalized)
+    for index in range(len(topology)):
+        team_a = team_b = None
+        if index < topology.first_round_matches:
+            seed = 2 * index
+            team_a = normalized[seed] if seed < team_count else None
+            team_b = normalized[seed + 1] if seed + 1 < team_count else None
+        yield MatchSlot(labels[round_ids[index]], index + 1, team_a, team_b, BRACKET_KINDS[kinds[index]])
+
+
+def iter_single_elimination(teams: Sequence[str]) -> Iterator[MatchSlot]:
+    return _iter_topology("single elimination", teams)
+
+
+def iter_double_elimination(teams: Sequence[str]) -> Iterator[MatchSlot]:
+    return _iter_topology("double elimination", teams)
+
+
+def iter_round_robin(teams: Sequence[str]) -> Iterator[MatchSlot]:
+    """Yield circle-method fixtures round by round without materialising the schedule.
+
+    Seat ``0`` stays fixed while the other seats rotate one step per round; the
+    rotation is computed arithmetically so memory stays flat regardless of size.
+    """
     working: list[str | None] = list(_validate_teams(teams))
     if len(working) % 2:
         working.append(None)
 
-    slots: list[MatchSlot] = []
+    size = len(working)
+    ring = size - 1
     match_number = 1
-    for round_index in range(len(working) - 1):
-        for index in range(len(working) // 2):
-            team_a, team_b = working[index], working[-index - 1]
+    for round_index in range(ring):
+        label = f"Round {round_index + 1}"
+        for index in range(size // 2):
+            team_a = working[0] if index == 0 else working[1 + (index - 1 - round_index) % ring]
+            team_b = working[1 + (size - 2 - index - round_index) % ring]
             if team_a is not None and team_b is not None:
-                slots.append(MatchSlot(f"Round {round_index + 1}", match_number, team_a, team_b))
+                yield MatchSlot(label, match_number, team_a, team_b)
                 match_number += 1
-        working = [working[0], working[-1], *working[1:-1]]
-    return slots
 
 
-def generate_swiss(teams: Sequence[str]) -> list[MatchSlot]:
-    """Create the deterministic first Swiss round; later rounds are result-driven."""
+def build_round_robin_schedule(teams: Sequence[str], double_round: bool = False) -> CompactBracket:
+    """Build the whole circle-method schedule as columns, one slice operation per round.
+
+    Uses the Berger arrangement: the last seat is fixed and meets seat ``r`` in
+    round ``r`` while seats ``r + k`` and ``r - k`` meet each other. Orienting
+    odd ``k`` pairs one way and even ``k`` the other keeps every team within
+    one home game of its away count with the minimum number of consecutive
+    home/away breaks; ``team_a`` is the home side. With an odd field the fixed
+    seat is the bye, so each team rests exactly once per cycle. A double round
+    robin appends the mirrored second leg with home and away swapped.
+    """
+    normalized = _validate_teams(teams)
+    seats = len(normalized) + len(normalized) % 2
+    ring = seats - 1
+    half = seats // 2
+    fixed_is_bye = seats != len(normalized)
+    doubled = list(range(ring)) * 2
+
+    bracket = CompactBracket(normalized, [])
+    home_column, away_column = bracket.slot_a, bracket.slot_b
+    for round_index in range(ring):
+        up = doubled[round_index + 1 : round_index + half]
+        down = doubled[ring + round_index - 1 : ring + round_index - half : -1]
+        home, away = up[:], down[:]
+        home[1::2], away[1::2] = down[1::2], up[1::2]
+        if not fixed_is_bye:
+            fixed_pair = (round_index, ring) if round_index % 2 == 0 else (ring, round_index)
+            home.insert(0, fixed_pair[0])
+            away.insert(0, fixed_pair[1])
+        bracket.round_labels.append(f"Round {round_index + 1}")
+        bracket.round_ids.extend(array("i", [round_index]) * len(home))
+        home_column.extend(home)
+        away_column.extend(away)
+
+    if double_round:
+        first_leg = len(home_column)
+        bracket.round_labels.extend(f"Round {ring + index + 1}" for index in range(ring))
+        bracket.round_ids.extend(round_id + ring for round_id in bracket.round_ids[:first_leg])
+        home_column.extend(away_column[:first_leg])
+        away_column.extend(home_column[:first_leg])
+
+    bracket.match_numbers.extend(range(1, len(home_column) + 1))
+    bracket.kinds.extend(array("b", [0]) * len(home_column))
+    return bracket
+
+
+def iter_double_round_robin(teams: Sequence[str]) -> Iterator[MatchSlot]:
+    return iter(build_round_robin_schedule(teams, double_round=True))
+
+
+def iter_swiss(teams: Sequence[str]) -> Iterator[MatchSlot]:
+    """Yield the deterministic first Swiss round; later rounds are result-driven."""
     normalized = _validate_teams(teams)
-    slots: list[MatchSlot] = []
     match_number = 1
     for index in range(0, len(normalized) - 1, 2):
-        slots.append(MatchSlot("Swiss Round 1", match_number, normalized[index], normalized[index + 1]))
+        yield MatchSlot("Swiss Round 1", match_number, normalized[index], normalized[index + 1])
         match_number += 1
     if len(normalized) % 2:
-        slots.append(MatchSlot("Swiss Round 1", match_number, normalized[-1], None))
-    return slots
+        yield MatchSlot("Swiss Round 1", match_number, normalized[-1], None)
+
+
+_ITERATORS: dict[str, Callable[[Sequence[str]], Iterator[MatchSlot]]] = {
+    "single elimination": iter_single_elimination,
+    "double elimination": iter_double_elimination,
+    "round robin": iter_round_robin,
+    "double round robin": iter_double_round_robin,
+    "swiss": iter_swiss,
+}
+
+
+def iter_bracket(format_name: str, teams: Sequence[str]) -> Iterator[MatchSlot]:
+    """Stream the slots of a bracket in match-number order, one round after another.
+
+    Team validation and format lookup happen eagerly so callers get a
+    ``ValueError`` at call time rather than on the first ``next()``.
+    """
+    iterator = _ITERATORS.get(format_name.strip().lower())
+    if iterator is None:
+        raise ValueError(f"Unsupported tournament format: {format_name}")
+    _validate_teams(teams)
+    return iterator(teams)
+
+
+def build_compact_bracket(format_name: str, teams: Sequence[str]) -> CompactBracket:
+    """Stream ``iter_bracket`` straight into columns without keeping the slots."""
+    format_key = format_name.strip().lower()
+    if format_key in ELIMINATION_FORMATS:
+        return _map_topology(format_name, teams)
+    if format_key == "double round robin":
+        return build_round_robin_schedule(teams, double_round=True)
+    slots = iter_bracket(format_name, teams)
+    return CompactBracket.from_slots(slots, _validate_teams(teams))
+
+
+def generate_single_elimination(teams: Sequence[str]) -> list[MatchSlot]:
+    return list(iter_single_elimination(teams))
+
+
+def generate_double_elimination(teams: Sequence[str]) -> list[MatchSlot]:
+    return list(iter_double_elimination(teams))
+
+
+def generate_round_robin(teams: Sequence[str]) -> list[MatchSlot]:
+    return list(iter_round_robin(teams))
+
+
+def generate_swiss(teams: Sequence[str]) -> list[MatchSlot]:
+    """Create the deterministic first Swiss round; later rounds are result-driven."""
+    return list(iter_swiss(teams))
 
 
 def generate_bracket(format_name: str, teams: Sequence[str]) -> list[MatchSlot]:
-    key = format_name.strip().lower()
-    if key == "single elimination":
-        return generate_single_elimination(teams)
-    if key == "double elimination":
-        return generate_double_elimination(teams)
-    if key == "round robin":
-        return generate_round_robin(teams)
-    if key == "swiss":
-        return generate_swiss(teams)
-    raise ValueError(f"Unsupported tournament format: {format_name}")
+    return list(iter_bracket(format_name, teams))
@@ -0,0 +1,97 @@
+"""Denormalised per-tournament counters: participants, matches and a change version.
+
+Every write path that touches a tournament calls ``record_tournament_change``
+in the same transaction, before it writes any of the tournament's rows, so
+writers and the archive job lock in the same order, the counters commit or
+roll back together with the rows they count and ``version`` increases monotonically with every change (it
+drives the read endpoints' ETags). ``repair_tournament_counters`` recomputes the
+counts from the source tables for backfills and drift repair.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.archive import ARCHIVED_TABLES
+from app.models.match import Match
+from app.models.tournament import Tournament
+from app.models.tournament_registration import TournamentRegistration
+
+
+async def record_tournament_change(session: AsyncSession, tournament_id: int, participants: int = 0, matches: int = 0) -> bool:
+    """Bump the tournament's version and apply counter deltas as a single in-database increment.
+
+    The UPDATE holds the tournament row's write lock until the transaction
+    ends, so calling this first serialises writers of one tournament. Returns
+    whether the tournament exists.
+    """
+    result = await session.execute(
+        update(Tournament)
+        .where(Tournament.id == tournament_id)
+        .values(
+            participants_count=Tournament.participants_count + participants,
+            matches_count=Tournament.matches_count + matches,
+            version=Tournament.version + 1,
+        )
+    )
+    return result.rowcount == 1
+
+
+async def reserve_slot(session: AsyncSession, tournament_id: int) -> bool:
+    """Count one more participant if the tournament still has room.
+
+    The capacity check and the increment are one conditional UPDATE, so two
+    concurrent joins cannot both take the last slot.
+    """
+    result = await session.execute(
+        update(Tournament)
+        .where(Tournament.id == tournament_id, Tournament.participants_count < Tournament.max_teams)
+        .values(participants_count=Tournament.participants_count + 1, version=Tournament.version + 1)
+    )
+    return result.rowcount == 1
+
+
+def _counted():
+    participants = (
+        select(func.count(TournamentRegistration.id))
+        .where(TournamentRegistration.tournament_id == Tournament.id)
+        .correlate(Tournament)
+        .scalar_subquery()
+    )
+    matches = select(func.count(Match.id)).where(Match.tournament_id == Tournament.id).correlate(Tournament).scalar_subquery()
+    return participants, matches
+
+
+async def stale_counter_tournaments(session: AsyncSession) -> list[int]:
+    """Tournaments whose stored counters disagree with their registration and match rows."""
+    participants, matches = _counted()
+    statement = select(Tournament.id).where(or_(Tournament.participants_count != participants, Tournament.matches_count != matches))
+    return list((await session.execute(statement)).scalars().all())
+
+
+async def repair_tournament_counters(session: AsyncSession, tournament_ids: Iterable[int] | None = None) -> int:
+    """Recompute the counters from the registration and match tables in one UPDATE.
+
+    Returns the number of tournaments updated.
+    """
+    participants, matches = _counted()
+    statement = update(Tournament).values(participants_count=participants, matches_count=matches, version=Tournament.version + 1)
+    if tournament_ids is not None:
+        statement = statement.where(Tournament.id.in_(list(tournament_ids)))
+    result = await session.execute(statement.execution_options(synchronize_session=False))
+    return result.rowcount
+
+
+async def tournament_version(session: AsyncSession, tournament_id: int) -> int | None:
+    """The tournament's current version, or ``None`` when it does not exist.
+
+    Archived tournaments keep the version they were archived with.
+    """
+    version = (await session.execute(select(Tournament.version).where(Tournament.id == tournament_id))).scalar_one_or_none()
+    if version is None:
+        archived = ARCHIVED_TABLES.tournaments
+        version = (await session.execute(select(archived.c.version).where(archived.c.id == tournament_id))).scalar_one_or_none()
+    return version
@@ -0,0 +1,111 @@
+"""Reads behind ``GET /me/dashboard``: one user's active registrations, upcoming matches and open items.
+
+Every query filters on an indexed ``user_id`` (matches through the
+registration ids recorded on each side), and they share the caller's
+session: an ``AsyncSession`` runs one statement at a time on one
+connection, so the reads go back to back rather than in parallel over
+several pooled connections.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from sqlalchemy import Row, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.match import Match
+from app.models.notification import Notification
+from app.models.payment import Payment
+from app.models.tournament import Tournament
+from app.models.tournament_registration import TournamentRegistration
+
+ACTIVE_TOURNAMENT = Tournament.status != "completed"
+PENDING_PAYMENT = "created"
+
+
+@dataclass
+class Dashboard:
+    registrations: list[Row]
+    upcoming_matches: list[Row]
+    unread_notifications: int
+    pending_payments: list[Payment]
+
+
+async def active_tournament_ids(session: AsyncSession, user_id: int) -> list[int]:
+    """Tournaments the user is registered in that have not completed yet."""
+    return list(
+        (
+            await session.execute(
+                select(TournamentRegistration.tournament_id)
+                .join(Tournament, Tournament.id == TournamentRegistration.tournament_id)
+                .where(TournamentRegistration.user_id == user_id, ACTIVE_TOURNAMENT)
+                .order_by(TournamentRegistration.tournament_id)
+            )
+        ).scalars().all()
+    )
+
+
+async def load_dashboard(session: AsyncSession, user_id: int, match_limit: int) -> Dashboard:
+    registrations = (
+        await session.execute(
+            select(
+                TournamentRegistration.id.label("registration_id"),
+                TournamentRegistration.tournament_id,
+                Tournament.name.label("tournament_name"),
+                Tournament.game,
+                Tournament.status.label("tournament_status"),
+                Tournament.start_date,
+                TournamentRegistration.status,
+                TournamentRegistration.team_name,
+                TournamentRegistration.points,
+            )
+            .join(Tournament, Tournament.id == TournamentRegistration.tournament_id)
+            .where(TournamentRegistration.user_id == user_id, ACTIVE_TOURNAMENT)
+            .order_by(Tournament.start_date.is_(None), Tournament.start_date.asc(), Tournament.id.asc())
+        )
+    ).all()
+
+    # The tournament_id equality lets each side use its (tournament_id, registration) index.
+    plays_in = and_(
+        Match.tournament_id == TournamentRegistration.tournament_id,
+        or_(
+            Match.team_a_registration_id == TournamentRegistration.id,
+            Match.team_b_registration_id == TournamentRegistration.id,
+        ),
+    )
+    upcoming_matches = (
+        await session.execute(
+            select(
+                Match.id,
+                Match.tournament_id,
+                Tournament.name.label("tournament_name"),
+                Match.round_name,
+                Match.team_a,
+                Match.team_b,
+                TournamentRegistration.team_name.label("my_team"),
+                Match.scheduled_at,
+            )
+            .join(TournamentRegistration, plays_in)
+            .join(Tournament, Tournament.id == Match.tournament_id)
+            .where(TournamentRegistration.user_id == user_id, Match.status == "scheduled", ACTIVE_TOURNAMENT)
+            .order_by(Match.scheduled_at.is_(None), Match.scheduled_at.asc(), Match.id.asc())
+            .limit(match_limit)
+        )
+    ).all()
+
+    unread_notifications = (
+        await session.execute(
+            select(func.count()).select_from(Notification).where(Notification.user_id == user_id, Notification.read == 0)
+        )
+    ).scalar_one()
+
+    pending_payments = (
+        await session.execute(
+            select(Payment)
+            .where(Payment.user_id == user_id, Payment.status == PENDING_PAYMENT)
+            .order_by(Payment.created_at.desc())
+        )
+    ).scalars().all()
+
+    return Dashboard(list(registrations), list(upcoming_matches), unread_notifications, list(pending_payments))
@@ -0,0 +1,198 @@
+"""Battle royale lobbies: snake-seeded lobby assignment and placement + kill scoring."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Sequence
+
+from sqlalchemy import case, delete, func, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.archive import HOT_TABLES, TournamentTables
+from app.models.lobby_result import LobbyResult
+from app.models.tournament_registration import TournamentRegistration
+from app.services.stages import snake_split
+
+LOBBY_FORMAT = "Battle Royale Lobbies"
+LOBBY_FORMATS = {LOBBY_FORMAT.lower(), "battle royale", "lobbies"}
+DEFAULT_LOBBY_SIZE = 20
+PLACEMENT_POINTS = (12, 9, 7, 5, 4, 3, 3, 2, 2, 2, 1, 1, 1, 1, 1)
+KILL_POINTS = 1
+
+
+@dataclass(frozen=True)
+class GameResult:
+    lobby_number: int
+    game_number: int
+    team_name: str
+    placement: int
+    kills: int = 0
+
+
+def is_lobby_tournament(format_name: str) -> bool:
+    """Lobby play is a format of its own; the game never decides it, so stage and lobby pipelines cannot share a tournament."""
+    return format_name.strip().lower() in LOBBY_FORMATS
+
+
+def assign_lobbies(teams: Sequence[str], lobby_size: int = DEFAULT_LOBBY_SIZE) -> list[list[str]]:
+    """Snake-seed teams into as few lobbies of at most ``lobby_size`` as possible."""
+    if lobby_size < 2:
+        raise ValueError("A lobby needs room for at least two teams")
+    if len(teams) < 2:
+        raise ValueError("At least two teams are required")
+    if len(set(teams)) != len(teams):
+        raise ValueError("Team names must be unique")
+    return snake_split(teams, -(-len(teams) // lobby_size))
+
+
+def score_results(placements: Sequence[int], kills: Sequence[int]) -> list[int]:
+    """Score a whole batch column-wise against one placement lookup table.
+
+    Placements beyond the table score nothing; every kill adds ``KILL_POINTS``.
+    """
+    padding = max(0, max(placements, default=0) - len(PLACEMENT_POINTS))
+    table = PLACEMENT_POINTS + (0,) * padding
+    return [table[placement - 1] + KILL_POINTS * kill for placement, kill in zip(placements, kills)]
+
+
+def _validate(
+    results: Sequence[GameResult],
+    lobby_of: dict[str, int | None],
+    recorded: dict[tuple[int, int], set[str]],
+) -> None:
+    """Check each result against the teams that played its game.
+
+    A game with stored results keeps the roster it was played with, so
+    corrections still validate after ``/lobbies/assign`` reseeds; a new game
+    is checked against the current lobby assignment.
+    """
+    assigned: dict[int, set[str]] = defaultdict(set)
+    for team, lobby in lobby_of.items():
+        if lobby is not None:
+            assigned[lobby].add(team)
+    seen_teams: set[tuple[int, int, str]] = set()
+    seen_placements: set[tuple[int, int, int]] = set()
+    for result in results:
+        game = (result.lobby_number, result.game_number)
+        roster = recorded.get(game) or assigned[result.lobby_number]
+        if result.team_name not in roster:
+            if game in recorded:
+                raise ValueError(
+                    f"{result.team_name} did not play lobby {result.lobby_number} game {result.game_number}; "
+                    "new games need a new game number"
+                )
+            raise ValueError(f"{result.team_name} is not assigned to lobby {result.lobby_number}")
+        if not 1 <= result.placement <= len(roster):
+            raise ValueError(f"Placement {result.placement} is outside lobby {result.lobby_number}")
+        if result.kills < 0:
+            raise ValueError("Kills cannot be negative")
+        team_key = (result.lobby_number, result.game_number, result.team_name)
+        placement_key = (result.lobby_number, result.game_number, result.placement)
+        if team_key in seen_teams or placement_key in seen_placements:
+            raise ValueError(f"Duplicate result in lobby {result.lobby_number} game {result.game_number}")
+        seen_teams.add(team_key)
+        seen_placements.add(placement_key)
+
+
+async def ingest_results(session: AsyncSession, tournament_id: int, results: Sequence[GameResult]) -> dict[str, int]:
+    """Store a batch of game results and refresh the affected teams' points.
+
+    Game numbers count across the whole tournament, not per round of lobby
+    assignments. Each ``(lobby, game)`` in the batch replaces any results
+    already stored for it, so corrections are re-submissions, and only the
+    teams that played it may appear in them: reusing the number of an earlier
+    game for a new one is rejected instead of overwriting it. The batch is scored in one
+    pass, inserted with a single executemany and the new totals of every
+    affected team are summed in one grouped query and written back with one
+    executemany update. Returns the refreshed totals by team.
+    """
+    if not results:
+        return {}
+    registrations = (
+        await session.execute(
+            select(TournamentRegistration.id, TournamentRegistration.team_name, TournamentRegistration.lobby_number).where(
+                TournamentRegistration.tournament_id == tournament_id
+            )
+        )
+    ).all()
+    lobby_of = {team: lobby for _, team, lobby in registrations}
+    games = {(result.lobby_number, result.game_number) for result in results}
+    in_games = tuple_(LobbyResult.lobby_number, LobbyResult.game_number).in_(games)
+    recorded: dict[tuple[int, int], set[str]] = defaultdict(set)
+    for lobby, game, team in await session.execute(
+        select(LobbyResult.lobby_number, LobbyResult.game_number, LobbyResult.team_name).where(
+            LobbyResult.tournament_id == tournament_id, in_games
+        )
+    ):
+        recorded[(lobby, game)].add(team)
+    _validate(results, lobby_of, recorded)
+
+    replaced = set().union(*recorded.values())
+    await session.execute(delete(LobbyResult).where(LobbyResult.tournament_id == tournament_id, in_games))
+
+    points = score_results([result.placement for result in results], [result.kills for result in results])
+    await session.execute(
+        insert(LobbyResult),
+        [
+            {
+                "tournament_id": tournament_id,
+                "lobby_number": result.lobby_number,
+                "game_number": result.game_number,
+                "team_name": result.team_name,
+                "placement": result.placement,
+                "kills": result.kills,
+                "points": score,
+            }
+            for result, score in zip(results, points)
+        ],
+    )
+
+    affected = {result.team_name for result in results}.union(replaced)
+    totals = dict.fromkeys(affected, 0)
+    totals.update(
+        (
+            await session.execute(
+                select(LobbyResult.team_name, func.sum(LobbyResult.points))
+                .where(LobbyResult.tournament_id == tournament_id, LobbyResult.team_name.in_(affected))
+                .group_by(LobbyResult.team_name)
+            )
+        ).all()
+    )
+    registration_ids = {team: registration_id for registration_id, team, _ in registrations}
+    await session.execute(
+        update(TournamentRegistration),
+        [{"id": registration_ids[team], "points": total} for team, total in totals.items() if team in registration_ids],
+    )
+    return totals
+
+
+async def lobby_standings(session: AsyncSession, tournament_id: int, tables: TournamentTables = HOT_TABLES) -> list[dict]:
+    """Points table across all lobbies: points, then wins, then kills."""
+    results, registrations = tables.lobby_results.c, tables.registrations.c
+    aggregates = (
+        select(
+            results.team_name.label("team_name"),
+            func.count(results.id).label("games"),
+            func.sum(results.kills).label("kills"),
+            func.sum(case((results.placement == 1, 1), else_=0)).label("wins"),
+        )
+        .where(results.tournament_id == tournament_id)
+        .group_by(results.team_name)
+        .subquery()
+    )
+    games = func.coalesce(aggregates.c.games, 0)
+    kills = func.coalesce(aggregates.c.kills, 0)
+    wins = func.coalesce(aggregates.c.wins, 0)
+    rows = (
+        await session.execute(
+            select(registrations.team_name, registrations.lobby_number, registrations.points, games, wins, kills)
+            .outerjoin(aggregates, aggregates.c.team_name == registrations.team_name)
+            .where(registrations.tournament_id == tournament_id, registrations.lobby_number.is_not(None))
+            .order_by(registrations.points.desc(), wins.desc(), kills.desc(), registrations.created_at.asc())
+        )
+    ).all()
+    return [
+        {"rank": index + 1, "team_name": team, "lobby_number": lobby, "points": points, "games": games, "wins": wins, "kills": kills}
+        for index, (team, lobby, points, games, wins, kills) in enumerate(rows)
+    ]
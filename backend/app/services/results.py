@@ -0,0 +1,95 @@
+"""Record match results and keep standings in step, one match or a whole round at a time."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.match import Match
+from app.services.standings import load_ledger, save_ledger
+
+
+@dataclass(frozen=True)
+class ResultEntry:
+    match_id: int
+    team_a_score: int
+    team_b_score: int
+    winner: str | None = None
+
+
+class UnknownMatches(ValueError):
+    """Raised when results reference matches that are not in the tournament."""
+
+    def __init__(self, match_ids: Sequence[int]) -> None:
+        self.match_ids = sorted(match_ids)
+        super().__init__(f"Match not found: {', '.join(map(str, self.match_ids))}")
+
+
+def _decide(match: Match, entry: ResultEntry) -> tuple[str, int | None, int | None]:
+    """The winner's name plus the winner's and loser's registration ids."""
+    if entry.team_a_score == entry.team_b_score:
+        raise ValueError("A completed match cannot end in a tie")
+    a_won = entry.team_a_score > entry.team_b_score
+    expected_winner = match.team_a if a_won else match.team_b
+    winner = entry.winner.strip() if entry.winner else expected_winner
+    if winner not in {match.team_a, match.team_b} or winner != expected_winner:
+        raise ValueError("Winner does not match the participating teams and scores")
+    if a_won:
+        return winner, match.team_a_registration_id, match.team_b_registration_id
+    return winner, match.team_b_registration_id, match.team_a_registration_id
+
+
+async def apply_results(session: AsyncSession, tournament_id: int, entries: Sequence[ResultEntry]) -> list[Match]:
+    """Validate every entry, then apply them all in the caller's transaction.
+
+    The caller must already hold the tournament's row lock (taken by
+    ``record_tournament_change``) so the matches and standings read here
+    include every result committed before. Matches are fetched in one query
+    and nothing is written unless the whole batch is valid. Standings deltas of every changed winner go through a
+    single ledger keyed by registration id, so each affected registration is
+    written once, by primary key, no matter how many of its matches the batch
+    touches. Returns the matches in entry order.
+    """
+    match_ids = [entry.match_id for entry in entries]
+    if len(set(match_ids)) != len(match_ids):
+        raise ValueError("Each match can only appear once per batch")
+    matches = {
+        match.id: match
+        for match in (
+            await session.execute(select(Match).where(Match.tournament_id == tournament_id, Match.id.in_(match_ids)))
+        ).scalars()
+    }
+    missing = set(match_ids) - matches.keys()
+    if missing:
+        raise UnknownMatches(missing)
+
+    decided = [(matches[entry.match_id], entry, _decide(matches[entry.match_id], entry)) for entry in entries]
+    changed = [
+        (match, outcome)
+        for match, _, outcome in decided
+        if (match.winner if match.status == "finished" else None) != outcome[0]
+    ]
+    if changed:
+        registration_ids = {
+            registration_id
+            for match, _ in changed
+            for registration_id in (match.team_a_registration_id, match.team_b_registration_id)
+            if registration_id is not None
+        }
+        ledger = await load_ledger(session, tournament_id, registration_ids)
+        for match, (_, winner_id, loser_id) in changed:
+            if match.status == "finished" and match.winner:
+                ledger.remove_result(match.id)
+            ledger.add_result(match.id, winner_id, loser_id)
+        await save_ledger(session, ledger)
+
+    for match, entry, (winner, winner_id, _) in decided:
+        match.team_a_score = entry.team_a_score
+        match.team_b_score = entry.team_b_score
+        match.winner = winner
+        match.winner_registration_id = winner_id
+        match.status = "finished"
+    return [match for match, _, _ in decided]
@@ -0,0 +1,115 @@
+"""Full-text tournament search over name, game, description and location.
+
+SQLite keeps an external-content FTS5 table in sync with ``tournaments``
+through triggers and ranks with bm25; MySQL uses a FULLTEXT index and
+``MATCH ... AGAINST`` in boolean mode. Both look terms up in the index, so the
+cost follows the number of matching rows rather than the size of the table.
+Other dialects fall back to ``LIKE`` filters ordered by recency.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Sequence
+
+from sqlalchemy import ColumnElement, Float, Integer, Row, and_, or_, select, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.tournament import Tournament
+
+SEARCH_COLUMNS = ("name", "game", "description", "location")
+FTS_TABLE = "tournaments_fts"
+FULLTEXT_INDEX = "ft_tournament_search"
+MAX_TERMS = 8
+# bm25 weights in SEARCH_COLUMNS order: a hit in the name outranks one in the description.
+BM25_WEIGHTS = (10.0, 5.0, 1.0, 2.0)
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+def search_terms(query: str) -> list[str]:
+    """Words of ``query`` with every operator character dropped, so user input is never parsed as index syntax."""
+    return _TERM.findall(query.lower())[:MAX_TERMS]
+
+
+def fts5_query(terms: Sequence[str]) -> str:
+    """Every term must match, each as a prefix so results follow the user while they type."""
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def boolean_mode_query(terms: Sequence[str]) -> str:
+    return " ".join(f"+{term}*" for term in terms)
+
+
+def ensure_search_index(sync_conn) -> None:
+    """Create the dialect's full-text index if it is missing and fill it from existing rows."""
+    dialect = sync_conn.dialect.name
+    columns = ", ".join(SEARCH_COLUMNS)
+    if dialect == "sqlite":
+        exists = sync_conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = :name"), {"name": f"{FTS_TABLE}_ai"}
+        ).first()
+        if exists:
+            return
+        # Rebuilding ``tournaments`` drops its triggers, leaving an index nothing keeps in sync.
+        sync_conn.execute(text(f"DROP TABLE IF EXISTS {FTS_TABLE}"))
+        new_values = ", ".join(f"new.{column}" for column in SEARCH_COLUMNS)
+        old_values = ", ".join(f"old.{column}" for column in SEARCH_COLUMNS)
+        delete_old = f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old_values});"
+        insert_new = f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new_values});"
+        sync_conn.execute(
+            text(
+                f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5({columns}, content='tournaments', "
+                "content_rowid='id', tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+            )
+        )
+        sync_conn.execute(text(f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON tournaments BEGIN {insert_new} END"))
+        sync_conn.execute(text(f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON tournaments BEGIN {delete_old} END"))
+        # Only the indexed columns: counter and version bumps must not churn the index.
+        sync_conn.execute(
+            text(f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE OF {columns} ON tournaments BEGIN {delete_old} {insert_new} END")
+        )
+        sync_conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+    elif dialect == "mysql":
+        indexes = {row[2] for row in sync_conn.execute(text("SHOW INDEX FROM tournaments"))}
+        if FULLTEXT_INDEX not in indexes:
+            sync_conn.execute(text(f"CREATE FULLTEXT INDEX {FULLTEXT_INDEX} ON tournaments ({columns})"))
+
+
+async def search_tournaments(
+    session: AsyncSession,
+    query: str,
+    limit: int,
+    offset: int = 0,
+    columns: Sequence[ColumnElement] | None = None,
+) -> list[Row]:
+    """Tournaments matching every term of ``query``, best match first.
+
+    Rows carry ``columns``, every tournament column by default. Raises
+    ``ValueError`` when the query has no searchable words.
+    """
+    terms = search_terms(query)
+    if not terms:
+        raise ValueError("Search query must contain letters or digits")
+
+    selected = select(*(columns or Tournament.__table__.columns))
+    dialect = session.bind.dialect.name
+    if dialect == "sqlite":
+        weights = ", ".join(str(weight) for weight in BM25_WEIGHTS)
+        hits = (
+            text(f"SELECT rowid AS id, bm25({FTS_TABLE}, {weights}) AS score FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :query")
+            .bindparams(query=fts5_query(terms))
+            .columns(id=Integer, score=Float)
+            .subquery("hits")
+        )
+        statement = selected.join(hits, hits.c.id == Tournament.id).order_by(hits.c.score.asc(), Tournament.id.desc())
+    elif dialect == "mysql":
+        score = match(*(getattr(Tournament, column) for column in SEARCH_COLUMNS), against=boolean_mode_query(terms)).in_boolean_mode()
+        statement = selected.where(score > 0).order_by(score.desc(), Tournament.id.desc())
+    else:
+        statement = selected.where(
+            and_(*(or_(*(getattr(Tournament, column).ilike(f"%{term}%") for column in SEARCH_COLUMNS)) for term in terms))
+        ).order_by(Tournament.created_at.desc(), Tournament.id.desc())
+
+    return list((await session.execute(statement.limit(limit).offset(offset))).all())
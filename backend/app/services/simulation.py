@@ -0,0 +1,130 @@
+"""Monte Carlo outcome estimates for elimination brackets."""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+from dataclasses import dataclass
+from typing import Sequence
+
+from app.services.brackets import ELIMINATION_FORMATS, NO_MATCH, bracket_topology, build_compact_bracket
+
+DEFAULT_ITERATIONS = 10_000
+# Matches one request may simulate in total (iterations x bracket matches), about a quarter second of work.
+MAX_SIMULATED_MATCHES = 1_000_000
+ELO_SCALE = 400.0
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    format_name: str
+    iterations: int
+    round_labels: tuple[str, ...]
+    champion: dict[str, float]
+    reached: dict[str, dict[str, float]]
+
+    def as_dict(self) -> dict:
+        return {
+            "format": self.format_name,
+            "iterations": self.iterations,
+            "teams": [
+                {"team": team, "champion": self.champion[team], "reached": self.reached[team]}
+                for team in sorted(self.champion, key=lambda team: -self.champion[team])
+            ],
+        }
+
+
+def win_probability(rating_a: float, rating_b: float) -> float:
+    """Elo expectation that ``a`` beats ``b``."""
+    return 1.0 / (1.0 + 10 ** ((rating_b - rating_a) / ELO_SCALE))
+
+
+def _play_brackets(format_name: str, team_count: int, ratings: Sequence[float], iterations: int, seed: int) -> tuple[list[Counter], Counter]:
+    """Play ``iterations`` brackets at once, one match column at a time.
+
+    Every seat holds a list with one entry per iteration, so each match is a
+    single comprehension over all iterations. The extra index ``team_count``
+    is the bye and always loses.
+    """
+    topology = bracket_topology(format_name, 1 << (team_count - 1).bit_length())
+    bye = team_count
+    probability = [[win_probability(a, b) for b in ratings] + [1.0] for a in ratings]
+    probability.append([0.0] * (team_count + 1))
+    rng = random.Random(seed)
+    draw = rng.random
+
+    seats: list[list[list[int] | None]] = [[None, None] for _ in range(len(topology))]
+    for seed_index in range(2 * topology.first_round_matches):
+        team = seed_index if seed_index < team_count else bye
+        seats[seed_index // 2][seed_index % 2] = [team] * iterations
+    fed = topology.fed_slots()
+    for index in range(topology.first_round_matches, len(topology)):
+        for slot in (0, 1):
+            if (index, slot) not in fed:
+                seats[index][slot] = [bye] * iterations
+
+    appearances = [Counter() for _ in topology.round_labels]
+    winners: list[int] = []
+    for index in range(len(topology)):
+        side_a, side_b = seats[index]
+        seats[index] = [None, None]
+        round_counter = appearances[topology.round_ids[index]]
+        round_counter.update(side_a)
+        round_counter.update(side_b)
+        winners = [a if draw() < probability[a][b] else b for a, b in zip(side_a, side_b)]
+        if topology.winner_to[index] != NO_MATCH:
+            seats[topology.winner_to[index]][topology.winner_slot[index]] = winners
+        if topology.loser_to[index] != NO_MATCH:
+            seats[topology.loser_to[index]][topology.loser_slot[index]] = [
+                b if winner == a else a for a, b, winner in zip(side_a, side_b, winners)
+            ]
+    return appearances, Counter(winners)
+
+
+def iterations_within_budget(format_name: str, team_count: int, iterations: int, budget: int = MAX_SIMULATED_MATCHES) -> int:
+    """``iterations`` lowered so the whole run decides at most ``budget`` matches.
+
+    Raises ``ValueError`` for formats other than single and double elimination.
+    """
+    format_key = format_name.strip().lower()
+    if format_key not in ELIMINATION_FORMATS:
+        raise ValueError(f"Simulation supports elimination formats only, not {format_name}")
+    matches = len(bracket_topology(format_key, 1 << (max(team_count, 2) - 1).bit_length()).round_ids)
+    return max(1, min(iterations, budget // matches))
+
+
+def simulate_bracket(
+    format_name: str,
+    teams: Sequence[str],
+    ratings: Sequence[float],
+    iterations: int = DEFAULT_ITERATIONS,
+    seed: int = 0,
+) -> SimulationResult:
+    """Estimate per-team championship and round-reached probabilities.
+
+    Teams are seeded in the given order, exactly as the bracket publisher
+    does, and each match is decided by the Elo expectation of the two
+    ratings. Results are deterministic for a given ``seed``.
+    """
+    format_key = format_name.strip().lower()
+    if format_key not in ELIMINATION_FORMATS:
+        raise ValueError(f"Simulation supports elimination formats only, not {format_name}")
+    normalized = list(build_compact_bracket(format_key, teams).teams)
+    topology = bracket_topology(format_key, 1 << (len(normalized) - 1).bit_length())
+    if len(ratings) != len(normalized):
+        raise ValueError("Provide exactly one rating per team")
+    if iterations < 1:
+        raise ValueError("At least one iteration is required")
+
+    appearances, champions = _play_brackets(format_key, len(normalized), [float(rating) for rating in ratings], iterations, seed)
+
+    return SimulationResult(
+        format_name=format_key,
+        iterations=iterations,
+        round_labels=topology.round_labels,
+        champion={team: champions[index] / iterations for index, team in enumerate(normalized)},
+        reached={
+            team: {label: appearances[round_id][index] / iterations for round_id, label in enumerate(topology.round_labels)}
+            for index, team in enumerate(normalized)
+        },
+    )
@@ -0,0 +1,140 @@
+"""Multi-stage formats: a round robin league or group stage feeding an elimination playoff."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from string import ascii_uppercase
+from typing import Iterator, Sequence
+
+from app.services.brackets import CompactBracket, MatchSlot, build_round_robin_schedule
+
+GROUP_STAGE = 1
+PLAYOFF_STAGE = 2
+
+
+@dataclass(frozen=True)
+class StagePlan:
+    groups: int
+    qualifiers: int
+    playoff_format: str = "single elimination"
+
+
+MULTI_STAGE_FORMATS = {
+    "league + finals": StagePlan(groups=1, qualifiers=4),
+    "league + playoffs": StagePlan(groups=1, qualifiers=8),
+    "groups + playoffs": StagePlan(groups=4, qualifiers=8),
+}
+
+
+def stage_plan(format_name: str) -> StagePlan | None:
+    return MULTI_STAGE_FORMATS.get(format_name.strip().lower())
+
+
+def group_label(index: int, groups: int) -> str:
+    return "League" if groups == 1 else f"Group {ascii_uppercase[index]}"
+
+
+def snake_split(items: Sequence[str], count: int) -> list[list[str]]:
+    """Deal seeded items into ``count`` buckets 1..n, n..1, 1..n, ... so every bucket gets a comparable spread."""
+    buckets: list[list[str]] = [[] for _ in range(count)]
+    for index, item in enumerate(items):
+        lap, offset = divmod(index, count)
+        buckets[offset if lap % 2 == 0 else count - 1 - offset].append(item)
+    return buckets
+
+
+def split_groups(teams: Sequence[str], groups: int) -> list[list[str]]:
+    if not 1 <= groups <= len(ascii_uppercase):
+        raise ValueError(f"Group count must be between 1 and {len(ascii_uppercase)}")
+    if len(teams) < 2 * groups:
+        raise ValueError("Every group needs at least two teams")
+    return snake_split(teams, groups)
+
+
+def group_schedule(teams: Sequence[str], label: str) -> CompactBracket:
+    """A round robin schedule whose round labels carry the group name."""
+    schedule = build_round_robin_schedule(teams)
+    schedule.round_labels = [f"{label} {round_label}" for round_label in schedule.round_labels]
+    return schedule
+
+
+def resting_teams(schedule: CompactBracket) -> list[tuple[str, str]]:
+    """``(round label, team)`` for every team that sits a round out, as in an odd-sized group."""
+    playing: list[set[int]] = [set() for _ in schedule.round_labels]
+    for round_id, team_a, team_b in zip(schedule.round_ids, schedule.slot_a, schedule.slot_b):
+        playing[round_id].update((team_a, team_b))
+    return [
+        (label, team)
+        for label, seated in zip(schedule.round_labels, playing)
+        for index, team in enumerate(schedule.teams)
+        if index not in seated
+    ]
+
+
+def default_groups(plan: StagePlan, team_count: int) -> int:
+    """The plan's group count, reduced so every group still has two teams."""
+    return max(1, min(plan.groups, team_count // 2))
+
+
+def build_group_stage(teams: Sequence[str], groups: int) -> list[tuple[str, list[str], CompactBracket]]:
+    """Split seeded teams into groups and schedule each one.
+
+    Returns ``(label, members, schedule)`` per group. Match numbers continue
+    across groups so they stay unique within the tournament.
+    """
+    stage = []
+    offset = 0
+    for index, members in enumerate(split_groups(teams, groups)):
+        label = group_label(index, groups)
+        schedule = group_schedule(members, label)
+        for position in range(len(schedule)):
+            schedule.match_numbers[position] += offset
+        offset += len(schedule)
+        stage.append((label, members, schedule))
+    return stage
+
+
+def iter_group_stage(format_name: str, teams: Sequence[str]) -> Iterator[MatchSlot]:
+    """Preview the first stage of a multi-stage format with its default group count."""
+    plan = stage_plan(format_name)
+    if plan is None:
+        raise ValueError(f"{format_name} is not a multi-stage format")
+    for _, _, schedule in build_group_stage(teams, default_groups(plan, len(teams))):
+        yield from schedule
+
+
+def seed_positions(size: int) -> list[int]:
+    """Bracket order of seeds 1..size so that seed 1 meets seed ``size`` first and 1 and 2 meet last."""
+    order = [1]
+    while len(order) < size:
+        total = 2 * len(order) + 1
+        order = [seed for top in order for seed in (top, total - top)]
+    return order
+
+
+def playoff_size(qualifiers: int, field: int) -> int:
+    """Largest power of two no bigger than the requested qualifiers and the field."""
+    limit = min(qualifiers, field)
+    if limit < 2:
+        raise ValueError("At least two teams must qualify for the playoff")
+    return 1 << (limit.bit_length() - 1)
+
+
+def playoff_seeding(ranked_groups: Sequence[Sequence[str]], qualifiers: int) -> list[str]:
+    """Pick the playoff field from per-group standings and order it for the bracket.
+
+    ``ranked_groups`` holds each group's teams best-first, as stored in the
+    standings. Qualifiers are taken place by place across groups (all group
+    winners, then all runners-up, ...), so same-group teams meet as late as
+    seeding allows. The returned list is in bracket slot order.
+    """
+    field = sum(len(group) for group in ranked_groups)
+    size = playoff_size(qualifiers, field)
+    seeds: list[str] = []
+    place = 0
+    while len(seeds) < size:
+        for group in ranked_groups:
+            if place < len(group) and len(seeds) < size:
+                seeds.append(group[place])
+        place += 1
+    return [seeds[position - 1] for position in seed_positions(size)]
@@ -0,0 +1,327 @@
+"""Incremental standings: points plus Buchholz and Sonneborn-Berger tiebreaks.
+
+Buchholz is the sum of a team's opponents' points and Sonneborn-Berger the sum
+of the points of the opponents it beat, both over finished matches. Instead of
+recomputing them from every match, a ``TiebreakLedger`` loads only the teams of
+the changed matches and their opponents, applies exact deltas in memory and
+``save_ledger`` writes every change back as in-database increments in one
+executemany UPDATE, so a concurrent writer's points are never overwritten.
+Matches reference registrations by id, so every lookup here is an indexed
+integer match rather than a team-name comparison.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable
+
+from sqlalchemy import Row, bindparam, case, exists, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.archive import HOT_TABLES, TournamentTables
+from app.models.match import Match
+from app.models.tournament_registration import TournamentRegistration
+
+WIN_POINTS = 3
+
+
+@dataclass
+class LedgerRow:
+    id: int
+    team_name: str
+    points: int
+    buchholz: int
+    sonneborn_berger: int
+
+
+def _values(row) -> tuple[int, int, int]:
+    return row.points, row.buchholz, row.sonneborn_berger
+
+
+# A registration id, or None for a side without a registration.
+TeamKey = int | None
+
+
+class TiebreakLedger:
+    """Standings rows touched by result changes, keyed by registration id.
+
+    ``results`` maps finished match ids to ``(winner, loser)`` registration ids
+    for every match involving a core team. Teams without a registration count
+    as zero points and are never written.
+    """
+
+    def __init__(self, rows: Iterable[LedgerRow], results: dict[int, tuple[TeamKey, TeamKey]]) -> None:
+        self.rows = {row.id: row for row in rows}
+        self._loaded = {team: _values(row) for team, row in self.rows.items()}
+        self.results = dict(results)
+        self._by_team: dict[TeamKey, set[int]] = defaultdict(set)
+        for match_id, (winner, loser) in self.results.items():
+            self._by_team[winner].add(match_id)
+            self._by_team[loser].add(match_id)
+
+    def _points(self, team: TeamKey) -> int:
+        row = self.rows.get(team)
+        return row.points if row else 0
+
+    def _adjust(self, team: TeamKey, buchholz: int = 0, sonneborn_berger: int = 0) -> None:
+        row = self.rows.get(team)
+        if row:
+            row.buchholz += buchholz
+            row.sonneborn_berger += sonneborn_berger
+
+    def _change_points(self, team: TeamKey, delta: int) -> None:
+        row = self.rows.get(team)
+        if not row:
+            return
+        delta = max(delta, -row.points)
+        row.points += delta
+        for match_id in self._by_team[team]:
+            winner, loser = self.results[match_id]
+            if winner == team:
+                self._adjust(loser, buchholz=delta)
+            else:
+                self._adjust(winner, buchholz=delta, sonneborn_berger=delta)
+
+    def add_result(self, match_id: int, winner: TeamKey, loser: TeamKey) -> None:
+        self._adjust(winner, buchholz=self._points(loser), sonneborn_berger=self._points(loser))
+        self._adjust(loser, buchholz=self._points(winner))
+        self.results[match_id] = (winner, loser)
+        self._by_team[winner].add(match_id)
+        self._by_team[loser].add(match_id)
+        self._change_points(winner, WIN_POINTS)
+
+    def remove_result(self, match_id: int) -> None:
+        if match_id not in self.results:
+            return
+        winner, loser = self.results[match_id]
+        self._change_points(winner, -WIN_POINTS)
+        del self.results[match_id]
+        self._by_team[winner].discard(match_id)
+        self._by_team[loser].discard(match_id)
+        self._adjust(winner, buchholz=-self._points(loser), sonneborn_berger=-self._points(loser))
+        self._adjust(loser, buchholz=-self._points(winner))
+
+    def changed_rows(self) -> list:
+        return [row for team, row in self.rows.items() if _values(row) != self._loaded[team]]
+
+    def deltas(self) -> list[tuple[int, int, int, int]]:
+        """``(registration id, points, Buchholz, Sonneborn-Berger)`` changes of every changed row."""
+        return [
+            (row.id, *(now - loaded for now, loaded in zip(_values(row), self._loaded[team])))
+            for team, row in self.rows.items()
+            if _values(row) != self._loaded[team]
+        ]
+
+
+_RESULT_COLUMNS = (Match.team_a, Match.team_b, Match.winner, Match.team_a_registration_id, Match.team_b_registration_id)
+
+
+def _result_of(team_a: str, team_b: str, winner: str | None, team_a_id: TeamKey, team_b_id: TeamKey) -> tuple[TeamKey, TeamKey] | None:
+    """``(winner, loser)`` registration ids of a finished match, or None when it has no winner."""
+    if winner == team_a:
+        return team_a_id, team_b_id
+    if winner == team_b:
+        return team_b_id, team_a_id
+    return None
+
+
+async def load_ledger(session: AsyncSession, tournament_id: int, registration_ids: set[int]) -> TiebreakLedger:
+    """Load the finished matches of ``registration_ids`` and the registrations of everyone in them."""
+    rows = (
+        await session.execute(
+            select(Match.id, *_RESULT_COLUMNS).where(
+                Match.tournament_id == tournament_id,
+                Match.status == "finished",
+                or_(Match.team_a_registration_id.in_(registration_ids), Match.team_b_registration_id.in_(registration_ids)),
+            )
+        )
+    ).all()
+    results = {}
+    for match_id, *columns in rows:
+        result = _result_of(*columns)
+        if result:
+            results[match_id] = result
+    ids = set(registration_ids).union(*results.values()) - {None}
+    registrations = (
+        await session.execute(
+            select(
+                TournamentRegistration.id,
+                TournamentRegistration.team_name,
+                TournamentRegistration.points,
+                TournamentRegistration.buchholz,
+                TournamentRegistration.sonneborn_berger,
+            ).where(TournamentRegistration.id.in_(ids))
+        )
+    ).all()
+    return TiebreakLedger([LedgerRow(*row) for row in registrations], results)
+
+
+async def save_ledger(session: AsyncSession, ledger: TiebreakLedger) -> int:
+    """Apply the ledger's changes as ``column = column + :delta`` in one executemany UPDATE.
+
+    Points are clamped at zero in SQL as well. Returns the number of rows written.
+    """
+    deltas = ledger.deltas()
+    if deltas:
+        table = TournamentRegistration.__table__
+        points = table.c.points + bindparam("points_delta")
+        await session.execute(
+            update(table)
+            .where(table.c.id == bindparam("registration_id"))
+            .values(
+                points=case((points < 0, 0), else_=points),
+                buchholz=table.c.buchholz + bindparam("buchholz_delta"),
+                sonneborn_berger=table.c.sonneborn_berger + bindparam("sonneborn_berger_delta"),
+            ),
+            [
+                {"registration_id": registration_id, "points_delta": points_delta, "buchholz_delta": buchholz_delta, "sonneborn_berger_delta": sonneborn_berger_delta}
+                for registration_id, points_delta, buchholz_delta, sonneborn_berger_delta in deltas
+            ],
+        )
+    return len(deltas)
+
+
+async def rebuild_tiebreaks(session: AsyncSession, tournament_id: int | None = None) -> None:
+    """Recompute Buchholz and Sonneborn-Berger from scratch (backfill and repair only)."""
+    registration_query = select(TournamentRegistration)
+    match_query = select(*_RESULT_COLUMNS).where(Match.status == "finished")
+    if tournament_id is not None:
+        registration_query = registration_query.where(TournamentRegistration.tournament_id == tournament_id)
+        match_query = match_query.where(Match.tournament_id == tournament_id)
+    registrations = (await session.execute(registration_query)).scalars().all()
+    by_id = {row.id: row for row in registrations}
+    for row in registrations:
+        row.buchholz = row.sonneborn_berger = 0
+    for columns in (await session.execute(match_query)).all():
+        result = _result_of(*columns)
+        if not result:
+            continue
+        winner_row = by_id.get(result[0])
+        loser_row = by_id.get(result[1])
+        winner_points = winner_row.points if winner_row else 0
+        loser_points = loser_row.points if loser_row else 0
+        if winner_row:
+            winner_row.buchholz += loser_points
+            winner_row.sonneborn_berger += loser_points
+        if loser_row:
+            loser_row.buchholz += winner_points
+
+
+async def tournaments_missing_tiebreaks(session: AsyncSession) -> list[int]:
+    """Tournaments with a decided match between registrations whose tiebreaks were never computed.
+
+    Such a match always leaves the loser a non-zero Buchholz, so a tournament
+    where every registration still has zero tiebreaks has not been rebuilt.
+    """
+    computed = exists().where(
+        TournamentRegistration.tournament_id == Match.tournament_id,
+        or_(TournamentRegistration.buchholz != 0, TournamentRegistration.sonneborn_berger != 0),
+    )
+    decided = select(Match.tournament_id).where(
+        Match.status == "finished",
+        Match.team_a_registration_id.is_not(None),
+        Match.team_b_registration_id.is_not(None),
+        Match.winner_registration_id.is_not(None),
+        ~computed,
+    )
+    return list((await session.execute(decided.distinct())).scalars().all())
+
+
+async def head_to_head_order(
+    session: AsyncSession,
+    tournament_id: int,
+    ordered: list[TournamentRegistration],
+    tables: TournamentTables = HOT_TABLES,
+) -> list[TournamentRegistration]:
+    """Break exact ties on points and tiebreaks by wins among the tied teams.
+
+    Only matches between members of a tied group are read, so a table without
+    ties costs no extra query.
+    """
+    groups: dict[tuple[int, int, int], list[TournamentRegistration]] = defaultdict(list)
+    for row in ordered:
+        groups[(row.points, row.buchholz, row.sonneborn_berger)].append(row)
+    tied = [group for group in groups.values() if len(group) > 1]
+    if not tied:
+        return ordered
+
+    group_of = {row.id: index for index, group in enumerate(tied) for row in group}
+    ids = list(group_of)
+    wins: dict[int, int] = defaultdict(int)
+    matches = tables.matches.c
+    rows = (
+        await session.execute(
+            select(matches.team_a_registration_id, matches.team_b_registration_id, matches.winner_registration_id).where(
+                matches.tournament_id == tournament_id,
+                matches.status == "finished",
+                matches.team_a_registration_id.in_(ids),
+                matches.team_b_registration_id.in_(ids),
+            )
+        )
+    ).all()
+    for team_a, team_b, winner in rows:
+        if group_of[team_a] == group_of[team_b] and winner in (team_a, team_b):
+            wins[winner] += 1
+
+    position = {id(row): index for index, row in enumerate(ordered)}
+    return sorted(
+        ordered,
+        key=lambda row: (-row.points, -row.buchholz, -row.sonneborn_berger, -wins[row.id], position[id(row)]),
+    )
+
+
+async def ranked_standings(
+    session: AsyncSession,
+    tournament_id: int,
+    limit: int | None = None,
+    around_user: int | None = None,
+    window: int = 5,
+    tables: TournamentTables = HOT_TABLES,
+) -> list[Row]:
+    """Rank a tournament's registrations in SQL and return only the rows asked for.
+
+    ``rank`` is ``RANK()`` over points, Buchholz and Sonneborn-Berger, so teams
+    level on all three share a rank; head-to-head wins then order each tied
+    group among the returned rows. ``limit`` returns the top N (complete tie
+    groups are fetched so the cut respects head-to-head) and ``around_user``
+    returns ``window`` rows either side of that user's registration. Raises
+    ``ValueError`` when ``around_user`` has no registration. ``tables``
+    selects the hot or the archived rows.
+    """
+    registrations = tables.registrations.c
+    score_order = (
+        registrations.points.desc(),
+        registrations.buchholz.desc(),
+        registrations.sonneborn_berger.desc(),
+    )
+    ranked = (
+        select(
+            registrations.id,
+            registrations.user_id,
+            registrations.team_name,
+            registrations.points,
+            registrations.buchholz,
+            registrations.sonneborn_berger,
+            registrations.status,
+            func.rank().over(order_by=score_order).label("rank"),
+            func.row_number()
+            .over(order_by=(*score_order, registrations.created_at.asc(), registrations.id.asc()))
+            .label("position"),
+        )
+        .where(registrations.tournament_id == tournament_id)
+        .cte("ranked")
+    )
+    query = select(ranked).order_by(ranked.c.position)
+    if limit is not None:
+        query = query.where(ranked.c.rank <= limit)
+    if around_user is not None:
+        position = (
+            await session.execute(select(ranked.c.position).where(ranked.c.user_id == around_user))
+        ).scalar_one_or_none()
+        if position is None:
+            raise ValueError("User is not registered in this tournament")
+        query = query.where(ranked.c.position.between(position - window, position + window))
+
+    rows = await head_to_head_order(session, tournament_id, list((await session.execute(query)).all()), tables)
+    return rows[:limit] if limit is not None else rows
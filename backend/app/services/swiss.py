@@ -0,0 +1,153 @@
+"""Swiss-system pairing with score groups, float-downs, byes and rematch avoidance."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import AbstractSet, Sequence
+
+DEFAULT_BACKTRACK_LIMIT = 20_000
+
+
+@dataclass(frozen=True)
+class SwissPairing:
+    pairs: list[tuple[str, str]] = field(default_factory=list)
+    bye: str | None = None
+    float_downs: int = 0
+    rematches: int = 0
+
+
+def _rank(standings: Sequence[tuple[str, int]]) -> list[tuple[str, int]]:
+    names = [team for team, _ in standings]
+    if len(set(names)) != len(names):
+        raise ValueError("Team names must be unique")
+    return sorted(standings, key=lambda item: (-item[1], item[0].casefold(), item[0]))
+
+
+def _pick_bye(ranked: list[tuple[str, int]], previous_byes: AbstractSet[str]) -> int:
+    """Lowest-ranked team that has not had a bye yet, else the lowest-ranked team."""
+    for index in range(len(ranked) - 1, -1, -1):
+        if ranked[index][0] not in previous_byes:
+            return index
+    return len(ranked) - 1
+
+
+def _pair_without_rematches(
+    teams: list[str],
+    previous_pairs: AbstractSet[frozenset[str]],
+    backtrack_limit: int,
+) -> list[tuple[int, int]] | None:
+    """Depth-first Monrad pairing: the best unpaired team meets the next eligible one.
+
+    Teams are in rank order, so the first eligible opponent is the nearest in
+    its score group and the last member of an odd group floats down to the top
+    of the next. When a choice dead-ends the most recent pair is undone and its
+    next candidate tried, up to ``backtrack_limit`` undos. Runs iteratively so
+    fields of thousands of teams do not hit the recursion limit.
+    """
+    count = len(teams)
+    used = [False] * count
+    chosen: list[tuple[int, int]] = []
+    backtracks = 0
+    current, start = 0, 1
+    while True:
+        while current < count and used[current]:
+            current += 1
+        if current >= count:
+            return chosen
+        if start <= current:
+            start = current + 1
+        team = teams[current]
+        opponent = start
+        while opponent < count and (used[opponent] or frozenset((team, teams[opponent])) in previous_pairs):
+            opponent += 1
+        if opponent < count:
+            used[current] = used[opponent] = True
+            chosen.append((current, opponent))
+            current, start = current + 1, 0
+            continue
+        if not chosen or backtracks >= backtrack_limit:
+            return None
+        backtracks += 1
+        current, last_opponent = chosen.pop()
+        used[current] = used[last_opponent] = False
+        start = last_opponent + 1
+
+
+def _pair_allowing_rematches(teams: list[str], previous_pairs: AbstractSet[frozenset[str]]) -> list[tuple[int, int]]:
+    """Greedy fallback that prefers fresh opponents but never leaves a team unpaired."""
+    remaining = list(range(len(teams)))
+    chosen: list[tuple[int, int]] = []
+    while remaining:
+        current = remaining.pop(0)
+        pick = next(
+            (position for position, candidate in enumerate(remaining) if frozenset((teams[current], teams[candidate])) not in previous_pairs),
+            0,
+        )
+        chosen.append((current, remaining.pop(pick)))
+    return chosen
+
+
+def _repair_rematches(teams: list[str], previous_pairs: AbstractSet[frozenset[str]], pairs: list[tuple[int, int]]) -> None:
+    """Swap opponents between a rematch and another pair, nearest in rank first, while that removes a rematch.
+
+    Every swap lowers the rematch count, so the loop ends; a rematch stays only
+    when no single swap with another pair can remove it.
+    """
+
+    def rematch(first: int, second: int) -> bool:
+        return frozenset((teams[first], teams[second])) in previous_pairs
+
+    def swap_out(index: int) -> bool:
+        top, bottom = pairs[index]
+        for other in sorted(range(len(pairs)), key=lambda position: (abs(pairs[position][0] - top), position)):
+            if other == index:
+                continue
+            first, second = pairs[other]
+            before = 1 + rematch(first, second)
+            for pair_a, pair_b in (((top, first), (bottom, second)), ((top, second), (bottom, first))):
+                if rematch(*pair_a) + rematch(*pair_b) < before:
+                    pairs[index], pairs[other] = tuple(sorted(pair_a)), tuple(sorted(pair_b))
+                    return True
+        return False
+
+    while any(rematch(*pairs[index]) and swap_out(index) for index in range(len(pairs))):
+        pass
+
+
+def pair_swiss_round(
+    standings: Sequence[tuple[str, int]],
+    previous_pairs: AbstractSet[frozenset[str]] = frozenset(),
+    previous_byes: AbstractSet[str] = frozenset(),
+    backtrack_limit: int = DEFAULT_BACKTRACK_LIMIT,
+) -> SwissPairing:
+    """Pair the next Swiss round from ``(team, points)`` standings.
+
+    Every team is paired, or given the bye when the field is odd;
+    ``publish_byes`` stores the bye as a win. Rematches are avoided whenever
+    bounded backtracking finds a rematch-free pairing.
+    Otherwise a greedy pass pairs everyone and opponents are then swapped
+    between pairs until no single swap removes another rematch; this keeps
+    rematches low but does not guarantee the minimum. The result depends only
+    on the inputs, never on their order.
+    """
+    ranked = _rank(standings)
+    bye = None
+    if len(ranked) % 2:
+        bye = ranked.pop(_pick_bye(ranked, previous_byes))[0]
+    if not ranked:
+        return SwissPairing(bye=bye)
+
+    teams = [team for team, _ in ranked]
+    index_pairs = _pair_without_rematches(teams, previous_pairs, backtrack_limit)
+    if index_pairs is None:
+        index_pairs = _pair_allowing_rematches(teams, previous_pairs)
+        _repair_rematches(teams, previous_pairs, index_pairs)
+    index_pairs.sort()
+
+    points = [score for _, score in ranked]
+    return SwissPairing(
+        pairs=[(teams[first], teams[second]) for first, second in index_pairs],
+        bye=bye,
+        float_downs=sum(1 for first, second in index_pairs if points[first] != points[second]),
+        rematches=sum(1 for first, second in index_pairs if frozenset((teams[first], teams[second])) in previous_pairs),
+    )
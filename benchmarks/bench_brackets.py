@@ -0,0 +1,133 @@
+"""Benchmark every bracket format and Swiss pairing, with a regression gate.
+
+Each case is timed (best of ``--repeat`` runs) and its peak traced memory is
+recorded. Results are written as JSON; when a baseline file exists, any case
+slower or hungrier than ``baseline * --threshold`` fails the run with exit
+code 1. Quadratic formats (round robin) stop at ``--max-quadratic`` teams
+because a 10,000-team round robin is ~50M fixtures.
+
+Usage:
+  python benchmarks/bench_brackets.py                       # compare with baseline.json
+  python benchmarks/bench_brackets.py --update-baseline     # record a new baseline
+  python benchmarks/bench_brackets.py --sizes 8 64 --threshold 2.0 --output results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from app.services.brackets import SUPPORTED_FORMATS, generate_bracket  # noqa: E402
+from app.services.swiss import pair_swiss_round  # noqa: E402
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_SIZES = [8, 64, 512, 2048, 10000]
+QUADRATIC_FORMATS = {"round robin", "double round robin"}
+
+
+def _teams(size: int) -> list[str]:
+    return [f"Team {index:05d}" for index in range(size)]
+
+
+def _swiss_case(size: int) -> Callable[[], object]:
+    """Pair a mid-event Swiss round: random points and one round of history."""
+    rng = random.Random(size)
+    teams = _teams(size)
+    standings = [(team, 3 * rng.randint(0, 4)) for team in teams]
+    previous_pairs = {frozenset(pair) for pair in zip(teams[::2], teams[1::2])}
+    return lambda: pair_swiss_round(standings, previous_pairs)
+
+
+def cases(sizes: list[int], max_quadratic: int) -> dict[str, Callable[[], object]]:
+    selected: dict[str, Callable[[], object]] = {}
+    for format_name in sorted(SUPPORTED_FORMATS):
+        for size in sizes:
+            if format_name in QUADRATIC_FORMATS and size > max_quadratic:
+                continue
+            teams = _teams(size)
+            selected[f"{format_name}:{size}"] = lambda format_name=format_name, teams=teams: generate_bracket(format_name, teams)
+    for size in sizes:
+        selected[f"swiss pairing:{size}"] = _swiss_case(size)
+    return selected
+
+
+def measure(run: Callable[[], object], repeat: int) -> dict[str, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    result = run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def compare(results: dict, baseline: dict, threshold: float, min_seconds: float) -> list[str]:
+    """Return one message per case that regressed beyond ``threshold``."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        if current["seconds"] >= min_seconds and current["seconds"] > previous["seconds"] * threshold:
+            regressions.append(f"{name}: {previous['seconds'] * 1000:.2f} ms -> {current['seconds'] * 1000:.2f} ms")
+        if previous["peak_bytes"] and current["peak_bytes"] > previous["peak_bytes"] * threshold:
+            regressions.append(f"{name}: {previous['peak_bytes']} B -> {current['peak_bytes']} B peak")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0], formatter_class=argparse.RawDescriptionHelpFormatter, epilog=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-quadratic", type=int, default=512)
+    parser.add_argument("--threshold", type=float, default=1.5, help="allowed ratio versus the baseline")
+    parser.add_argument("--min-seconds", type=float, default=0.005, help="ignore timing regressions below this duration")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--output", type=Path, default=None, help="write JSON results here")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'case':<30} {'ms':>10} {'peak MiB':>10}")
+    for name, run in cases(args.sizes, args.max_quadratic).items():
+        results[name] = measure(run, args.repeat)
+        print(f"{name:<30} {results[name]['seconds'] * 1000:>10.2f} {results[name]['peak_bytes'] / 2**20:>10.2f}")
+
+    report = {"python": platform.python_version(), "machine": platform.machine(), "results": results}
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, sort_keys=True))
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text()).get("results", {})
+    regressions = compare(results, baseline, args.threshold, args.min_seconds)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.2f}x baseline:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:.2f}x baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
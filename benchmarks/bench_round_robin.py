@@ -0,0 +1,51 @@
+"""Compare the list-based round robin generator with the column schedule builder.
+
+Usage: python benchmarks/bench_round_robin.py [--sizes 16 256 2000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from app.services.brackets import build_round_robin_schedule, generate_round_robin  # noqa: E402
+
+
+def measure(build, teams: list[str], repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build(teams)
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    result = build(teams)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 256, 2000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'teams':>6} {'fixtures':>9} {'list ms':>9} {'columns ms':>11} {'speedup':>8} {'list MiB':>9} {'columns MiB':>12}")
+    for size in args.sizes:
+        teams = [f"Team {index:05d}" for index in range(size)]
+        list_time, list_peak = measure(generate_round_robin, teams, args.repeat)
+        column_time, column_peak = measure(build_round_robin_schedule, teams, args.repeat)
+        print(
+            f"{size:>6} {size * (size - 1) // 2:>9} {list_time * 1000:>9.2f} {column_time * 1000:>11.2f} "
+            f"{list_time / column_time:>7.1f}x {list_peak / 2**20:>9.2f} {column_peak / 2**20:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Compare the standard response path with orjson and MessagePack on a 2,000-match tournament.
+
+"standard" is how ``list_matches`` used to respond: the cached body is
+validated against ``list[MatchOut]`` item by item and encoded with the
+standard library's JSON encoder. "orjson" and "msgpack" return the same body
+through ``encoded_response``. The cache-fill step compares
+``jsonable_encoder`` with pydantic-core's one-pass dump.
+
+Usage: python benchmarks/bench_serialization.py [--matches 2000] [--repeat 30]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite+aiosqlite://")
+
+from fastapi import FastAPI, Response  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from pydantic_core import to_jsonable_python  # noqa: E402
+
+from app.api.tournaments.tournament_routes import MatchOut  # noqa: E402
+from app.core.encoding import MSGPACK, ContentNegotiationMiddleware, NegotiatedResponse, encoded_response  # noqa: E402
+
+
+def build_matches(count: int) -> list[MatchOut]:
+    teams = 64
+    started = datetime(2026, 5, 1, 18, 0)
+    return [
+        MatchOut(
+            id=index + 1,
+            tournament_id=1,
+            round_name=f"Round {index // (teams // 2) + 1}",
+            team_a=f"Team {index % teams:02d}",
+            team_b=f"Team {(index * 7 + 1) % teams:02d}",
+            team_a_registration_id=index % teams + 1,
+            team_b_registration_id=(index * 7 + 1) % teams + 1,
+            scheduled_at=started + timedelta(minutes=15 * index),
+            team_a_score=index % 3,
+            team_b_score=(index + 1) % 3,
+            winner=f"Team {index % teams:02d}",
+            winner_registration_id=index % teams + 1,
+            status="finished",
+            created_at=started,
+        )
+        for index in range(count)
+    ]
+
+
+def median_of(action, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def build_client(body: list) -> TestClient:
+    app = FastAPI(default_response_class=NegotiatedResponse)
+    app.add_middleware(ContentNegotiationMiddleware)
+
+    @app.get("/standard", response_model=list[MatchOut], response_class=JSONResponse)
+    async def standard():
+        return body
+
+    @app.get("/fast", response_model=list[MatchOut])
+    async def fast(response: Response):
+        return encoded_response(body, response)
+
+    return TestClient(app)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--matches", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    matches = build_matches(args.matches)
+    body = to_jsonable_python(matches)
+    assert body == jsonable_encoder(matches)
+
+    print(f"cache fill, {args.matches} matches")
+    print(f"  jsonable_encoder    {median_of(lambda: jsonable_encoder(matches), args.repeat) * 1000:>8.2f} ms")
+    print(f"  pydantic-core dump  {median_of(lambda: to_jsonable_python(matches), args.repeat) * 1000:>8.2f} ms")
+
+    client = build_client(body)
+    cases = [
+        ("standard", "/standard", {}),
+        ("orjson", "/fast", {}),
+        ("msgpack", "/fast", {"Accept": MSGPACK}),
+    ]
+    print(f"\n{'response':>9} {'median ms':>10} {'bytes':>9} {'speedup':>8}")
+    baseline = None
+    for name, path, headers in cases:
+        size = len(client.get(path, headers=headers).content)
+        seconds = median_of(lambda: client.get(path, headers=headers), args.repeat)
+        baseline = baseline or seconds
+        print(f"{name:>9} {seconds * 1000:>10.2f} {size:>9} {baseline / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
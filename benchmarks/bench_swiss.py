@@ -0,0 +1,53 @@
+"""Time Swiss pairing across field sizes over several simulated rounds.
+
+Usage: python benchmarks/bench_swiss.py [--rounds 8] [--sizes 500 1000 2000 5000 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from app.services.swiss import pair_swiss_round  # noqa: E402
+
+
+def simulate(size: int, rounds: int, seed: int = 7) -> list[float]:
+    rng = random.Random(seed)
+    points = {f"Team {index:05d}": 0 for index in range(size)}
+    previous_pairs: set[frozenset[str]] = set()
+    previous_byes: set[str] = set()
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        pairing = pair_swiss_round(list(points.items()), previous_pairs, previous_byes)
+        timings.append(time.perf_counter() - started)
+        assert pairing.rematches == 0
+        for team_a, team_b in pairing.pairs:
+            previous_pairs.add(frozenset((team_a, team_b)))
+            points[team_a if rng.random() < 0.5 else team_b] += 3
+        if pairing.bye:
+            previous_byes.add(pairing.bye)
+            points[pairing.bye] += 3
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=8)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 2000, 5000, 10000])
+    args = parser.parse_args()
+
+    print(f"{'entrants':>9} {'worst round ms':>15} {'mean round ms':>14} {'us/entrant':>11}")
+    for size in args.sizes:
+        timings = simulate(size, args.rounds)
+        worst = max(timings)
+        print(f"{size:>9} {worst * 1000:>15.2f} {sum(timings) / len(timings) * 1000:>14.2f} {worst / size * 1e6:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
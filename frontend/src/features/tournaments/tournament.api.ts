@@ -100,12 +100,24 @@ export interface MyRegistration {
   start_date?: string | null;
 }
 
+// The listing is keyset-paginated: each page names the next one in the X-Next-Cursor header.
+const TOURNAMENT_PAGE_SIZE = 500;
+
 export const getAllTournaments = async (): Promise<Tournament[]> => {
-  const response = await httpClient.get('/tournaments');
-  if (!Array.isArray(response.data)) {
-    throw new Error('Invalid tournament response');
-  }
-  return response.data as Tournament[];
+  const tournaments: Tournament[] = [];
+  let cursor: string | undefined;
+  do {
+    const response = await httpClient.get('/tournaments', {
+      params: { limit: TOURNAMENT_PAGE_SIZE, ...(cursor ? { cursor } : {}) },
+    });
+    if (!Array.isArray(response.data)) {
+      throw new Error('Invalid tournament response');
+    }
+    tournaments.push(...(response.data as Tournament[]));
+    const next = response.headers['x-next-cursor'];
+    cursor = typeof next === 'string' && next ? next : undefined;
+  } while (cursor);
+  return tournaments;
 };
 
 export const getTournamentById = async (id: number | string): Promise<Tournament | null> => {
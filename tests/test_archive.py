@@ -0,0 +1,165 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, insert, inspect, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.schema import CreateTable
+
+from app.api.notifications.notification_routes import notifications_of
+from app.core.database import Base
+from app.core.schema import reserve_archived_ids
+from app.models.announcement import Announcement
+from app.models.archive import ARCHIVED_TABLES, HOT_TABLES, notifications_archive
+from app.models.match import Match
+from app.models.notification import Notification
+from app.models.tournament import Tournament
+from app.models.tournament_registration import TournamentRegistration
+from app.services.archive import archive_completed_tournaments, find_tournament
+from app.services.search import ensure_search_index
+from app.services.standings import ranked_standings
+
+
+def test_archive_tables_mirror_hot_columns():
+    for hot, archived in zip((HOT_TABLES.tournaments, *HOT_TABLES.children), (ARCHIVED_TABLES.tournaments, *ARCHIVED_TABLES.children)):
+        assert archived.name == f"{hot.name}_archive"
+        assert [column.name for column in archived.columns] == [*(column.name for column in hot.columns), "archived_at"]
+
+
+async def _run(url):
+    engine = create_async_engine(url)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    long_ago = datetime.utcnow() - timedelta(days=400)
+    async with sessions() as session:
+        old = Tournament(name="Old", game="Chess", status="completed", end_date=long_ago)
+        recent = Tournament(name="Recent", game="Chess", status="completed", end_date=datetime.utcnow())
+        live = Tournament(name="Live", game="Chess", status="live", end_date=long_ago)
+        session.add_all([old, recent, live])
+        await session.flush()
+        for tournament in (old, recent, live):
+            session.add_all(
+                [
+                    TournamentRegistration(tournament_id=tournament.id, user_id=1, team_name="A", points=3),
+                    TournamentRegistration(tournament_id=tournament.id, user_id=2, team_name="B"),
+                    Match(tournament_id=tournament.id, team_a="A", team_b="B", winner="A", status="finished"),
+                    Announcement(tournament_id=tournament.id, title="Done", content="Thanks"),
+                ]
+            )
+        session.add_all(
+            [
+                Notification(user_id=1, title="Old read", content="x", read=1, created_at=long_ago),
+                Notification(user_id=1, title="Old unread", content="x", read=0, created_at=long_ago),
+            ]
+        )
+        await session.commit()
+
+    report = await archive_completed_tournaments(sessions, timedelta(days=90), batch_size=1)
+
+    async with sessions() as session:
+        tables, row = await find_tournament(session, old.id)
+        standings = await ranked_standings(session, old.id, tables=tables)
+        hot_tables, _ = await find_tournament(session, recent.id)
+        archived_notifications = (await session.execute(select(func.count()).select_from(notifications_archive))).scalar_one()
+        listed = (await session.execute(notifications_of(1))).all()
+    await engine.dispose()
+    return report, tables, row, standings, hot_tables, archived_notifications, listed
+
+
+def test_archive_moves_old_completed_tournaments_with_their_rows(tmp_path):
+    report, tables, row, standings, hot_tables, archived_notifications, listed = asyncio.run(
+        _run(f"sqlite+aiosqlite:///{tmp_path / 'archive.db'}")
+    )
+
+    assert tables is ARCHIVED_TABLES and row.name == "Old"
+    assert [(item.team_name, item.rank) for item in standings] == [("A", 1), ("B", 2)]
+    assert hot_tables is HOT_TABLES
+    assert report["tables"]["tournaments"] == {"moved": 1, "remaining": 2, "shrunk_percent": 33.3}
+    assert report["tables"]["tournament_registrations"]["moved"] == 2
+    assert report["tables"]["matches"]["remaining"] == 2
+    assert report["tables"]["notifications"] == {"moved": 1, "remaining": 1, "shrunk_percent": 50.0}
+    assert archived_notifications == 1
+    assert sorted((item.title, item.read) for item in listed) == [("Old read", 1), ("Old unread", 0)]
+
+
+async def _archive_twice(url):
+    engine = create_async_engine(url)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    long_ago = datetime.utcnow() - timedelta(days=400)
+
+    async def add_completed(name):
+        async with sessions() as session:
+            tournament = Tournament(name=name, game="Chess", status="completed", end_date=long_ago)
+            session.add(tournament)
+            await session.flush()
+            session.add(TournamentRegistration(tournament_id=tournament.id, user_id=1, team_name=name))
+            await session.commit()
+        return tournament.id
+
+    # The newest rows are archived first, which is exactly when SQLite would hand their ids out again.
+    first = await add_completed("First")
+    await archive_completed_tournaments(sessions, timedelta(days=90), batch_size=10)
+    second = await add_completed("Second")
+    await archive_completed_tournaments(sessions, timedelta(days=90), batch_size=10)
+
+    async with sessions() as session:
+        found = [await find_tournament(session, tournament_id) for tournament_id in (first, second)]
+        teams = (
+            await session.execute(
+                select(ARCHIVED_TABLES.registrations.c.tournament_id, ARCHIVED_TABLES.registrations.c.team_name).order_by(
+                    ARCHIVED_TABLES.registrations.c.id
+                )
+            )
+        ).all()
+    await engine.dispose()
+    return first, second, found, teams
+
+
+def test_archived_ids_are_never_reused(tmp_path):
+    first, second, found, teams = asyncio.run(_archive_twice(f"sqlite+aiosqlite:///{tmp_path / 'twice.db'}"))
+
+    assert first != second
+    assert [(tables, row.name) for tables, row in found] == [(ARCHIVED_TABLES, "First"), (ARCHIVED_TABLES, "Second")]
+    assert [tuple(row) for row in teams] == [(first, "First"), (second, "Second")]
+
+
+async def _upgrade_legacy(url):
+    engine = create_async_engine(url)
+    tournaments = Tournament.__table__
+    async with engine.begin() as conn:
+        # A table as created before AUTOINCREMENT, with its search index already in place.
+        legacy = str(CreateTable(tournaments).compile(dialect=conn.dialect)).replace(" AUTOINCREMENT", "")
+        await conn.execute(text(legacy))
+        await conn.run_sync(Base.metadata.create_all, tables=[tournaments, ARCHIVED_TABLES.tournaments])
+        await conn.run_sync(ensure_search_index)
+        await conn.execute(insert(tournaments), [{"id": 3, "name": "Hot", "game": "Chess"}, {"id": 7, "name": "Archived", "game": "Chess"}])
+        await conn.execute(
+            insert(ARCHIVED_TABLES.tournaments).from_select(
+                [*tournaments.c.keys(), "archived_at"], select(*tournaments.c, func.current_timestamp()).where(tournaments.c.id == 7)
+            )
+        )
+        await conn.execute(delete(tournaments).where(tournaments.c.id == 7))
+
+        await conn.run_sync(reserve_archived_ids)
+        await conn.run_sync(ensure_search_index)
+        new_id = (await conn.execute(insert(tournaments).values(name="Fresh", game="Chess"))).inserted_primary_key[0]
+        ddl = (await conn.execute(text("SELECT sql FROM sqlite_master WHERE name = 'tournaments'"))).scalar_one()
+        names = (await conn.execute(select(tournaments.c.name).order_by(tournaments.c.id))).scalars().all()
+        indexes = {index["name"] for index in await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_indexes("tournaments"))}
+        searched = (await conn.execute(text("SELECT rowid FROM tournaments_fts WHERE tournaments_fts MATCH 'fresh'"))).scalars().all()
+    await engine.dispose()
+    return new_id, ddl, names, indexes, searched
+
+
+def test_upgrade_rebuilds_legacy_sqlite_tables_past_the_archive(tmp_path):
+    new_id, ddl, names, indexes, searched = asyncio.run(_upgrade_legacy(f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}"))
+
+    assert "AUTOINCREMENT" in ddl
+    assert new_id == 8
+    assert names == ["Hot", "Fresh"]
+    assert "ix_tournament_start_created" in indexes
+    assert searched == [8]
@@ -1,4 +1,18 @@
-from app.services.brackets import generate_bracket, generate_double_elimination, generate_round_robin, generate_single_elimination
+from itertools import islice
+
+from app.services.brackets import (
+    NO_TEAM,
+    NO_MATCH,
+    bracket_topology,
+    build_compact_bracket,
+    build_round_robin_schedule,
+    generate_bracket,
+    generate_double_elimination,
+    generate_round_robin,
+    generate_single_elimination,
+    iter_bracket,
+    topology_cache_stats,
+)
 
 
 def test_single_elimination_has_power_of_two_first_round():
@@ -32,3 +46,76 @@ def test_bracket_rejects_invalid_input():
         assert "At least two teams" in str(exc)
     else:
         raise AssertionError("Expected invalid team count to fail")
+
+
+def test_iter_bracket_matches_list_generators():
+    teams = [f"T{index}" for index in range(11)]
+    for format_name in ("Single Elimination", "Double Elimination", "Round Robin", "Swiss"):
+        assert list(iter_bracket(format_name, teams)) == generate_bracket(format_name, teams)
+
+
+def test_iter_bracket_streams_large_round_robin_lazily():
+    teams = [f"T{index}" for index in range(20_000)]
+    first_round = list(islice(iter_bracket("Round Robin", teams), 10_000))
+    assert first_round[-1].round_name == "Round 1"
+    assert len({team for slot in first_round for team in (slot.team_a, slot.team_b)}) == 20_000
+
+
+def test_iter_bracket_validates_eagerly():
+    try:
+        iter_bracket("Ladder", ["A", "B"])
+    except ValueError as exc:
+        assert "Unsupported tournament format" in str(exc)
+    else:
+        raise AssertionError("Expected unsupported format to fail")
+
+
+def test_compact_bracket_round_trips_to_slots():
+    teams = ["A", "B", "C", "D", "E"]
+    compact = build_compact_bracket("Double Elimination", teams)
+    assert compact.to_slots() == generate_double_elimination(teams)
+    assert len(compact) == len(generate_double_elimination(teams))
+    assert compact.slot_b[2] == NO_TEAM
+    assert compact[1:3].to_slots() == generate_double_elimination(teams)[1:3]
+    assert compact[-1].bracket == "grand_final"
+
+
+def test_topology_is_cached_per_format_and_size():
+    before = topology_cache_stats()
+    generate_single_elimination([f"T{index}" for index in range(13)])
+    generate_single_elimination([f"T{index}" for index in range(16)])
+    after = topology_cache_stats()
+    assert after["hits"] + after["misses"] == before["hits"] + before["misses"] + 2
+    assert after["hits"] >= before["hits"] + 1
+    assert bracket_topology("Single Elimination", 16) is bracket_topology("single elimination", 16)
+
+
+def test_topology_routes_winners_to_next_round():
+    topology = bracket_topology("single elimination", 8)
+    assert list(topology.winner_to) == [4, 4, 5, 5, 6, 6, NO_MATCH]
+    assert list(topology.winner_slot) == [0, 1, 0, 1, 0, 1, 0]
+    assert list(topology.bye_matches(5)) == [2, 3]
+
+
+def test_double_elimination_routes_every_winner_and_loser():
+    topology = bracket_topology("double elimination", 8)
+    fed = [(topology.winner_to[index], topology.winner_slot[index]) for index in range(len(topology)) if topology.winner_to[index] != NO_MATCH]
+    fed += [(topology.loser_to[index], topology.loser_slot[index]) for index in range(len(topology)) if topology.loser_to[index] != NO_MATCH]
+    assert len(fed) == len(set(fed)) == 2 * (len(topology) - 4)
+    assert all(topology.loser_to[index] != NO_MATCH for index in range(7))
+    assert topology.winner_to[6] == topology.winner_to[len(topology) - 2] == len(topology) - 1
+
+
+def test_round_robin_schedule_balances_home_and_away():
+    teams = [f"T{index}" for index in range(9)]
+    schedule = build_round_robin_schedule(teams)
+    assert {frozenset((slot.team_a, slot.team_b)) for slot in schedule} == {
+        frozenset((slot.team_a, slot.team_b)) for slot in generate_round_robin(teams)
+    }
+    for team in range(len(teams)):
+        assert abs(schedule.slot_a.count(team) - schedule.slot_b.count(team)) <= 1
+
+    double = build_round_robin_schedule(teams, double_round=True)
+    assert len(double) == 2 * len(schedule)
+    assert double[len(schedule)].team_a == schedule[0].team_b
+    assert double[-1].round_name == "Round 18"
@@ -0,0 +1,112 @@
+import asyncio
+
+from app.core.cache import MemoryBackend, ResponseCache
+
+
+def test_memory_backend_evicts_least_recently_used():
+    async def scenario():
+        backend = MemoryBackend(max_entries=2)
+        await backend.set("a", 1, ttl=60)
+        await backend.set("b", 2, ttl=60)
+        await backend.get("a")
+        await backend.set("c", 3, ttl=60)
+        return [await backend.get(key) for key in ("a", "b", "c")]
+
+    assert asyncio.run(scenario()) == [1, None, 3]
+
+
+def test_memory_backend_expires_entries():
+    async def scenario():
+        backend = MemoryBackend(max_entries=2)
+        await backend.set("a", 1, ttl=0)
+        return await backend.get("a"), len(backend)
+
+    assert asyncio.run(scenario()) == (None, 0)
+
+
+def test_memory_backend_bounds_generations_without_reviving_old_entries():
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return {"version": len(calls)}
+
+    async def scenario():
+        backend = MemoryBackend(max_entries=2)
+        cache = ResponseCache(backend, ttl=60)
+        seen = [await cache.get_or_load("matches", 7, loader)]
+        await cache.invalidate_tournament(7)
+        seen.append(await cache.get_or_load("matches", 7, loader))
+        for tournament_id in range(100, 110):
+            await cache.invalidate_tournament(tournament_id)
+        # Tournament 7's generation was evicted; neither earlier body may come back.
+        seen.append(await cache.get_or_load("matches", 7, loader))
+        return [body["version"] for body in seen], len(backend._generations)
+
+    assert asyncio.run(scenario()) == ([1, 2, 3], 2)
+
+
+def test_invalidation_hides_entries_loaded_before_the_write():
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return {"version": len(calls)}
+
+    async def scenario():
+        cache = ResponseCache(MemoryBackend(max_entries=16), ttl=60)
+        first = await cache.get_or_load("matches", 7, loader)
+        cached = await cache.get_or_load("matches", 7, loader)
+        await cache.invalidate_tournament(7)
+        fresh = await cache.get_or_load("matches", 7, loader)
+        return first, cached, fresh
+
+    assert asyncio.run(scenario()) == ({"version": 1}, {"version": 1}, {"version": 2})
+
+
+def test_versioned_reads_skip_bodies_cached_before_the_write_invalidates():
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return {"version": len(calls)}
+
+    async def scenario():
+        cache = ResponseCache(MemoryBackend(max_entries=16), ttl=60)
+        before = await cache.get_or_load("matches", 7, loader, version=4)
+        # The writer has committed version 5 but not invalidated yet.
+        during = await cache.get_or_load("matches", 7, loader, version=5)
+        await cache.invalidate_tournament(7)
+        after = await cache.get_or_load("matches", 7, loader, version=5)
+        return before, during, after
+
+    assert asyncio.run(scenario()) == ({"version": 1}, {"version": 2}, {"version": 3})
+
+
+def test_user_entries_follow_user_and_tournament_invalidation():
+    calls = []
+
+    async def tournament_ids():
+        return [3, 7]
+
+    async def loader():
+        calls.append(1)
+        return {"version": len(calls)}
+
+    async def scenario():
+        cache = ResponseCache(MemoryBackend(max_entries=16), ttl=60)
+
+        async def load():
+            return await cache.get_or_load_for_user("dashboard", 1, 15, tournament_ids, loader)
+
+        seen = [await load(), await load()]
+        await cache.invalidate_user(1)
+        seen.append(await load())
+        await cache.invalidate_tournament(7)
+        seen.append(await load())
+        await cache.invalidate_tournament(8)
+        await cache.invalidate_user(2)
+        seen.append(await load())
+        return [body["version"] for body in seen]
+
+    assert asyncio.run(scenario()) == [1, 1, 2, 3, 3]
@@ -0,0 +1,90 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import Base
+from app.models.match import Match
+from app.models.notification import Notification
+from app.models.payment import Payment
+from app.models.tournament import Tournament
+from app.models.tournament_registration import TournamentRegistration
+from app.services.dashboard import active_tournament_ids, load_dashboard
+
+NOW = datetime(2026, 5, 1, 18, 0)
+
+
+async def _run(url):
+    engine = create_async_engine(url)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    tables = [Tournament, TournamentRegistration, Match, Notification, Payment]
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[model.__table__ for model in tables])
+
+    async with sessions() as session:
+        later = Tournament(name="Later Cup", game="Chess", status="registration_open", start_date=NOW + timedelta(days=7))
+        sooner = Tournament(name="Sooner Cup", game="Chess", status="live", start_date=NOW)
+        done = Tournament(name="Done Cup", game="Chess", status="completed", start_date=NOW - timedelta(days=7))
+        session.add_all([later, sooner, done])
+        await session.flush()
+        mine = {
+            tournament.id: TournamentRegistration(tournament_id=tournament.id, user_id=1, team_name="Alpha")
+            for tournament in (later, sooner, done)
+        }
+        rival = TournamentRegistration(tournament_id=sooner.id, user_id=2, team_name="Beta")
+        # A second "Alpha" in the same tournament: only registration ids tie matches to users.
+        namesake = TournamentRegistration(tournament_id=later.id, user_id=3, team_name="Alpha")
+        session.add_all([*mine.values(), rival, namesake])
+        await session.flush()
+
+        def match(tournament, side_a, side_b, hours, status="scheduled"):
+            return Match(
+                tournament_id=tournament.id,
+                round_name=f"Round {hours}",
+                team_a=side_a.team_name,
+                team_b=side_b.team_name,
+                team_a_registration_id=side_a.id,
+                team_b_registration_id=side_b.id,
+                scheduled_at=NOW + timedelta(hours=hours),
+                status=status,
+            )
+
+        session.add_all(
+            [
+                match(sooner, rival, mine[sooner.id], 2),
+                match(later, mine[later.id], namesake, 1),
+                match(sooner, mine[sooner.id], rival, 1, status="finished"),
+                match(later, namesake, rival, 0),
+                match(done, mine[done.id], rival, 3),
+                Notification(user_id=1, title="a", content="a"),
+                Notification(user_id=1, title="b", content="b"),
+                Notification(user_id=1, title="c", content="c", read=1),
+                Notification(user_id=2, title="d", content="d"),
+                Payment(tournament_id=later.id, user_id=1, amount=100, order_id="order_1", created_at=NOW),
+                Payment(tournament_id=sooner.id, user_id=1, amount=100, order_id="order_2", created_at=NOW + timedelta(hours=1)),
+                Payment(tournament_id=done.id, user_id=1, amount=100, order_id="order_3", status="paid"),
+                Payment(tournament_id=sooner.id, user_id=2, amount=100, order_id="order_4"),
+            ]
+        )
+        await session.commit()
+
+    async with sessions() as session:
+        active = await active_tournament_ids(session, 1)
+        dashboard = await load_dashboard(session, 1, match_limit=10)
+        limited = await load_dashboard(session, 1, match_limit=1)
+    await engine.dispose()
+    return (later.id, sooner.id), active, dashboard, limited
+
+
+def test_dashboard_reads_only_the_users_active_rows(tmp_path):
+    (later, sooner), active, dashboard, limited = asyncio.run(_run(f"sqlite+aiosqlite:///{tmp_path / 'dashboard.db'}"))
+
+    assert active == sorted([later, sooner])
+    assert [row.tournament_name for row in dashboard.registrations] == ["Sooner Cup", "Later Cup"]
+    assert [(row.tournament_id, row.round_name, row.my_team) for row in dashboard.upcoming_matches] == [
+        (later, "Round 1", "Alpha"),
+        (sooner, "Round 2", "Alpha"),
+    ]
+    assert [row.round_name for row in limited.upcoming_matches] == ["Round 1"]
+    assert dashboard.unread_notifications == 2
+    assert [payment.order_id for payment in dashboard.pending_payments] == ["order_2", "order_1"]
@@ -0,0 +1,60 @@
+from datetime import datetime
+
+import msgpack
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.core.encoding import MSGPACK, ContentNegotiationMiddleware, NegotiatedResponse, encoded_response, prefers_msgpack
+from app.core.etag import make_etag
+
+
+class Item(BaseModel):
+    id: int
+    played_at: datetime
+
+
+def _client():
+    app = FastAPI(default_response_class=NegotiatedResponse)
+    app.add_middleware(ContentNegotiationMiddleware)
+
+    @app.get("/items", response_model=list[Item])
+    async def items(response: Response):
+        response.headers["ETag"] = make_etag(1)
+        return encoded_response([Item(id=1, played_at=datetime(2026, 5, 1, 18, 30))], response)
+
+    @app.get("/default", response_model=Item)
+    async def default():
+        return {"id": 2, "played_at": "2026-05-01T18:30:00"}
+
+    return TestClient(app)
+
+
+def test_accept_header_ranking():
+    assert prefers_msgpack(MSGPACK)
+    assert prefers_msgpack("application/x-msgpack, */*;q=0.8")
+    assert prefers_msgpack("application/msgpack, */*")
+    assert not prefers_msgpack("")
+    assert not prefers_msgpack("*/*")
+    assert not prefers_msgpack("application/json, application/msgpack")
+    assert not prefers_msgpack("application/msgpack;q=0.5, application/json")
+    assert not prefers_msgpack("application/msgpack;q=0")
+
+
+def test_responses_follow_the_negotiated_encoding():
+    client = _client()
+
+    as_json = client.get("/items")
+    assert as_json.headers["content-type"] == "application/json"
+    assert as_json.headers["etag"] == '"1"'
+    assert "Accept" in as_json.headers["vary"]
+    assert orjson.loads(as_json.content) == [{"id": 1, "played_at": "2026-05-01T18:30:00"}]
+
+    as_msgpack = client.get("/items", headers={"Accept": MSGPACK})
+    assert as_msgpack.headers["content-type"] == MSGPACK
+    assert as_msgpack.headers["etag"] == '"1-msgpack"'
+    assert msgpack.unpackb(as_msgpack.content) == orjson.loads(as_json.content)
+
+    validated = client.get("/default", headers={"Accept": MSGPACK})
+    assert msgpack.unpackb(validated.content) == {"id": 2, "played_at": "2026-05-01T18:30:00"}
@@ -0,0 +1,21 @@
+from starlette.requests import Request
+
+from app.core.etag import etag_matches, make_etag
+
+
+def _request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_etag_matches_any_listed_or_weak_tag():
+    etag = make_etag(7, 3, "matches")
+    assert etag == '"7-3-matches"'
+    assert etag_matches(_request('"7-2-matches", W/"7-3-matches"'), etag)
+    assert etag_matches(_request("*"), etag)
+
+
+def test_stale_or_missing_tag_does_not_match():
+    etag = make_etag(7, 3, "matches")
+    assert not etag_matches(_request('"7-2-matches"'), etag)
+    assert not etag_matches(_request(), etag)
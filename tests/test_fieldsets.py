@@ -0,0 +1,29 @@
+import pytest
+
+from app.api.tournaments.tournament_routes import MatchOut, TournamentOut
+from app.core.fieldsets import fieldset_tag, parse_fields, project, sparse
+from app.models.tournament import Tournament
+
+
+def test_fields_follow_model_order_and_reject_unknown_names():
+    assert parse_fields(None, TournamentOut) is None
+    assert parse_fields(" status,id ,name,id", TournamentOut) == ("id", "name", "status")
+    with pytest.raises(ValueError, match="Unknown fields: secret"):
+        parse_fields("id,secret", MatchOut)
+    with pytest.raises(ValueError):
+        parse_fields(" , ", MatchOut)
+
+
+def test_projection_selects_requested_and_required_columns_only():
+    columns = Tournament.__table__.c
+    assert [column.name for column in project(columns, ("name", "is_registered"), "id")] == ["name", "id"]
+    assert len(project(columns, None)) == len(columns)
+
+
+def test_sparse_bodies_and_tags():
+    body = [{"id": 1, "name": "Cup", "status": "live"}]
+    assert sparse(body, ("id", "status")) == [{"id": 1, "status": "live"}]
+    assert sparse(body[0], ("name",)) == {"name": "Cup"}
+    assert sparse(body, None) is body
+    assert fieldset_tag(None) == ()
+    assert fieldset_tag(("id", "name")) == ("id+name",)
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import Base
+from app.models.lobby_result import LobbyResult
+from app.models.tournament_registration import TournamentRegistration
+from app.services.lobbies import GameResult, assign_lobbies, ingest_results, is_lobby_tournament, score_results
+from app.services.stages import MULTI_STAGE_FORMATS
+
+
+def test_assign_lobbies_snake_seeds_into_fewest_lobbies():
+    lobbies = assign_lobbies([f"T{i}" for i in range(1, 8)], lobby_size=3)
+    assert lobbies == [["T1", "T6", "T7"], ["T2", "T5"], ["T3", "T4"]]
+
+
+def test_assign_lobbies_rejects_duplicates():
+    with pytest.raises(ValueError):
+        assign_lobbies(["A", "A", "B"])
+
+
+def test_score_results_combines_placement_and_kills():
+    assert score_results([1, 2, 15, 16, 60], [3, 0, 1, 2, 0]) == [15, 9, 2, 2, 0]
+
+
+def test_lobby_play_follows_the_format_not_the_game():
+    assert is_lobby_tournament("Battle Royale Lobbies")
+    assert not is_lobby_tournament("League + Finals")
+    assert not any(is_lobby_tournament(format_name) for format_name in MULTI_STAGE_FORMATS)
+
+
+async def _reseeded_corrections(url):
+    engine = create_async_engine(url)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[TournamentRegistration.__table__, LobbyResult.__table__])
+
+    async with sessions() as session:
+        session.add_all(
+            TournamentRegistration(tournament_id=1, user_id=index, team_name=team, lobby_number=1 + index % 2)
+            for index, team in enumerate("ABCD")
+        )
+        await ingest_results(session, 1, [GameResult(1, 1, "A", 1, 2), GameResult(1, 1, "C", 2)])
+        # Reseed: A and C no longer share lobby 1.
+        await session.execute(update(TournamentRegistration).where(TournamentRegistration.team_name.in_(["A", "B"])).values(lobby_number=1))
+        await session.execute(update(TournamentRegistration).where(TournamentRegistration.team_name.in_(["C", "D"])).values(lobby_number=2))
+
+        corrected = await ingest_results(session, 1, [GameResult(1, 1, "A", 2), GameResult(1, 1, "C", 1, 1)])
+        with pytest.raises(ValueError, match="new game number"):
+            await ingest_results(session, 1, [GameResult(1, 1, "A", 1), GameResult(1, 1, "B", 2)])
+        await ingest_results(session, 1, [GameResult(1, 2, "A", 1), GameResult(1, 2, "B", 2)])
+        stored = (await session.execute(select(LobbyResult.game_number, LobbyResult.team_name).order_by(LobbyResult.id))).all()
+    await engine.dispose()
+    return corrected, sorted(stored)
+
+
+def test_corrections_survive_a_reseed_and_reused_game_numbers_are_rejected(tmp_path):
+    corrected, stored = asyncio.run(_reseeded_corrections(f"sqlite+aiosqlite:///{tmp_path / 'lobbies.db'}"))
+    assert corrected == {"A": 9, "C": 13}
+    assert stored == [(1, "A"), (1, "C"), (2, "A"), (2, "B")]
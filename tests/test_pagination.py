@@ -0,0 +1,16 @@
+from datetime import datetime
+
+import pytest
+
+from app.core.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trips_datetimes_and_nulls():
+    values = {"start_date": None, "created_at": datetime(2026, 3, 1, 12, 30), "id": 42}
+    assert decode_cursor(encode_cursor(values), ("start_date", "created_at")) == values
+
+
+@pytest.mark.parametrize("cursor", ["garbage", "W10", encode_cursor({"created_at": "yesterday"})])
+def test_invalid_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, ("created_at",))
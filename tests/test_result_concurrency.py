@@ -0,0 +1,96 @@
+import asyncio
+import random
+from collections import Counter
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import Base
+from app.models.match import Match
+from app.models.tournament import Tournament
+from app.models.tournament_registration import TournamentRegistration
+from app.services.counters import record_tournament_change
+from app.services.results import ResultEntry, apply_results
+from app.services.standings import WIN_POINTS, rebuild_tiebreaks
+
+TEAMS = 24
+MATCHES = 240
+CORRECTIONS = 80
+
+
+async def _submit(sessions, tournament_id, entry):
+    # Same protocol as the result routes: take the tournament lock, then apply.
+    async with sessions() as session:
+        await record_tournament_change(session, tournament_id)
+        await apply_results(session, tournament_id, [entry])
+        await session.commit()
+
+
+async def _standings(session, tournament_id):
+    rows = (
+        await session.execute(select(TournamentRegistration).where(TournamentRegistration.tournament_id == tournament_id))
+    ).scalars().all()
+    return {row.id: (row.points, row.buchholz, row.sonneborn_berger) for row in rows}
+
+
+async def _run(url):
+    engine = create_async_engine(url, connect_args={"timeout": 60})
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    tables = [Tournament.__table__, TournamentRegistration.__table__, Match.__table__]
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+
+    rng = random.Random(21)
+    async with sessions() as session:
+        tournament = Tournament(name="Load", game="Chess", max_teams=TEAMS)
+        session.add(tournament)
+        await session.flush()
+        registrations = [
+            TournamentRegistration(tournament_id=tournament.id, user_id=index + 1, team_name=f"Team {index}")
+            for index in range(TEAMS)
+        ]
+        session.add_all(registrations)
+        await session.flush()
+        matches = []
+        for number in range(MATCHES):
+            team_a, team_b = rng.sample(registrations, 2)
+            matches.append(
+                Match(
+                    tournament_id=tournament.id,
+                    round_name=f"Round {number // 12 + 1}",
+                    team_a=team_a.team_name,
+                    team_b=team_b.team_name,
+                    team_a_registration_id=team_a.id,
+                    team_b_registration_id=team_b.id,
+                    status="scheduled",
+                )
+            )
+        session.add_all(matches)
+        await session.commit()
+
+    # Every match once, plus corrections that race the original submission.
+    entries = [ResultEntry(match.id, 2, 1) for match in matches]
+    entries += [ResultEntry(match.id, 0, 3) for match in rng.sample(matches, CORRECTIONS)]
+    rng.shuffle(entries)
+    await asyncio.gather(*(_submit(sessions, tournament.id, entry) for entry in entries))
+
+    async with sessions() as session:
+        finished = (await session.execute(select(Match).where(Match.tournament_id == tournament.id))).scalars().all()
+        stored = await _standings(session, tournament.id)
+        await rebuild_tiebreaks(session, tournament.id)
+        rebuilt = await _standings(session, tournament.id)
+        version = (await session.execute(select(Tournament.version))).scalar_one()
+    await engine.dispose()
+    return finished, stored, rebuilt, version, len(entries)
+
+
+def test_parallel_result_submissions_keep_standings_exact(tmp_path):
+    finished, stored, rebuilt, version, submissions = asyncio.run(_run(f"sqlite+aiosqlite:///{tmp_path / 'results.db'}"))
+
+    assert all(match.status == "finished" and match.winner_registration_id for match in finished)
+    wins = Counter(match.winner_registration_id for match in finished)
+    assert {registration_id: values[0] for registration_id, values in stored.items()} == {
+        registration_id: WIN_POINTS * wins[registration_id] for registration_id in stored
+    }
+    assert stored == rebuilt
+    assert version == submissions
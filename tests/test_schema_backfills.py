@@ -0,0 +1,55 @@
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import Base
+from app.core.schema import run_backfills
+from app.models.match import Match
+from app.models.tournament import Tournament
+from app.models.tournament_registration import TournamentRegistration
+
+
+async def _run(url):
+    engine = create_async_engine(url)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[Tournament.__table__, TournamentRegistration.__table__, Match.__table__])
+
+    # Rows as a start interrupted right after the ALTERs leaves them: no ids, tiebreaks or counters.
+    async with sessions() as session:
+        tournament = Tournament(name="Half upgraded", game="Chess")
+        session.add(tournament)
+        await session.flush()
+        session.add_all(
+            [
+                TournamentRegistration(tournament_id=tournament.id, user_id=1, team_name="A", points=3),
+                TournamentRegistration(tournament_id=tournament.id, user_id=2, team_name="B"),
+                Match(tournament_id=tournament.id, team_a="A", team_b="B", winner="A", status="finished"),
+            ]
+        )
+        await session.commit()
+
+    async def snapshot():
+        async with sessions() as session:
+            await run_backfills(session)
+            await session.commit()
+            match = (await session.execute(select(Match))).scalar_one()
+            registrations = (await session.execute(select(TournamentRegistration).order_by(TournamentRegistration.id))).scalars().all()
+            counted = (await session.execute(select(Tournament))).scalar_one()
+        return (
+            (match.team_a_registration_id, match.team_b_registration_id, match.winner_registration_id),
+            [(row.buchholz, row.sonneborn_berger) for row in registrations],
+            (counted.participants_count, counted.matches_count, counted.version),
+        )
+
+    first, second = await snapshot(), await snapshot()
+    await engine.dispose()
+    return first, second
+
+
+def test_backfills_complete_an_interrupted_upgrade_and_then_do_nothing(tmp_path):
+    first, second = asyncio.run(_run(f"sqlite+aiosqlite:///{tmp_path / 'backfill.db'}"))
+
+    assert first == ((1, 2, 1), [(0, 0), (3, 0)], (2, 1, 1))
+    assert second == first
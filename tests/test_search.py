@@ -0,0 +1,78 @@
+import asyncio
+
+from sqlalchemy import delete, insert, text, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import Base
+from app.models.tournament import Tournament
+from app.services.search import (
+    FTS_TABLE,
+    MAX_TERMS,
+    boolean_mode_query,
+    ensure_search_index,
+    fts5_query,
+    search_terms,
+    search_tournaments,
+)
+
+
+def test_search_terms_drop_index_operators():
+    assert search_terms('Valorant "OR" -cup* (NEAR') == ["valorant", "or", "cup", "near"]
+    assert search_terms("!!!") == []
+
+
+def test_search_terms_are_capped():
+    assert len(search_terms(" ".join(f"w{i}" for i in range(20)))) == MAX_TERMS
+
+
+def test_queries_require_every_term_as_prefix():
+    assert fts5_query(["valo", "mum"]) == '"valo"* "mum"*'
+    assert boolean_mode_query(["valo", "mum"]) == "+valo* +mum*"
+
+
+async def _search_index(url):
+    engine = create_async_engine(url)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[Tournament.__table__])
+        # Rows that predate the index are picked up by the initial rebuild.
+        await conn.execute(insert(Tournament), [{"name": "Winter Open", "game": "Chess", "description": "Valorant side event"}])
+        await conn.run_sync(ensure_search_index)
+        await conn.run_sync(ensure_search_index)
+        triggers = (await conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'trigger' ORDER BY name"))).scalars().all()
+
+    async def names(query):
+        async with sessions() as session:
+            return [row.name for row in await search_tournaments(session, query, limit=10)]
+
+    async with sessions() as session:
+        session.add_all(
+            [
+                Tournament(name="Valorant Masters", game="Valorant", location="Mumbai"),
+                Tournament(name="Rocket Cup", game="Car Soccer", location="Delhi"),
+            ]
+        )
+        await session.commit()
+    seen = {"valo": await names("valo"), "valorant mum": await names("valorant mum")}
+
+    async with sessions() as session:
+        await session.execute(update(Tournament).where(Tournament.name == "Rocket Cup").values(name="Boost Cup"))
+        await session.execute(update(Tournament).values(participants_count=Tournament.participants_count + 1))
+        await session.execute(delete(Tournament).where(Tournament.name == "Winter Open"))
+        await session.commit()
+    seen.update({"rocket": await names("rocket"), "boost": await names("boost"), "valo after delete": await names("valo")})
+    await engine.dispose()
+    return triggers, seen
+
+
+def test_fts5_index_follows_inserts_renames_and_deletes(tmp_path):
+    triggers, seen = asyncio.run(_search_index(f"sqlite+aiosqlite:///{tmp_path / 'search.db'}"))
+
+    assert triggers == [f"{FTS_TABLE}_ad", f"{FTS_TABLE}_ai", f"{FTS_TABLE}_au"]
+    assert seen == {
+        "valo": ["Valorant Masters", "Winter Open"],
+        "valorant mum": ["Valorant Masters"],
+        "rocket": [],
+        "boost": ["Boost Cup"],
+        "valo after delete": ["Valorant Masters"],
+    }
@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+from app.api.ai.recommendation_routes import _simulate
+from app.services.simulation import MAX_SIMULATED_MATCHES, iterations_within_budget, simulate_bracket
+
+
+def test_simulation_is_deterministic_and_normalised():
+    teams = [f"T{index}" for index in range(12)]
+    ratings = [1800 - 25 * index for index in range(12)]
+    first = simulate_bracket("Single Elimination", teams, ratings, iterations=2000, seed=3)
+    assert first == simulate_bracket("Single Elimination", teams, ratings, iterations=2000, seed=3)
+    assert abs(sum(first.champion.values()) - 1.0) < 1e-9
+    assert first.champion["T0"] > first.champion["T11"]
+    assert first.reached["T0"]["Round 1"] == 1.0
+
+
+def test_simulation_gives_byes_a_free_pass_in_double_elimination():
+    result = simulate_bracket("Double Elimination", ["A", "B", "C"], [1500, 1500, 1500], iterations=500)
+    assert result.reached["C"]["Final"] == 1.0
+    assert abs(sum(result.champion.values()) - 1.0) < 1e-9
+
+
+def test_iterations_shrink_with_the_bracket_and_reject_other_formats():
+    assert iterations_within_budget("Single Elimination", 8, 10_000) == 10_000
+    large = iterations_within_budget("Double Elimination", 512, 100_000)
+    assert large * 1022 <= MAX_SIMULATED_MATCHES < (large + 1) * 1022
+    with pytest.raises(ValueError):
+        iterations_within_budget("Swiss", 16, 1_000)
+
+
+def test_simulation_seeds_only_checked_in_teams_like_the_publisher():
+    participants = [
+        {"team": "A", "points": 3, "status": "checked_in"},
+        {"team": "B", "points": 0, "status": "registered"},
+        {"team": "C", "points": 0, "status": "checked_in"},
+    ]
+    simulation = asyncio.run(_simulate({"format": "Single Elimination"}, participants, iterations=200))
+    assert sorted(row["team"] for row in simulation["teams"]) == ["A", "C"]
@@ -0,0 +1,37 @@
+from app.services.stages import build_group_stage, iter_group_stage, playoff_seeding, resting_teams, seed_positions, split_groups
+
+
+def test_split_groups_snakes_seeds():
+    teams = [f"T{i}" for i in range(1, 9)]
+    assert split_groups(teams, 2) == [["T1", "T4", "T5", "T8"], ["T2", "T3", "T6", "T7"]]
+
+
+def test_group_stage_numbers_stay_unique_across_groups():
+    stage = build_group_stage([f"T{i}" for i in range(8)], 2)
+    numbers = [slot.match_number for _, _, schedule in stage for slot in schedule]
+    assert numbers == list(range(1, len(numbers) + 1))
+    assert stage[1][2][0].round_name == "Group B Round 1"
+
+
+def test_league_preview_uses_league_labels():
+    slots = list(iter_group_stage("League + Finals", ["A", "B", "C", "D"]))
+    assert len(slots) == 6
+    assert {slot.round_name for slot in slots} == {"League Round 1", "League Round 2", "League Round 3"}
+
+
+def test_odd_groups_rest_each_team_once_and_even_groups_never():
+    odd, even = build_group_stage([f"T{i}" for i in range(9)], 2)
+    rests = resting_teams(odd[2])
+    assert len(rests) == len(odd[1]) and {team for _, team in rests} == set(odd[1])
+    assert len({label for label, _ in rests}) == len(rests)
+    assert resting_teams(even[2]) == []
+
+
+def test_seed_positions_keep_top_seeds_apart():
+    assert seed_positions(8) == [1, 8, 4, 5, 2, 7, 3, 6]
+
+
+def test_playoff_seeding_crosses_groups():
+    ranked = [["A1", "A2", "A3"], ["B1", "B2", "B3"]]
+    assert playoff_seeding(ranked, 4) == ["A1", "B2", "B1", "A2"]
+    assert playoff_seeding(ranked, 5) == ["A1", "B2", "B1", "A2"]
@@ -0,0 +1,52 @@
+import random
+from types import SimpleNamespace
+
+from app.services.standings import TiebreakLedger
+
+
+def _row(team):
+    return SimpleNamespace(id=team, team_name=team, points=0, buchholz=0, sonneborn_berger=0)
+
+
+def _recompute(rows, results):
+    expected = {team: [0, 0] for team in rows}
+    for winner, loser in results.values():
+        expected[winner][0] += rows[loser].points
+        expected[winner][1] += rows[loser].points
+        expected[loser][0] += rows[winner].points
+    return expected
+
+
+def test_ledger_matches_full_recompute_after_results_and_corrections():
+    rng = random.Random(5)
+    teams = [f"T{index}" for index in range(8)]
+    rows = {team: _row(team) for team in teams}
+    ledger = TiebreakLedger(rows.values(), {})
+    for match_id in range(40):
+        team_a, team_b = rng.sample(teams, 2)
+        ledger.add_result(match_id, team_a, team_b)
+        if rng.random() < 0.3:
+            corrected = rng.randrange(match_id + 1)
+            if corrected in ledger.results:
+                winner, loser = ledger.results[corrected]
+                ledger.remove_result(corrected)
+                ledger.add_result(corrected, loser, winner)
+
+    expected = _recompute(rows, ledger.results)
+    for team, row in rows.items():
+        assert row.points == 3 * sum(1 for winner, _ in ledger.results.values() if winner == team)
+        assert [row.buchholz, row.sonneborn_berger] == expected[team]
+
+
+def test_ledger_ignores_unregistered_opponents():
+    rows = {"A": _row("A")}
+    ledger = TiebreakLedger(rows.values(), {})
+    ledger.add_result(1, "A", "Walk-in")
+    assert (rows["A"].points, rows["A"].buchholz, rows["A"].sonneborn_berger) == (3, 0, 0)
+
+
+def test_ledger_reports_only_changed_rows():
+    rows = {team: _row(team) for team in "ABC"}
+    ledger = TiebreakLedger(rows.values(), {})
+    ledger.add_result(1, "A", "B")
+    assert {row.team_name for row in ledger.changed_rows()} == {"A", "B"}
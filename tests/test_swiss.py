@@ -0,0 +1,106 @@
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import Base
+from app.models.match import Match
+from app.models.tournament import Tournament
+from app.models.tournament_registration import TournamentRegistration
+from app.services.bracket_publisher import BYE, publish_byes, registration_index
+from app.services.results import ResultEntry, apply_results
+from app.services.standings import rebuild_tiebreaks
+from app.services.swiss import pair_swiss_round
+
+
+def test_swiss_pairs_within_score_groups_and_floats_down():
+    pairing = pair_swiss_round([("A", 6), ("B", 6), ("C", 6), ("D", 3), ("E", 3), ("F", 0)])
+    assert pairing.pairs == [("A", "B"), ("C", "D"), ("E", "F")]
+    assert pairing.float_downs == 2
+    assert pairing.bye is None
+
+
+def test_swiss_backtracks_instead_of_leaving_teams_unpaired():
+    previous = {frozenset(("C", "D"))}
+    pairing = pair_swiss_round([("A", 3), ("B", 3), ("C", 0), ("D", 0)], previous)
+    assert pairing.pairs == [("A", "C"), ("B", "D")]
+    assert pairing.rematches == 0
+
+
+def test_swiss_bye_goes_to_lowest_team_without_a_previous_bye():
+    pairing = pair_swiss_round([("A", 3), ("B", 3), ("C", 0), ("D", 0), ("E", 0)], previous_byes={"E"})
+    assert pairing.bye == "D"
+    assert {team for pair in pairing.pairs for team in pair} == {"A", "B", "C", "E"}
+
+
+def test_swiss_is_deterministic_and_pairs_large_fields():
+    standings = [(f"Team {index:04d}", (index * 7) % 5 * 3) for index in range(5001)]
+    first = pair_swiss_round(standings)
+    assert first == pair_swiss_round(list(reversed(standings)))
+    assert len(first.pairs) == 2500 and first.bye is not None
+
+
+def test_swiss_fallback_swaps_rematches_away_when_backtracking_gives_up():
+    # The bottom five have all met each other and the four teams above them, so
+    # chronological backtracking runs out long before it reaches a fresh opponent.
+    teams = [f"Team {index:04d}" for index in range(1000)]
+    bottom, shield = teams[-5:], teams[-9:-5]
+    previous = {frozenset((a, b)) for a in bottom for b in bottom + shield if a != b}
+    pairing = pair_swiss_round([(team, 0) for team in teams], previous, backtrack_limit=2_000)
+    assert len(pairing.pairs) == 500
+    assert pairing.rematches == 0
+
+
+async def _odd_field_rounds(url):
+    engine = create_async_engine(url)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[Tournament.__table__, TournamentRegistration.__table__, Match.__table__])
+
+    async with sessions() as session:
+        tournament = Tournament(name="Odd Swiss", game="Chess", format="Swiss")
+        session.add(tournament)
+        await session.flush()
+        session.add_all(TournamentRegistration(tournament_id=tournament.id, user_id=index, team_name=f"T{index}") for index in range(5))
+        await session.commit()
+
+    byes = []
+    for round_number in (1, 2):
+        async with sessions() as session:
+            registrations = (await session.execute(select(TournamentRegistration).order_by(TournamentRegistration.id))).scalars().all()
+            matches = (await session.execute(select(Match))).scalars().all()
+            name_of = {row.id: row.team_name for row in registrations}
+            pairing = pair_swiss_round(
+                [(row.team_name, row.points) for row in registrations],
+                {frozenset((name_of[m.team_a_registration_id], name_of[m.team_b_registration_id])) for m in matches if m.team_b != BYE},
+                {m.winner for m in matches if m.team_b == BYE},
+            )
+            round_name = f"Swiss Round {round_number}"
+            ids = registration_index(registrations)
+            scheduled = [
+                Match(tournament_id=tournament.id, round_name=round_name, team_a=a, team_b=b, team_a_registration_id=ids[a], team_b_registration_id=ids[b])
+                for a, b in pairing.pairs
+            ]
+            session.add_all(scheduled)
+            await session.flush()
+            await publish_byes(session, tournament.id, [(round_name, pairing.bye)], ids)
+            await apply_results(session, tournament.id, [ResultEntry(match.id, 1, 0) for match in scheduled])
+            await session.commit()
+            byes.append(pairing.bye)
+
+    async with sessions() as session:
+        stored = {row.team_name: (row.points, row.buchholz, row.sonneborn_berger) for row in (await session.execute(select(TournamentRegistration))).scalars()}
+        await rebuild_tiebreaks(session, tournament.id)
+        rebuilt = {row.team_name: (row.points, row.buchholz, row.sonneborn_berger) for row in (await session.execute(select(TournamentRegistration))).scalars()}
+    await engine.dispose()
+    return byes, stored, rebuilt
+
+
+def test_swiss_bye_scores_as_a_win_in_points_and_tiebreaks(tmp_path):
+    byes, stored, rebuilt = asyncio.run(_odd_field_rounds(f"sqlite+aiosqlite:///{tmp_path / 'swiss.db'}"))
+
+    assert len(set(byes)) == 2
+    assert stored == rebuilt
+    assert sum(points for points, _, _ in stored.values()) == 3 * 3 * 2
+    # The round-one bye counted as a win when round two was paired and scored.
+    assert stored[byes[0]][0] >= 3